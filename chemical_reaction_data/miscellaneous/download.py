@@ -17,15 +17,20 @@ class MiscellaneousDataDownloadUtilities:
     def download_2013_kraut_et_al(
             output_directory_path: str,
             download_information_source: str = "official_acs",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the chemical reaction classification dataset by (2013, Kraut, H., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -35,19 +40,26 @@ class MiscellaneousDataDownloadUtilities:
                     "Started the download of the chemical reaction classification dataset by (2013, Kraut, H., et al.)."
                 )
 
-            download_information = MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2013_kraut_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2013_kraut_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -69,15 +81,20 @@ class MiscellaneousDataDownloadUtilities:
     def download_2016_wei_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the organic chemistry textbook questions dataset by (2016, Wei, J.N., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -88,19 +105,26 @@ class MiscellaneousDataDownloadUtilities:
                     "(2016, Wei, J.N., et al.)."
                 )
 
-            download_information = MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2016_wei_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2016_wei_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -122,15 +146,20 @@ class MiscellaneousDataDownloadUtilities:
     def download_2018_avramova_et_al(
             output_directory_path: str,
             download_information_source: str = "official_zenodo",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the RetroTransformDB dataset by (2018, Avramova, S., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -140,19 +169,26 @@ class MiscellaneousDataDownloadUtilities:
                     "Started the download of the RetroTransformDB dataset by (2018, Avramova, S., et al.)."
                 )
 
-            download_information = MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2018_avramova_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_2018_avramova_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -174,15 +210,20 @@ class MiscellaneousDataDownloadUtilities:
     def download_grambow_2022_wen_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the Grambow dataset by (2022, Wen, M., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -192,19 +233,26 @@ class MiscellaneousDataDownloadUtilities:
                     "Started the download of the Grambow dataset by (2022, Wen, M., et al.)."
                 )
 
-            download_information = MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_grambow_2022_wen_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_grambow_2022_wen_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -226,15 +274,20 @@ class MiscellaneousDataDownloadUtilities:
     def download_tpl100_2022_wen_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the TPL100 dataset by (2022, Wen, M., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -244,19 +297,26 @@ class MiscellaneousDataDownloadUtilities:
                     "Started the download of the TPL100 dataset by (2022, Wen, M., et al.)."
                 )
 
-            download_information = MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_tpl100_2022_wen_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                MISCELLANEOUS_DATA_DOWNLOAD_INFORMATION["v_tpl100_2022_wen_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
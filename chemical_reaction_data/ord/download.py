@@ -17,15 +17,20 @@ class OrdDownloadUtilities:
     def download_2021_kearnes_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the ORD by (2021, Kearnes, S.M., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -35,19 +40,26 @@ class OrdDownloadUtilities:
                     "Started the download of the ORD by (2021, Kearnes, S.M., et al.)."
                 )
 
-            download_information = ORD_DOWNLOAD_INFORMATION["v_2021_kearnes_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
+            download_information = DownloadUtilities.resolve_download_information(
+                ORD_DOWNLOAD_INFORMATION["v_2021_kearnes_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
 
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
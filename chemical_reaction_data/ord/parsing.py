@@ -1,18 +1,87 @@
 """ The 'chemical_reaction_data.ord' package 'parsing' module. """
 
-from typing import Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ord_schema import message_helpers
 
+from ord_schema.proto.dataset_pb2 import Dataset
 from ord_schema.proto.reaction_pb2 import Reaction, ReactionIdentifier, ReactionInput, ReactionOutcome
 
 from ..utilities.chemistry.compounds import CompoundFormatConversionUtilities
 from ..utilities.chemistry.reactions import ReactionFormatConversionUtilities
+from ..utilities.columnar import RecordBatchUtilities
+from ..utilities.multiprocessing import MultiprocessingUtilities
 
 
 class OrdParsingUtilities:
     """ The Open Reaction Database (ORD) parsing utilities class. """
 
+    @staticmethod
+    def initialize_worker(
+            worker_state: Dict[str, Any],
+            inchi_conversion_cache_size: int = 65536
+    ) -> None:
+        """
+        Initialize a worker process for the parsing of chemical reaction message Reaction objects. The RDKit logs are
+        only disabled in worker processes, so the serial and the 'threads' backends, which run the initializer in the
+        current process, leave the logging state of the current interpreter unchanged.
+
+        :parameter worker_state: The state of the worker process.
+        :parameter inchi_conversion_cache_size: The maximum number of cached chemical compound InChI string conversions.
+        """
+
+        from multiprocessing import parent_process
+
+        from rdkit.RDLogger import DisableLog
+
+        if parent_process() is not None:
+            DisableLog("rdApp.*")
+
+        worker_state["inchi_to_smiles"] = lru_cache(
+            maxsize=inchi_conversion_cache_size
+        )(OrdParsingUtilities._convert_inchi_to_smiles)
+
+    @staticmethod
+    def _convert_inchi_to_smiles(
+            compound_inchi: str
+    ) -> Optional[str]:
+        """
+        Convert a chemical compound InChI string to a SMILES string.
+
+        :parameter compound_inchi: The chemical compound InChI string.
+
+        :returns: The chemical compound SMILES string.
+        """
+
+        compound_mol = CompoundFormatConversionUtilities.inchi_to_mol(
+            compound_inchi=compound_inchi
+        )
+
+        if compound_mol is None:
+            return None
+
+        return CompoundFormatConversionUtilities.mol_to_smiles(
+            compound_mol=compound_mol
+        )
+
+    @staticmethod
+    def _inchi_to_smiles(
+            compound_inchi: str
+    ) -> Optional[str]:
+        """
+        Convert a chemical compound InChI string to a SMILES string, utilizing the worker process cache if available.
+
+        :parameter compound_inchi: The chemical compound InChI string.
+
+        :returns: The chemical compound SMILES string.
+        """
+
+        return MultiprocessingUtilities.get_worker_state().get(
+            "inchi_to_smiles",
+            OrdParsingUtilities._convert_inchi_to_smiles
+        )(compound_inchi)
+
     @staticmethod
     def _parse_reaction_identifier_messages(
             reaction_identifier_messages: Iterable[ReactionIdentifier]
@@ -129,23 +198,19 @@ class OrdParsingUtilities:
                 if reaction_input_component_identifiers is not None:
                     for reaction_input_component_identifier in reaction_input_component_identifiers:
                         if reaction_input_component_identifier[1] == "INCHI":
-                            compound_mol = CompoundFormatConversionUtilities.inchi_to_mol(
+                            compound_smiles = OrdParsingUtilities._inchi_to_smiles(
                                 compound_inchi=reaction_input_component_identifier[2]
                             )
 
-                            if compound_mol is not None:
+                            if compound_smiles is not None:
                                 if reaction_input_component_identifier[0] in ["CATALYST", "REAGENT", "SOLVENT"]:
                                     reaction_input_spectator_smiles_strings.append(
-                                        CompoundFormatConversionUtilities.mol_to_smiles(
-                                            compound_mol=compound_mol
-                                        )
+                                        compound_smiles
                                     )
 
                                 else:
                                     reaction_input_reactant_smiles_strings.append(
-                                        CompoundFormatConversionUtilities.mol_to_smiles(
-                                            compound_mol=compound_mol
-                                        )
+                                        compound_smiles
                                     )
 
                                 reaction_input_component_identifiers = None
@@ -248,15 +313,13 @@ class OrdParsingUtilities:
                 if reaction_outcome_product_identifiers is not None:
                     for reaction_outcome_product_identifier in reaction_outcome_product_identifiers:
                         if reaction_outcome_product_identifier[0] == "INCHI":
-                            compound_mol = CompoundFormatConversionUtilities.inchi_to_mol(
+                            compound_smiles = OrdParsingUtilities._inchi_to_smiles(
                                 compound_inchi=reaction_outcome_product_identifier[1]
                             )
 
-                            if compound_mol is not None:
+                            if compound_smiles is not None:
                                 reaction_outcome_product_smiles_strings.append(
-                                    CompoundFormatConversionUtilities.mol_to_smiles(
-                                        compound_mol=compound_mol
-                                    )
+                                    compound_smiles
                                 )
 
                                 reaction_outcome_product_identifiers = None
@@ -322,3 +385,47 @@ class OrdParsingUtilities:
             ".".join(spectator_smiles_strings) if len(spectator_smiles_strings) > 0 else "",
             ".".join(product_smiles_strings) if len(product_smiles_strings) > 0 else ""
         ])
+
+    @staticmethod
+    def parse_dataset_file(
+            dataset_file_path: str,
+            return_record_batch: bool = False
+    ) -> Union[List[Tuple[str, str, str, str, str]], Any]:
+        """
+        Parse a chemical reaction dataset message '*.pb.gz' file.
+
+        :parameter dataset_file_path: The path to the chemical reaction dataset message '*.pb.gz' file.
+        :parameter return_record_batch: The indicator whether the parsed chemical reaction dataset message '*.pb.gz'
+                                        file should be returned as a 'pyarrow' library RecordBatch object with the
+                                        'dataset_id', 'dataset_name', 'reaction_id', 'reaction_identifiers_smiles' and
+                                        'reaction_inputs_and_outcomes_smiles' columns.
+
+        :returns: The parsed chemical reaction dataset message '*.pb.gz' file.
+        """
+
+        dataset_message = message_helpers.load_message(
+            filename=dataset_file_path,
+            message_type=Dataset
+        )
+
+        dataset_file_contents = [(
+            dataset_message.dataset_id,
+            dataset_message.name,
+            *OrdParsingUtilities.parse_reaction_message(
+                reaction_message=reaction_message
+            )
+        ) for reaction_message in dataset_message.reactions]
+
+        if return_record_batch:
+            return RecordBatchUtilities.rows_to_record_batch(
+                rows=dataset_file_contents,
+                column_names=[
+                    "dataset_id",
+                    "dataset_name",
+                    "reaction_id",
+                    "reaction_identifiers_smiles",
+                    "reaction_inputs_and_outcomes_smiles"
+                ]
+            )
+
+        return dataset_file_contents
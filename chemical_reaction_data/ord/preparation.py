@@ -1,11 +1,12 @@
 """ The 'chemical_reaction_data.ord' package 'preparation' module. """
 
+from functools import partial
 from logging import getLogger
 from os import walk
 from pandas import DataFrame
-from tqdm import tqdm
+from typing import Any, Callable, Optional, Union
 
-from os.path import abspath, join
+from os.path import abspath, getsize, join
 
 from ord_schema import message_helpers
 
@@ -13,7 +14,10 @@ from ord_schema.proto.dataset_pb2 import Dataset
 
 from .parsing import OrdParsingUtilities
 
-from ..utilities.multiprocessing import MultiprocessingUtilities
+from ..utilities.checkpointing import PreparationCheckpoint
+from ..utilities.columnar import RecordBatchUtilities
+from ..utilities.multiprocessing import MultiprocessingPoolSession, MultiprocessingUtilities
+from ..utilities.progress import ProgressReporter
 
 
 class OrdPreparationUtilities:
@@ -23,7 +27,23 @@ class OrdPreparationUtilities:
     def prepare_2021_kearnes_et_al(
             extracted_data_directory_path: str,
             output_directory_path: str = None,
-            number_of_cpu_cores: int = 1,
+            parse_dataset_files_in_parallel: bool = False,
+            use_record_batches: bool = False,
+            schedule_largest_files_first: bool = False,
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            start_method: str = None,
+            task_timeout: float = None,
+            maximum_number_of_task_retries: int = 0,
+            quarantine_file_path: str = None,
+            memory_budget: int = None,
+            memory_expansion_factor: float = 10.0,
+            checkpoint_directory_path: str = None,
+            resume: bool = False,
+            pool_session: MultiprocessingPoolSession = None,
+            instrumentation_report_file_path: str = None,
+            progress_sink: str = "auto",
+            progress_callback: Callable[[int, Optional[int]], Any] = None,
             enable_logger: bool = False
     ) -> DataFrame:
         """
@@ -31,7 +51,53 @@ class OrdPreparationUtilities:
 
         :parameter extracted_data_directory_path: The path to the directory where the extracted data is stored.
         :parameter output_directory_path: The path to the directory where the prepared data should be stored.
-        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter parse_dataset_files_in_parallel: The indicator whether the '*.pb.gz' files should be parsed in
+                                                    parallel, one file per task, instead of parsing the chemical
+                                                    reaction messages of each file in parallel.
+        :parameter use_record_batches: The indicator whether the parsed '*.pb.gz' files should be returned from the
+                                       worker processes as 'pyarrow' library RecordBatch objects, which are
+                                       concatenated without re-materializing Python objects. It applies only if the
+                                       '*.pb.gz' files are parsed in parallel.
+        :parameter schedule_largest_files_first: The indicator whether the '*.pb.gz' files should be dispatched to the
+                                                 worker processes from the largest to the smallest, so that a large
+                                                 file does not start last. It applies only if the '*.pb.gz' files are
+                                                 parsed in parallel.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the parsing tasks: 'processes', 'threads' or
+                            'serial'.
+        :parameter start_method: The method that should be utilized to start the worker processes: 'fork', 'spawn',
+                                 'forkserver' or None for the default method of the platform.
+        :parameter task_timeout: The maximum number of seconds the parsing of a single chemical reaction message or,
+                                 if the '*.pb.gz' files are parsed in parallel, a single '*.pb.gz' file is allowed to
+                                 take. If this or the quarantine file path is specified, the chemical reaction
+                                 messages are parsed in the fault-tolerant mode.
+        :parameter maximum_number_of_task_retries: The maximum number of retries of a chemical reaction message that
+                                                   failed to be parsed in the fault-tolerant mode.
+        :parameter quarantine_file_path: The path to the file where the chemical reaction messages that repeatedly
+                                         failed to be parsed should be stored. If None, the last exception of a
+                                         chemical reaction message or a '*.pb.gz' file that repeatedly failed to be
+                                         parsed is raised.
+        :parameter memory_budget: The maximum number of bytes the worker processes are allowed to occupy while parsing
+                                  the '*.pb.gz' files in parallel. A file is dispatched only if its estimated memory
+                                  footprint fits within the budget next to the pending files or, if larger, the
+                                  measured resident set size of the worker processes. If None, the files are not
+                                  throttled by their memory footprint.
+        :parameter memory_expansion_factor: The factor by which the size of a '*.pb.gz' file is multiplied to estimate
+                                            its memory footprint while it is being parsed.
+        :parameter checkpoint_directory_path: The path to the directory where the parsed '*.pb.gz' files should be
+                                              checkpointed, one shard file per '*.pb.gz' file next to a manifest file.
+                                              If None, the parsed '*.pb.gz' files are not checkpointed.
+        :parameter resume: The indicator whether the existing checkpoint should be resumed by skipping the already
+                           parsed '*.pb.gz' files. If False, the existing checkpoint is discarded.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the preparation.
+        :parameter instrumentation_report_file_path: The path to the JSON Lines file to which the instrumentation report
+                                                     of each parsing run should be appended. If None, the parsing
+                                                     tasks are not instrumented.
+        :parameter progress_sink: The indicator of the sink of the progress reports: 'tqdm', 'log', 'callback', 'none'
+                                  or 'auto'.
+        :parameter progress_callback: The procedure that receives the number of completed and total items. It is
+                                      required for the 'callback' progress sink.
         :parameter enable_logger: The indicator whether the logger should be enabled.
 
         :returns: The prepared ORD by (2021, Kearnes, S.M., et al.).
@@ -43,49 +109,226 @@ class OrdPreparationUtilities:
                     "Started the preparation of the ORD by (2021, Kearnes, S.M., et al.)."
                 )
 
-            prepared_data_rows = list()
-
-            for directory_path, _, directory_file_names in walk(extracted_data_directory_path):
-                if any(directory_file_name.endswith(".pb.gz") for directory_file_name in directory_file_names):
-                    for directory_file_name in tqdm(
-                        iterable=directory_file_names,
-                        total=len(directory_file_names),
-                        ascii=True,
-                        ncols=150,
-                        desc="Parsing '{0}' directory '*.pb.gz' files".format(directory_path.split("/")[-1])
-                    ):
-                        dataset_message = message_helpers.load_message(
-                            filename=join(directory_path, directory_file_name),
-                            message_type=Dataset
+            if parse_dataset_files_in_parallel and use_record_batches:
+                RecordBatchUtilities._import_pyarrow()
+
+            prepared_data_rows, prepared_data_record_batches, dataset_files = list(), list(), list()
+
+            preparation_checkpoint = PreparationCheckpoint(
+                checkpoint_directory_path=checkpoint_directory_path,
+                parameters={
+                    "preparation": "ord_2021_kearnes_et_al",
+                    "shard_format": "record_batch"
+                    if parse_dataset_files_in_parallel and use_record_batches else "rows",
+                },
+                resume=resume,
+                enable_logger=enable_logger
+            ) if checkpoint_directory_path is not None else None
+
+            with MultiprocessingUtilities.open_pool_session(
+                number_of_cpu_cores=number_of_cpu_cores,
+                backend=backend,
+                initializer=OrdParsingUtilities.initialize_worker,
+                start_method=start_method,
+                preloaded_module_names=MultiprocessingUtilities.CHEMISTRY_MODULE_NAMES + (
+                    "chemical_reaction_data.ord.parsing",
+                ),
+                pool_session=pool_session,
+                enable_logger=enable_logger
+            ) as pool_session:
+                for directory_path, _, directory_file_names in walk(extracted_data_directory_path):
+                    if parse_dataset_files_in_parallel:
+                        dataset_files.extend((
+                            directory_path.split("/")[-1],
+                            join(directory_path, directory_file_name)
+                        ) for directory_file_name in sorted(directory_file_names)
+                            if directory_file_name.endswith(".pb.gz"))
+
+                    elif any(directory_file_name.endswith(".pb.gz") for directory_file_name in directory_file_names):
+                        with ProgressReporter(
+                            total=len(directory_file_names),
+                            description="Parsing '{0}' directory '*.pb.gz' files".format(directory_path.split("/")[-1]),
+                            sink=progress_sink,
+                            callback=progress_callback
+                        ) as progress_reporter:
+                            for directory_file_name in progress_reporter.track(directory_file_names):
+                                if preparation_checkpoint is not None and preparation_checkpoint.is_completed(
+                                    input_file_path=join(directory_path, directory_file_name)
+                                ):
+                                    prepared_data_rows.extend([(
+                                        directory_path.split("/")[-1],
+                                        *dataset_file_content_row
+                                    ) for dataset_file_content_row in preparation_checkpoint.read_shard(
+                                        input_file_path=join(directory_path, directory_file_name)
+                                    )])
+
+                                    continue
+
+                                dataset_message = message_helpers.load_message(
+                                    filename=join(directory_path, directory_file_name),
+                                    message_type=Dataset
+                                )
+
+                                if task_timeout is not None or quarantine_file_path is not None:
+                                    dataset_message_contents = MultiprocessingUtilities.run_with_fault_tolerance(
+                                        processing_procedure=OrdParsingUtilities.parse_reaction_message,
+                                        primary_input_arguments=dataset_message.reactions,
+                                        task_timeout=task_timeout,
+                                        maximum_number_of_retries=maximum_number_of_task_retries,
+                                        quarantine_file_path=quarantine_file_path,
+                                        raise_failed_tasks=quarantine_file_path is None,
+                                        pool_session=pool_session,
+                                        instrumentation_report_file_path=instrumentation_report_file_path,
+                                        enable_logger=enable_logger
+                                    )
+
+                                else:
+                                    dataset_message_contents = MultiprocessingUtilities.run(
+                                        processing_procedure=OrdParsingUtilities.parse_reaction_message,
+                                        primary_input_arguments=dataset_message.reactions,
+                                        pool_session=pool_session,
+                                        instrumentation_report_file_path=instrumentation_report_file_path,
+                                        enable_logger=enable_logger
+                                    )
+
+                                dataset_file_content = [(
+                                    dataset_message.dataset_id,
+                                    dataset_message.name,
+                                    dataset_message_content[0],
+                                    dataset_message_content[1],
+                                    dataset_message_content[2]
+                                ) for dataset_message_content in dataset_message_contents
+                                    if dataset_message_content is not None]
+
+                                if preparation_checkpoint is not None:
+                                    preparation_checkpoint.write_shard(
+                                        input_file_path=join(directory_path, directory_file_name),
+                                        shard=dataset_file_content
+                                    )
+
+                                prepared_data_rows.extend([(
+                                    directory_path.split("/")[-1],
+                                    *dataset_file_content_row
+                                ) for dataset_file_content_row in dataset_file_content])
+
+                        if preparation_checkpoint is not None:
+                            dataset_files.extend((
+                                directory_path.split("/")[-1],
+                                join(directory_path, directory_file_name)
+                            ) for directory_file_name in directory_file_names)
+
+                            preparation_checkpoint.update_manifest(
+                                input_file_paths=[dataset_file[1] for dataset_file in dataset_files]
+                            )
+
+                if parse_dataset_files_in_parallel and len(dataset_files) > 0:
+                    dataset_file_parsing_procedure = partial(
+                        OrdParsingUtilities.parse_dataset_file,
+                        return_record_batch=use_record_batches
+                    )
+
+                    dataset_file_paths = [dataset_file[1] for dataset_file in dataset_files]
+
+                    if preparation_checkpoint is not None:
+                        preparation_checkpoint.update_manifest(
+                            input_file_paths=dataset_file_paths
+                        )
+
+                        dataset_file_parsing_procedure = partial(
+                            preparation_checkpoint.run_task,
+                            dataset_file_parsing_procedure
                         )
 
-                        dataset_message_contents = MultiprocessingUtilities.run(
-                            processing_procedure=OrdParsingUtilities.parse_reaction_message,
-                            primary_input_arguments=dataset_message.reactions,
-                            number_of_cpu_cores=number_of_cpu_cores,
+                        dataset_file_paths = [
+                            dataset_file_path for dataset_file_path in dataset_file_paths
+                            if not preparation_checkpoint.is_completed(dataset_file_path)
+                        ]
+
+                    if task_timeout is not None or quarantine_file_path is not None or memory_budget is not None:
+                        dataset_file_contents = MultiprocessingUtilities.run_with_fault_tolerance(
+                            processing_procedure=dataset_file_parsing_procedure,
+                            primary_input_arguments=dataset_file_paths,
+                            task_timeout=task_timeout,
+                            maximum_number_of_retries=maximum_number_of_task_retries,
+                            quarantine_file_path=quarantine_file_path,
+                            raise_failed_tasks=quarantine_file_path is None,
+                            task_size_procedure=getsize if schedule_largest_files_first else None,
+                            memory_budget=memory_budget,
+                            task_memory_procedure=lambda dataset_file_path: getsize(
+                                dataset_file_path
+                            ) * memory_expansion_factor,
+                            description_message="Parsing the '*.pb.gz' files",
+                            progress_sink=progress_sink,
+                            progress_callback=progress_callback,
+                            pool_session=pool_session,
+                            instrumentation_report_file_path=instrumentation_report_file_path,
                             enable_logger=enable_logger
                         )
 
+                    else:
+                        dataset_file_contents = MultiprocessingUtilities.run_with_progress_bar(
+                            processing_procedure=dataset_file_parsing_procedure,
+                            primary_input_argument=dataset_file_paths,
+                            number_of_primary_input_arguments=len(dataset_file_paths),
+                            description_message="Parsing the '*.pb.gz' files",
+                            progress_sink=progress_sink,
+                            progress_callback=progress_callback,
+                            task_size_procedure=getsize if schedule_largest_files_first else None,
+                            pool_session=pool_session,
+                            instrumentation_report_file_path=instrumentation_report_file_path,
+                            enable_logger=enable_logger
+                        )
+
+                    if preparation_checkpoint is not None:
+                        preparation_checkpoint.update_manifest(
+                            input_file_paths=[dataset_file[1] for dataset_file in dataset_files]
+                        )
+
+                        dataset_file_contents = (
+                            preparation_checkpoint.read_shard(
+                                input_file_path=dataset_file[1]
+                            ) for dataset_file in dataset_files
+                        )
+
+                    if use_record_batches:
+                        prepared_data_record_batches.extend(({
+                            "dataset_directory_name": dataset_file[0]
+                        }, dataset_file_content) for dataset_file, dataset_file_content in zip(
+                            dataset_files,
+                            dataset_file_contents
+                        ) if dataset_file_content is not None)
+
+                    else:
                         prepared_data_rows.extend([(
-                            directory_path.split("/")[-1],
-                            dataset_message.dataset_id,
-                            dataset_message.name,
-                            dataset_message_content[0],
-                            dataset_message_content[1],
-                            dataset_message_content[2]
-                        ) for dataset_message_content in dataset_message_contents])
-
-            prepared_data = DataFrame(
-                data=prepared_data_rows,
-                columns=[
-                    "dataset_directory_name",
-                    "dataset_id",
-                    "dataset_name",
-                    "reaction_id",
-                    "reaction_identifiers_smiles",
-                    "reaction_inputs_and_outcomes_smiles"
-                ]
-            ).dropna(
+                            dataset_file[0],
+                            *dataset_file_content_row
+                        ) for dataset_file, dataset_file_content in zip(dataset_files, dataset_file_contents)
+                            if dataset_file_content is not None
+                            for dataset_file_content_row in dataset_file_content])
+
+            prepared_data_column_names = [
+                "dataset_directory_name",
+                "dataset_id",
+                "dataset_name",
+                "reaction_id",
+                "reaction_identifiers_smiles",
+                "reaction_inputs_and_outcomes_smiles"
+            ]
+
+            if parse_dataset_files_in_parallel and use_record_batches:
+                prepared_data = RecordBatchUtilities.record_batches_to_data_frame(
+                    record_batches=prepared_data_record_batches,
+                    column_names=prepared_data_column_names,
+                    enable_logger=enable_logger
+                )
+
+            else:
+                prepared_data = DataFrame(
+                    data=prepared_data_rows,
+                    columns=prepared_data_column_names
+                )
+
+            prepared_data = prepared_data.dropna(
                 subset=[
                     "reaction_identifiers_smiles",
                     "reaction_inputs_and_outcomes_smiles"
@@ -17,15 +17,20 @@ class RetroRulesDatabaseDownloadUtilities:
     def download_rr01_rp2_hs_2018_duigou_et_al(
             output_directory_path: str,
             download_information_source: str = "official_zenodo",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the RetroRules (rr01.rp2.hs) database by (2018, Duigou, T., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -35,19 +40,26 @@ class RetroRulesDatabaseDownloadUtilities:
                     "Started the download of the RetroRules (rr01.rp2.hs) database by (2018, Duigou, T., et al.)."
                 )
 
-            download_information = RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr01_rp2_hs_2018_duigou_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr01_rp2_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -69,15 +81,20 @@ class RetroRulesDatabaseDownloadUtilities:
     def download_rr02_rp2_hs_2018_duigou_et_al(
             output_directory_path: str,
             download_information_source: str = "official_zenodo",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the RetroRules (rr02.rp2.hs) database by (2018, Duigou, T., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -87,19 +104,26 @@ class RetroRulesDatabaseDownloadUtilities:
                     "Started the download of the RetroRules (rr02.rp2.hs) database by (2018, Duigou, T., et al.)."
                 )
 
-            download_information = RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp2_hs_2018_duigou_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp2_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -121,15 +145,20 @@ class RetroRulesDatabaseDownloadUtilities:
     def download_rr02_rp3_hs_2018_duigou_et_al(
             output_directory_path: str,
             download_information_source: str = "official_zenodo",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the RetroRules (rr02.rp3.hs) database by (2018, Duigou, T., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -139,19 +168,26 @@ class RetroRulesDatabaseDownloadUtilities:
                     "Started the download of the RetroRules (rr02.rp3.hs) database by (2018, Duigou, T., et al.)."
                 )
 
-            download_information = RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_hs_2018_duigou_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -173,15 +209,20 @@ class RetroRulesDatabaseDownloadUtilities:
     def download_rr02_rp3_nohs_2018_duigou_et_al(
             output_directory_path: str,
             download_information_source: str = "official_zenodo",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the RetroRules (rr02.rp3.nohs) database by (2018, Duigou, T., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -191,24 +232,154 @@ class RetroRulesDatabaseDownloadUtilities:
                     "Started the download of the RetroRules (rr02.rp3.nohs) database by (2018, Duigou, T., et al.)."
                 )
 
-            download_information = RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_nohs_2018_duigou_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_nohs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Completed the download of the RetroRules (rr02.rp3.nohs) database by (2018, Duigou, T., et al.). "
+                    "The downloaded data is stored at: '{0}'.".format(
+                        abspath(output_directory_path)
+                    )
+                )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_nohs_2018_duigou_et_al".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_and_extract_rr01_rp2_hs_2018_duigou_et_al(
+            output_directory_path: str,
+            download_information_source: str = "official_zenodo",
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        Download and extract the RetroRules (rr01.rp2.hs) database by (2018, Duigou, T., et al.) in a single
+        pass, without storing the downloaded archive file.
+
+        :parameter output_directory_path: The path to the directory where the extracted data should be stored.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        try:
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Started the download and extraction of the RetroRules (rr01.rp2.hs) database by "
+                    "(2018, Duigou, T., et al.)."
+                )
+
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr01_rp2_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            for url_file_path in download_information["url_file_paths"]:
+                url_file_integrity = download_information.get("url_file_integrity", dict()).get(url_file_path, dict())
 
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
+                DownloadUtilities.download_and_extract_tar_gz_archive_with_progress_bar(
                     url=download_information["base_url"] + url_file_path,
                     output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
+                    archive_file_content_base_paths=[
+                        "retrorules_rr01_rp2/retrorules_rr01_rp2_flat_all.csv"
+                    ],
+                    expected_size=url_file_integrity.get("size"),
+                    expected_hash=url_file_integrity.get("hash")
+                )
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Completed the download and extraction of the RetroRules (rr01.rp2.hs) database by "
+                    "(2018, Duigou, T., et al.). The extracted data is stored at: '{0}'.".format(
+                        abspath(output_directory_path)
                     )
                 )
 
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RetroRulesDatabaseDownloadUtilities."
+                    "download_and_extract_rr01_rp2_hs_2018_duigou_et_al".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_and_extract_rr02_rp2_hs_2018_duigou_et_al(
+            output_directory_path: str,
+            download_information_source: str = "official_zenodo",
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        Download and extract the RetroRules (rr02.rp2.hs) database by (2018, Duigou, T., et al.) in a single
+        pass, without storing the downloaded archive file.
+
+        :parameter output_directory_path: The path to the directory where the extracted data should be stored.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        try:
             if enable_logger:
                 getLogger(__name__).info(
-                    "Completed the download of the RetroRules (rr02.rp3.nohs) database by (2018, Duigou, T., et al.). "
-                    "The downloaded data is stored at: '{0}'.".format(
+                    "Started the download and extraction of the RetroRules (rr02.rp2.hs) database by "
+                    "(2018, Duigou, T., et al.)."
+                )
+
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp2_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            for url_file_path in download_information["url_file_paths"]:
+                url_file_integrity = download_information.get("url_file_integrity", dict()).get(url_file_path, dict())
+
+                DownloadUtilities.download_and_extract_tar_gz_archive_with_progress_bar(
+                    url=download_information["base_url"] + url_file_path,
+                    output_directory_path=output_directory_path,
+                    archive_file_content_base_paths=[
+                        "retrorules_rr02_rp2_hs/retrorules_rr02_rp2_flat_all.csv"
+                    ],
+                    expected_size=url_file_integrity.get("size"),
+                    expected_hash=url_file_integrity.get("hash")
+                )
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Completed the download and extraction of the RetroRules (rr02.rp2.hs) database by "
+                    "(2018, Duigou, T., et al.). The extracted data is stored at: '{0}'.".format(
                         abspath(output_directory_path)
                     )
                 )
@@ -216,7 +387,132 @@ class RetroRulesDatabaseDownloadUtilities:
         except Exception as exception_handle:
             if enable_logger:
                 getLogger(
-                    "{0}.RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_nohs_2018_duigou_et_al".format(__name__)
+                    "{0}.RetroRulesDatabaseDownloadUtilities."
+                    "download_and_extract_rr02_rp2_hs_2018_duigou_et_al".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_and_extract_rr02_rp3_hs_2018_duigou_et_al(
+            output_directory_path: str,
+            download_information_source: str = "official_zenodo",
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        Download and extract the RetroRules (rr02.rp3.hs) database by (2018, Duigou, T., et al.) in a single
+        pass, without storing the downloaded archive file.
+
+        :parameter output_directory_path: The path to the directory where the extracted data should be stored.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        try:
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Started the download and extraction of the RetroRules (rr02.rp3.hs) database by "
+                    "(2018, Duigou, T., et al.)."
+                )
+
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_hs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            for url_file_path in download_information["url_file_paths"]:
+                url_file_integrity = download_information.get("url_file_integrity", dict()).get(url_file_path, dict())
+
+                DownloadUtilities.download_and_extract_tar_gz_archive_with_progress_bar(
+                    url=download_information["base_url"] + url_file_path,
+                    output_directory_path=output_directory_path,
+                    archive_file_content_base_paths=[
+                        "retrorules_rr02_rp3_hs/retrorules_rr02_flat_all.tsv"
+                    ],
+                    expected_size=url_file_integrity.get("size"),
+                    expected_hash=url_file_integrity.get("hash")
+                )
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Completed the download and extraction of the RetroRules (rr02.rp3.hs) database by "
+                    "(2018, Duigou, T., et al.). The extracted data is stored at: '{0}'.".format(
+                        abspath(output_directory_path)
+                    )
+                )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RetroRulesDatabaseDownloadUtilities."
+                    "download_and_extract_rr02_rp3_hs_2018_duigou_et_al".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_and_extract_rr02_rp3_nohs_2018_duigou_et_al(
+            output_directory_path: str,
+            download_information_source: str = "official_zenodo",
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        Download and extract the RetroRules (rr02.rp3.nohs) database by (2018, Duigou, T., et al.) in a single
+        pass, without storing the downloaded archive file.
+
+        :parameter output_directory_path: The path to the directory where the extracted data should be stored.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        try:
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Started the download and extraction of the RetroRules (rr02.rp3.nohs) database by "
+                    "(2018, Duigou, T., et al.)."
+                )
+
+            download_information = DownloadUtilities.resolve_download_information(
+                RETRO_RULES_DATABASE_DOWNLOAD_INFORMATION["v_rr02_rp3_nohs_2018_duigou_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            for url_file_path in download_information["url_file_paths"]:
+                url_file_integrity = download_information.get("url_file_integrity", dict()).get(url_file_path, dict())
+
+                DownloadUtilities.download_and_extract_tar_gz_archive_with_progress_bar(
+                    url=download_information["base_url"] + url_file_path,
+                    output_directory_path=output_directory_path,
+                    archive_file_content_base_paths=[
+                        "retrorules_rr02_rp3_nohs/retrorules_rr02_flat_all.tsv"
+                    ],
+                    expected_size=url_file_integrity.get("size"),
+                    expected_hash=url_file_integrity.get("hash")
+                )
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Completed the download and extraction of the RetroRules (rr02.rp3.nohs) database by "
+                    "(2018, Duigou, T., et al.). The extracted data is stored at: '{0}'.".format(
+                        abspath(output_directory_path)
+                    )
+                )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RetroRulesDatabaseDownloadUtilities."
+                    "download_and_extract_rr02_rp3_nohs_2018_duigou_et_al".format(__name__)
                 ).exception(exception_handle)
 
             raise
@@ -17,15 +17,20 @@ class UsptoDatasetDownloadUtilities:
     def download_1976_2013_2014_lowe(
             output_directory_path: str,
             download_information_source: str = "official_figshare",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO (1976-2013) dataset by (2014, Lowe, D.M.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -35,19 +40,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO (1976-2013) dataset by (2014, Lowe, D.M.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_1976_2013_2014_lowe"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_1976_2013_2014_lowe"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -69,15 +81,20 @@ class UsptoDatasetDownloadUtilities:
     def download_50k_2016_schneider_et_al(
             output_directory_path: str,
             download_information_source: str = "official_acs",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO-50k dataset by (2016, Schneider, N., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -87,19 +104,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO-50k dataset by (2016, Schneider, N., et al.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_50k_2016_schneider_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_50k_2016_schneider_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -121,15 +145,20 @@ class UsptoDatasetDownloadUtilities:
     def download_15k_2017_coley_et_al(
             output_directory_path: str,
             download_information_source: str = "unofficial_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO-15k dataset by (2017, Coley, C.W., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -139,19 +168,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO-15k dataset by (2017, Coley, C.W., et al.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_15k_2017_coley_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_15k_2017_coley_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -173,15 +209,20 @@ class UsptoDatasetDownloadUtilities:
     def download_1976_2016_2017_lowe(
             output_directory_path: str,
             download_information_source: str = "official_figshare",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO (1976-2016) dataset by (2017, Lowe, D.M.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -191,19 +232,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO (1976-2016) dataset by (2017, Lowe, D.M.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_1976_2016_2017_lowe"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_1976_2016_2017_lowe"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -225,15 +273,20 @@ class UsptoDatasetDownloadUtilities:
     def download_50k_2017_coley_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO-50k dataset by (2017, Coley, C.W., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -243,19 +296,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO-50k dataset by (2017, Coley, C.W., et al.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_50k_2017_coley_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_50k_2017_coley_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
@@ -277,15 +337,20 @@ class UsptoDatasetDownloadUtilities:
     def download_mit_2017_jin_et_al(
             output_directory_path: str,
             download_information_source: str = "official_github",
-            custom_download_information: Dict[str, Union[str, List[str]]] = None,
+            custom_download_information: Dict[str, Union[str, List[str], Dict[str, Dict[str, Union[int, str]]]]] = None,
+            maximum_number_of_concurrent_downloads: int = 4,
             enable_logger: bool = False
     ) -> None:
         """
         Download the USPTO-MIT dataset by (2017, Jin, W., et al.).
 
         :parameter output_directory_path: The path to the directory where the downloaded data should be stored.
-        :parameter download_information_source: The indicator of the download information source.
-        :parameter custom_download_information: The custom download information.
+        :parameter download_information_source: The indicator of the download information source, whose base URL
+                                                string is redirected to the configured download mirror, if any.
+        :parameter custom_download_information: The custom download information, which can include the expected
+                                                'size' and 'hash' of the URL file paths as 'url_file_integrity'.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of files that should be downloaded at
+                                                           once.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -295,19 +360,26 @@ class UsptoDatasetDownloadUtilities:
                     "Started the download of the USPTO-MIT dataset by (2017, Jin, W., et al.)."
                 )
 
-            download_information = USPTO_DATASET_DOWNLOAD_INFORMATION["v_mit_2017_jin_et_al"][
-                download_information_source
-            ] if custom_download_information is None else custom_download_information
-
-            for url_file_path_index, url_file_path in enumerate(download_information["url_file_paths"]):
-                DownloadUtilities.download_with_progress_bar(
-                    url=download_information["base_url"] + url_file_path,
-                    output_directory_path=output_directory_path,
-                    description_message="Downloading file {0}/{1}".format(
-                        url_file_path_index + 1,
-                        len(download_information["url_file_paths"])
-                    )
-                )
+            download_information = DownloadUtilities.resolve_download_information(
+                USPTO_DATASET_DOWNLOAD_INFORMATION["v_mit_2017_jin_et_al"][
+                    download_information_source
+                ]
+            ) if custom_download_information is None else custom_download_information
+
+            DownloadUtilities.download_multiple_with_progress_bar(
+                urls=[
+                    download_information["base_url"] + url_file_path
+                    for url_file_path in download_information["url_file_paths"]
+                ],
+                output_directory_path=output_directory_path,
+                maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                expected_file_integrity={
+                    download_information["base_url"] + url_file_path: url_file_integrity
+                    for url_file_path, url_file_integrity in download_information.get(
+                        "url_file_integrity", dict()
+                    ).items()
+                }
+            )
 
             if enable_logger:
                 getLogger(__name__).info(
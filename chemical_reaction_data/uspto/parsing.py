@@ -1,13 +1,76 @@
 """ The 'chemical_reaction_data.uspto' package 'parsing' module. """
 
-from typing import Optional, Tuple
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import Element, iterparse, parse
+
+from ..utilities.columnar import RecordBatchUtilities
+from ..utilities.multiprocessing import MultiprocessingUtilities
 
 
 class UsptoDatasetParsingUtilities:
     """ The United States Patent and Trademark Office (USPTO) dataset parsing utilities class. """
 
+    @staticmethod
+    def _import_lxml_etree() -> ModuleType:
+        """
+        Import the 'etree' module of the optional 'lxml' library.
+
+        :returns: The 'etree' module of the 'lxml' library.
+        """
+
+        try:
+            from lxml import etree
+
+        except ImportError as exception_handle:
+            raise ImportError(
+                "The 'lxml' library is required to parse the '*.xml' files with the 'use_lxml' option. It can be "
+                "installed using the 'pip install lxml' command."
+            ) from exception_handle
+
+        return etree
+
+    @staticmethod
+    def _compile_lxml_xpath_expressions() -> Tuple[Callable[..., List[str]], ...]:
+        """
+        Compile the 'lxml' library XPath expressions of the '*.xml' file element contents.
+
+        :returns: The compiled 'lxml' library XPath expressions of the document ID, paragraph number and chemical
+                  reaction SMILES string.
+        """
+
+        etree = UsptoDatasetParsingUtilities._import_lxml_etree()
+
+        return tuple(
+            etree.XPath(
+                path=xpath_expression,
+                namespaces={
+                    "dl": "http://bitbucket.org/dan2097"
+                },
+                smart_strings=False
+            ) for xpath_expression in [
+                "dl:source/dl:documentId/text()",
+                "dl:source/dl:paragraphNum/text()",
+                "dl:reactionSmiles/text()"
+            ]
+        )
+
+    @staticmethod
+    def initialize_worker(
+            worker_state: Dict[str, Any],
+            use_lxml: bool = False
+    ) -> None:
+        """
+        Initialize a worker process for the parsing of '*.xml' files.
+
+        :parameter worker_state: The state of the worker process.
+        :parameter use_lxml: The indicator whether the 'lxml' library will be utilized.
+        """
+
+        if use_lxml:
+            worker_state["lxml_xpath_expressions"] = UsptoDatasetParsingUtilities._compile_lxml_xpath_expressions()
+
     @staticmethod
     def parse_xml_element(
             xml_element: Element
@@ -32,3 +95,130 @@ class UsptoDatasetParsingUtilities:
         reaction_smiles = reaction_smiles_xml_element.text if reaction_smiles_xml_element is not None else None
 
         return document_id, paragraph_number, reaction_smiles
+
+    @staticmethod
+    def _parse_lxml_xml_element(
+            xml_element: Element
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Parse a '*.xml' file element 'lxml' library Element object using precompiled XPath expressions.
+
+        :parameter xml_element: The '*.xml' file element 'lxml' library Element object.
+
+        :returns: The parsed '*.xml' file element 'lxml' library Element object.
+        """
+
+        worker_state = MultiprocessingUtilities.get_worker_state()
+
+        if "lxml_xpath_expressions" not in worker_state.keys():
+            worker_state["lxml_xpath_expressions"] = UsptoDatasetParsingUtilities._compile_lxml_xpath_expressions()
+
+        xml_element_contents = list()
+
+        for xpath_expression in worker_state["lxml_xpath_expressions"]:
+            xpath_expression_results = xpath_expression(xml_element)
+
+            xml_element_contents.append(
+                xpath_expression_results[0] if len(xpath_expression_results) > 0 else None
+            )
+
+        return xml_element_contents[0], xml_element_contents[1], xml_element_contents[2]
+
+    @staticmethod
+    def iterparse_xml_file(
+            xml_file_path: str,
+            use_lxml: bool = False
+    ) -> Iterator[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """
+        Incrementally parse a '*.xml' file, and discard each element after it is parsed to keep the memory usage
+        independent of the '*.xml' file size.
+
+        :parameter xml_file_path: The path to the '*.xml' file.
+        :parameter use_lxml: The indicator whether the 'lxml' library should be utilized.
+
+        :returns: The parsed '*.xml' file element Element objects.
+        """
+
+        if use_lxml:
+            xml_file_events = UsptoDatasetParsingUtilities._import_lxml_etree().iterparse(
+                source=xml_file_path,
+                events=("start", "end")
+            )
+
+            parse_xml_element = UsptoDatasetParsingUtilities._parse_lxml_xml_element
+
+        else:
+            xml_file_events = iterparse(
+                source=xml_file_path,
+                events=("start", "end")
+            )
+
+            parse_xml_element = UsptoDatasetParsingUtilities.parse_xml_element
+
+        root_xml_element, xml_element_depth = None, 0
+
+        for xml_file_event, xml_element in xml_file_events:
+            if xml_file_event == "start":
+                if root_xml_element is None:
+                    root_xml_element = xml_element
+
+                xml_element_depth += 1
+
+            else:
+                xml_element_depth -= 1
+
+                if xml_element_depth == 1:
+                    yield parse_xml_element(xml_element)
+
+                    xml_element.clear()
+
+                    root_xml_element.remove(xml_element)
+
+    @staticmethod
+    def parse_xml_file(
+            xml_file_path: str,
+            stream_xml_file: bool = False,
+            use_lxml: bool = False,
+            return_record_batch: bool = False
+    ) -> Union[List[Tuple[Optional[str], Optional[str], Optional[str]]], Any]:
+        """
+        Parse a '*.xml' file.
+
+        :parameter xml_file_path: The path to the '*.xml' file.
+        :parameter stream_xml_file: The indicator whether the '*.xml' file should be parsed incrementally.
+        :parameter use_lxml: The indicator whether the 'lxml' library should be utilized to parse the '*.xml' file
+                             incrementally.
+        :parameter return_record_batch: The indicator whether the parsed '*.xml' file element Element objects should be
+                                        returned as a 'pyarrow' library RecordBatch object with the
+                                        'patent_document_id', 'patent_document_paragraph_id' and 'reaction_smiles'
+                                        columns.
+
+        :returns: The parsed '*.xml' file element Element objects.
+        """
+
+        if stream_xml_file or use_lxml:
+            xml_file_contents = list(UsptoDatasetParsingUtilities.iterparse_xml_file(
+                xml_file_path=xml_file_path,
+                use_lxml=use_lxml
+            ))
+
+        else:
+            xml_file_contents = [
+                UsptoDatasetParsingUtilities.parse_xml_element(
+                    xml_element=xml_element
+                ) for xml_element in parse(
+                    source=xml_file_path
+                ).getroot()
+            ]
+
+        if return_record_batch:
+            return RecordBatchUtilities.rows_to_record_batch(
+                rows=xml_file_contents,
+                column_names=[
+                    "patent_document_id",
+                    "patent_document_paragraph_id",
+                    "reaction_smiles"
+                ]
+            )
+
+        return xml_file_contents
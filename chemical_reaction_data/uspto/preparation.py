@@ -1,16 +1,20 @@
 """ The 'chemical_reaction_datasets.uspto' package 'preparation' module. """
 
+from functools import partial
 from logging import getLogger
 from pandas import concat, DataFrame, read_csv
 from os import walk
-from tqdm import tqdm
+from typing import Any, Callable, Optional, Union
 
-from os.path import abspath, join
+from os.path import abspath, getsize, join
 from xml.etree.ElementTree import parse
 
 from .parsing import UsptoDatasetParsingUtilities
 
-from ..utilities.multiprocessing import MultiprocessingUtilities
+from ..utilities.checkpointing import PreparationCheckpoint
+from ..utilities.columnar import RecordBatchUtilities
+from ..utilities.multiprocessing import MultiprocessingPoolSession, MultiprocessingUtilities
+from ..utilities.progress import ProgressReporter
 
 
 class UsptoDatasetPreparationUtils:
@@ -387,7 +391,22 @@ class UsptoDatasetPreparationUtils:
             extracted_data_directory_path: str,
             output_directory_path: str = None,
             parse_xml_files: bool = True,
-            number_of_cpu_cores: int = 1,
+            parse_xml_files_in_parallel: bool = False,
+            stream_xml_files: bool = False,
+            use_lxml: bool = False,
+            use_record_batches: bool = False,
+            schedule_largest_files_first: bool = False,
+            memory_budget: int = None,
+            memory_expansion_factor: float = 10.0,
+            checkpoint_directory_path: str = None,
+            resume: bool = False,
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            start_method: str = None,
+            pool_session: MultiprocessingPoolSession = None,
+            instrumentation_report_file_path: str = None,
+            progress_sink: str = "auto",
+            progress_callback: Callable[[int, Optional[int]], Any] = None,
             enable_logger: bool = False
     ) -> DataFrame:
         """
@@ -396,7 +415,48 @@ class UsptoDatasetPreparationUtils:
         :parameter extracted_data_directory_path: The path to the directory where the extracted data is stored.
         :parameter output_directory_path: The path to the directory where the prepared data should be stored.
         :parameter parse_xml_files: The indicator whether '*.xml' files should be parsed instead of '*.rsmi' files.
-        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter parse_xml_files_in_parallel: The indicator whether the '*.xml' files should be parsed in parallel
+                                                instead of parsing their elements in parallel. In this mode, only the
+                                                '*.xml' file paths are sent to the worker processes.
+        :parameter stream_xml_files: The indicator whether the '*.xml' files should be parsed incrementally, discarding
+                                     each element after it is parsed to keep the memory usage independent of the
+                                     '*.xml' file sizes.
+        :parameter use_lxml: The indicator whether the 'lxml' library should be utilized to parse the '*.xml' files
+                             incrementally.
+        :parameter use_record_batches: The indicator whether the parsed '*.xml' files should be returned from the worker
+                                       processes as 'pyarrow' library RecordBatch objects, which are concatenated
+                                       without re-materializing Python objects. It applies only if the '*.xml' files
+                                       are parsed in parallel.
+        :parameter schedule_largest_files_first: The indicator whether the '*.xml' files should be dispatched to the
+                                                 worker processes from the largest to the smallest, so that a large
+                                                 file does not start last. It applies only if the '*.xml' files are
+                                                 parsed in parallel.
+        :parameter memory_budget: The maximum number of bytes the worker processes are allowed to occupy while parsing
+                                  the '*.xml' files in parallel. A file is dispatched only if its estimated memory
+                                  footprint fits within the budget next to the pending files or, if larger, the
+                                  measured resident set size of the worker processes. If None, the files are not
+                                  throttled by their memory footprint.
+        :parameter memory_expansion_factor: The factor by which the size of a '*.xml' file is multiplied to estimate its
+                                            memory footprint while it is being parsed.
+        :parameter checkpoint_directory_path: The path to the directory where the parsed '*.xml' files should be
+                                              checkpointed, one shard file per '*.xml' file next to a manifest file. If
+                                              None, the parsed '*.xml' files are not checkpointed.
+        :parameter resume: The indicator whether the existing checkpoint should be resumed by skipping the already
+                           parsed '*.xml' files. If False, the existing checkpoint is discarded.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the parsing tasks: 'processes', 'threads' or
+                            'serial'.
+        :parameter start_method: The method that should be utilized to start the worker processes: 'fork', 'spawn',
+                                 'forkserver' or None for the default method of the platform.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the preparation.
+        :parameter instrumentation_report_file_path: The path to the JSON Lines file to which the instrumentation report
+                                                     of each parsing run should be appended. If None, the parsing
+                                                     tasks are not instrumented.
+        :parameter progress_sink: The indicator of the sink of the progress reports: 'tqdm', 'log', 'callback', 'none'
+                                  or 'auto'.
+        :parameter progress_callback: The procedure that receives the number of completed and total items. It is
+                                      required for the 'callback' progress sink.
         :parameter enable_logger: The indicator whether the logger should be enabled.
 
         :returns: The prepared USPTO (1976-2016) dataset by (2017, Lowe, D.M.).
@@ -409,49 +469,227 @@ class UsptoDatasetPreparationUtils:
                 )
 
             if parse_xml_files:
-                prepared_data_rows = list()
-
-                for directory_path, _, file_names in walk(extracted_data_directory_path):
-                    if any(file_name.endswith(".xml") for file_name in file_names):
-                        for file_name in tqdm(
-                                iterable=file_names,
-                                total=len(file_names),
-                                ascii=True,
-                                ncols=150,
-                                desc="Parsing the '{0}/{1}' directory '*.xml' files".format(
-                                    directory_path.split("/")[-2],
-                                    directory_path.split("/")[-1]
-                                )
-                        ):
-                            xml_element_tree = parse(
-                                source=join(directory_path, file_name)
+                if use_lxml:
+                    UsptoDatasetParsingUtilities._import_lxml_etree()
+
+                if parse_xml_files_in_parallel and use_record_batches:
+                    RecordBatchUtilities._import_pyarrow()
+
+                prepared_data, prepared_data_rows = None, list()
+
+                preparation_checkpoint = PreparationCheckpoint(
+                    checkpoint_directory_path=checkpoint_directory_path,
+                    parameters={
+                        "preparation": "uspto_1976_2016_2017_lowe",
+                        "shard_format": "record_batch"
+                        if parse_xml_files_in_parallel and use_record_batches else "rows",
+                    },
+                    resume=resume,
+                    enable_logger=enable_logger
+                ) if checkpoint_directory_path is not None else None
+
+                with MultiprocessingUtilities.open_pool_session(
+                    number_of_cpu_cores=number_of_cpu_cores,
+                    backend=backend,
+                    initializer=UsptoDatasetParsingUtilities.initialize_worker,
+                    initializer_arguments=(use_lxml, ),
+                    start_method=start_method,
+                    preloaded_module_names=(
+                        "lxml.etree",
+                        "chemical_reaction_data.uspto.parsing",
+                    ),
+                    pool_session=pool_session,
+                    enable_logger=enable_logger
+                ) as pool_session:
+                    if parse_xml_files_in_parallel:
+                        xml_files = list()
+
+                        for directory_path, _, file_names in walk(extracted_data_directory_path):
+                            xml_files.extend((
+                                directory_path.split("/")[-2],
+                                int(directory_path.split("/")[-1]),
+                                join(directory_path, file_name)
+                            ) for file_name in file_names if file_name.endswith(".xml"))
+
+                        xml_file_parsing_procedure = partial(
+                            UsptoDatasetParsingUtilities.parse_xml_file,
+                            stream_xml_file=stream_xml_files,
+                            use_lxml=use_lxml,
+                            return_record_batch=use_record_batches
+                        )
+
+                        xml_file_paths = [xml_file[2] for xml_file in xml_files]
+
+                        if preparation_checkpoint is not None:
+                            preparation_checkpoint.update_manifest(
+                                input_file_paths=xml_file_paths
                             )
 
-                            xml_element_tree_contents = MultiprocessingUtilities.run(
-                                processing_procedure=UsptoDatasetParsingUtilities.parse_xml_element,
-                                primary_input_arguments=xml_element_tree.getroot(),
-                                number_of_cpu_cores=number_of_cpu_cores,
+                            xml_file_parsing_procedure = partial(
+                                preparation_checkpoint.run_task,
+                                xml_file_parsing_procedure
+                            )
+
+                            xml_file_paths = [
+                                xml_file_path for xml_file_path in xml_file_paths
+                                if not preparation_checkpoint.is_completed(xml_file_path)
+                            ]
+
+                        if memory_budget is not None:
+                            xml_file_contents = MultiprocessingUtilities.run_with_fault_tolerance(
+                                processing_procedure=xml_file_parsing_procedure,
+                                primary_input_arguments=xml_file_paths,
+                                raise_failed_tasks=True,
+                                task_size_procedure=getsize if schedule_largest_files_first else None,
+                                memory_budget=memory_budget,
+                                task_memory_procedure=lambda xml_file_path: getsize(
+                                    xml_file_path
+                                ) * memory_expansion_factor,
+                                description_message="Parsing the '*.xml' files",
+                                progress_sink=progress_sink,
+                                progress_callback=progress_callback,
+                                pool_session=pool_session,
+                                instrumentation_report_file_path=instrumentation_report_file_path,
                                 enable_logger=enable_logger
                             )
 
-                            prepared_data_rows.extend((
-                                directory_path.split("/")[-2],
-                                int(directory_path.split("/")[-1]),
-                                xml_element_tree_content[0],
-                                xml_element_tree_content[1],
-                                xml_element_tree_content[2]
-                            ) for xml_element_tree_content in xml_element_tree_contents)
-
-                prepared_data = DataFrame(
-                    data=prepared_data_rows,
-                    columns=[
-                        "patent_document_category",
-                        "patent_document_publication_year",
-                        "patent_document_id",
-                        "patent_document_paragraph_id",
-                        "reaction_smiles"
-                    ]
-                ).dropna(
+                        else:
+                            xml_file_contents = MultiprocessingUtilities.run_with_progress_bar(
+                                processing_procedure=xml_file_parsing_procedure,
+                                primary_input_argument=xml_file_paths,
+                                number_of_primary_input_arguments=len(xml_file_paths),
+                                description_message="Parsing the '*.xml' files",
+                                progress_sink=progress_sink,
+                                progress_callback=progress_callback,
+                                task_size_procedure=getsize if schedule_largest_files_first else None,
+                                pool_session=pool_session,
+                                instrumentation_report_file_path=instrumentation_report_file_path,
+                                enable_logger=enable_logger
+                            )
+
+                        if preparation_checkpoint is not None:
+                            preparation_checkpoint.update_manifest(
+                                input_file_paths=[xml_file[2] for xml_file in xml_files]
+                            )
+
+                            xml_file_contents = (
+                                preparation_checkpoint.read_shard(
+                                    input_file_path=xml_file[2]
+                                ) for xml_file in xml_files
+                            )
+
+                        if use_record_batches:
+                            prepared_data = RecordBatchUtilities.record_batches_to_data_frame(
+                                record_batches=((
+                                    {
+                                        "patent_document_category": xml_file[0],
+                                        "patent_document_publication_year": xml_file[1]
+                                    },
+                                    xml_file_content
+                                ) for xml_file, xml_file_content in zip(xml_files, xml_file_contents)
+                                    if xml_file_content is not None),
+                                column_names=[
+                                    "patent_document_category",
+                                    "patent_document_publication_year",
+                                    "patent_document_id",
+                                    "patent_document_paragraph_id",
+                                    "reaction_smiles"
+                                ]
+                            )
+
+                        else:
+                            for xml_file, xml_file_content in zip(xml_files, xml_file_contents):
+                                if xml_file_content is None:
+                                    continue
+
+                                prepared_data_rows.extend((
+                                    xml_file[0],
+                                    xml_file[1],
+                                    xml_element_content[0],
+                                    xml_element_content[1],
+                                    xml_element_content[2]
+                                ) for xml_element_content in xml_file_content)
+
+                    else:
+                        xml_file_paths = list()
+
+                        for directory_path, _, file_names in walk(extracted_data_directory_path):
+                            if any(file_name.endswith(".xml") for file_name in file_names):
+                                with ProgressReporter(
+                                    total=len(file_names),
+                                    description="Parsing the '{0}/{1}' directory '*.xml' files".format(
+                                        directory_path.split("/")[-2],
+                                        directory_path.split("/")[-1]
+                                    ),
+                                    sink=progress_sink,
+                                    callback=progress_callback
+                                ) as progress_reporter:
+                                    for file_name in progress_reporter.track(file_names):
+                                        if preparation_checkpoint is not None and preparation_checkpoint.is_completed(
+                                            input_file_path=join(directory_path, file_name)
+                                        ):
+                                            xml_element_tree_contents = preparation_checkpoint.read_shard(
+                                                input_file_path=join(directory_path, file_name)
+                                            )
+
+                                        elif stream_xml_files or use_lxml:
+                                            xml_element_tree_contents = UsptoDatasetParsingUtilities.iterparse_xml_file(
+                                                xml_file_path=join(directory_path, file_name),
+                                                use_lxml=use_lxml
+                                            )
+
+                                        else:
+                                            xml_element_tree = parse(
+                                                source=join(directory_path, file_name)
+                                            )
+
+                                            xml_element_tree_contents = MultiprocessingUtilities.run(
+                                                processing_procedure=UsptoDatasetParsingUtilities.parse_xml_element,
+                                                primary_input_arguments=xml_element_tree.getroot(),
+                                                pool_session=pool_session,
+                                                instrumentation_report_file_path=instrumentation_report_file_path,
+                                                enable_logger=enable_logger
+                                            )
+
+                                        if preparation_checkpoint is not None and \
+                                                not preparation_checkpoint.is_completed(
+                                                    input_file_path=join(directory_path, file_name)
+                                                ):
+                                            xml_element_tree_contents = list(xml_element_tree_contents)
+
+                                            preparation_checkpoint.write_shard(
+                                                input_file_path=join(directory_path, file_name),
+                                                shard=xml_element_tree_contents
+                                            )
+
+                                        prepared_data_rows.extend((
+                                            directory_path.split("/")[-2],
+                                            int(directory_path.split("/")[-1]),
+                                            xml_element_tree_content[0],
+                                            xml_element_tree_content[1],
+                                            xml_element_tree_content[2]
+                                        ) for xml_element_tree_content in xml_element_tree_contents)
+
+                                if preparation_checkpoint is not None:
+                                    xml_file_paths.extend(join(directory_path, file_name) for file_name in file_names)
+
+                                    preparation_checkpoint.update_manifest(
+                                        input_file_paths=xml_file_paths
+                                    )
+
+                if prepared_data is None:
+                    prepared_data = DataFrame(
+                        data=prepared_data_rows,
+                        columns=[
+                            "patent_document_category",
+                            "patent_document_publication_year",
+                            "patent_document_id",
+                            "patent_document_paragraph_id",
+                            "reaction_smiles"
+                        ]
+                    )
+
+                prepared_data = prepared_data.dropna(
                     subset=[
                         "reaction_smiles"
                     ]
@@ -1,7 +1,7 @@
 """ The 'chemical_reaction_data.utilities.archive' package 'extraction' module. """
 
 from logging import getLogger
-from typing import Iterable
+from typing import BinaryIO, Iterable, List
 
 
 class ArchiveExtractionUtilities:
@@ -106,6 +106,58 @@ class ArchiveExtractionUtilities:
 
             raise
 
+    @staticmethod
+    def extract_from_tar_gz_stream(
+            archive_file_stream: BinaryIO,
+            output_directory_path: str,
+            archive_file_content_base_paths: Iterable[str] = None,
+            enable_logger: bool = False
+    ) -> List[str]:
+        """
+        Extract the contents from a '.tar.gz' archive file stream in a single sequential pass, without seeking. The
+        archive file contents that should not be extracted are decompressed and skipped, but never written.
+
+        :parameter archive_file_stream: The archive file stream, for example the body of an HTTP response.
+        :parameter output_directory_path: The path to the directory where the extracted archive file contents should be
+                                          stored.
+        :parameter archive_file_content_base_paths: The base paths of the archive file contents that should be
+                                                    extracted.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The paths of the extracted archive file contents.
+        """
+
+        try:
+            from tarfile import open
+
+            archive_file_content_base_paths = list(archive_file_content_base_paths) \
+                if archive_file_content_base_paths is not None else None
+
+            extracted_archive_file_content_paths = list()
+
+            with open(fileobj=archive_file_stream, mode="r|gz") as archive:
+                for archive_file_content in archive:
+                    if archive_file_content_base_paths is None or any(
+                        archive_file_content.name.startswith(archive_file_content_base_path)
+                        for archive_file_content_base_path in archive_file_content_base_paths
+                    ):
+                        archive.extract(
+                            member=archive_file_content,
+                            path=output_directory_path
+                        )
+
+                        extracted_archive_file_content_paths.append(archive_file_content.name)
+
+            return extracted_archive_file_content_paths
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.ArchiveExtractionUtilities.extract_from_tar_gz_stream".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
     @staticmethod
     def extract_from_zip_archive(
             archive_file_path: str,
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_data.utilities.checkpointing' package initialization module. """
+
+from .preparation_checkpoint import PreparationCheckpoint
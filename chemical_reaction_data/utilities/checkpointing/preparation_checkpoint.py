@@ -0,0 +1,289 @@
+""" The 'chemical_reaction_data.utilities.checkpointing' package 'preparation_checkpoint' module. """
+
+from hashlib import sha1
+from json import dump, load
+from logging import getLogger
+from os import getpid, listdir, makedirs, remove, replace, stat
+from pickle import dump as pickle_dump, HIGHEST_PROTOCOL, load as pickle_load
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from os.path import abspath, basename, exists, join
+
+
+class PreparationCheckpoint:
+    """
+    The preparation checkpoint class. The output of each input file is stored as a separate shard file, which is
+    written atomically, so the existence of a shard file marks the input file as completed. The manifest file records
+    the preparation parameters and the progress of the input files, and it is written before any shard file, so the
+    shard files of a checkpoint are always covered by its parameters.
+    """
+
+    MANIFEST_FILE_NAME = "manifest.json"
+
+    SHARD_FILE_EXTENSION = ".shard.pkl"
+
+    def __init__(
+            self,
+            checkpoint_directory_path: str,
+            parameters: Dict[str, Any],
+            resume: bool = False,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter checkpoint_directory_path: The path to the directory where the checkpoint should be stored.
+        :parameter parameters: The preparation parameters that affect the contents of the shard files. A checkpoint
+                               can be resumed only with the same parameters.
+        :parameter resume: The indicator whether the existing checkpoint should be resumed. If False, the existing
+                           checkpoint is discarded. If True, the shard files are never removed, and the shard files
+                           of a checkpoint without a manifest file are treated as unverified and recomputed.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        self.__checkpoint_directory_path = checkpoint_directory_path
+        self.__parameters = parameters
+        self.__unverified_shards = dict()
+        self.__enable_logger = enable_logger
+
+        try:
+            makedirs(checkpoint_directory_path, exist_ok=True)
+
+            manifest_file_path = join(checkpoint_directory_path, PreparationCheckpoint.MANIFEST_FILE_NAME)
+            shard_file_names = [
+                file_name for file_name in listdir(checkpoint_directory_path)
+                if file_name.endswith(PreparationCheckpoint.SHARD_FILE_EXTENSION)
+            ]
+
+            if resume and exists(manifest_file_path):
+                with open(manifest_file_path, "r") as file_handle:
+                    manifest = load(file_handle)
+
+                if manifest["parameters"] != parameters:
+                    raise ValueError(
+                        "The checkpoint at '{0}' was created with the parameters {1}, which do not match the "
+                        "parameters {2}.".format(abspath(checkpoint_directory_path), manifest["parameters"], parameters)
+                    )
+
+                self.__unverified_shards = manifest.get("unverified_shards", dict())
+
+                if enable_logger:
+                    getLogger(__name__).info(
+                        "Resuming the checkpoint at '{0}' with {1} completed input file(s).".format(
+                            abspath(checkpoint_directory_path),
+                            len(shard_file_names) - len(self.__unverified_shards)
+                        )
+                    )
+
+            elif resume:
+                self.__unverified_shards = {
+                    shard_file_name: PreparationCheckpoint._get_file_version(
+                        file_path=join(checkpoint_directory_path, shard_file_name)
+                    ) for shard_file_name in shard_file_names
+                }
+
+                if enable_logger and len(self.__unverified_shards) > 0:
+                    getLogger(__name__).warning(
+                        "The checkpoint at '{0}' has no manifest file, so its {1} shard file(s) cannot be verified "
+                        "against the parameters and will be recomputed.".format(
+                            abspath(checkpoint_directory_path),
+                            len(self.__unverified_shards)
+                        )
+                    )
+
+                self.__write_manifest(
+                    input_files=list()
+                )
+
+            else:
+                for file_name in shard_file_names + [PreparationCheckpoint.MANIFEST_FILE_NAME]:
+                    if exists(join(checkpoint_directory_path, file_name)):
+                        remove(join(checkpoint_directory_path, file_name))
+
+                self.__write_manifest(
+                    input_files=list()
+                )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.PreparationCheckpoint.__init__".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def _get_file_version(
+            file_path: str
+    ) -> List[int]:
+        """
+        Get the version of a file, which changes whenever the file is atomically replaced.
+
+        :parameter file_path: The path to the file.
+
+        :returns: The inode number and the modification time of the file in nanoseconds.
+        """
+
+        file_status = stat(file_path)
+
+        return [file_status.st_ino, file_status.st_mtime_ns]
+
+    def get_shard_file_path(
+            self,
+            input_file_path: str
+    ) -> str:
+        """
+        Get the path to the shard file of an input file.
+
+        :parameter input_file_path: The path to the input file.
+
+        :returns: The path to the shard file of the input file.
+        """
+
+        return join(
+            self.__checkpoint_directory_path,
+            sha1(abspath(input_file_path).encode("utf-8")).hexdigest() + PreparationCheckpoint.SHARD_FILE_EXTENSION
+        )
+
+    def is_completed(
+            self,
+            input_file_path: str
+    ) -> bool:
+        """
+        Get the indicator whether an input file is completed.
+
+        :parameter input_file_path: The path to the input file.
+
+        :returns: The indicator whether the input file is completed.
+        """
+
+        shard_file_path = self.get_shard_file_path(input_file_path)
+
+        if not exists(shard_file_path):
+            return False
+
+        return basename(shard_file_path) not in self.__unverified_shards.keys() or \
+            self.__unverified_shards[basename(shard_file_path)] != PreparationCheckpoint._get_file_version(
+                file_path=shard_file_path
+            )
+
+    def write_shard(
+            self,
+            input_file_path: str,
+            shard: Any
+    ) -> None:
+        """
+        Atomically write the output of an input file to its shard file.
+
+        :parameter input_file_path: The path to the input file.
+        :parameter shard: The output of the input file.
+        """
+
+        shard_file_path = self.get_shard_file_path(input_file_path)
+        temporary_shard_file_path = "{0}.{1}.tmp".format(shard_file_path, getpid())
+
+        with open(temporary_shard_file_path, "wb") as file_handle:
+            pickle_dump(shard, file_handle, protocol=HIGHEST_PROTOCOL)
+
+        replace(temporary_shard_file_path, shard_file_path)
+
+    def read_shard(
+            self,
+            input_file_path: str
+    ) -> Optional[Any]:
+        """
+        Read the output of an input file from its shard file.
+
+        :parameter input_file_path: The path to the input file.
+
+        :returns: The output of the input file, or None if the input file is not completed.
+        """
+
+        if not self.is_completed(input_file_path):
+            return None
+
+        with open(self.get_shard_file_path(input_file_path), "rb") as file_handle:
+            return pickle_load(file_handle)
+
+    def run_task(
+            self,
+            processing_procedure: Callable[[str], Any],
+            input_file_path: str
+    ) -> str:
+        """
+        Run a processing procedure for an input file, and write the output to its shard file. It is intended to be run
+        in the worker processes, so the outputs are not transferred back to the parent process.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter input_file_path: The path to the input file.
+
+        :returns: The path to the shard file of the input file.
+        """
+
+        self.write_shard(
+            input_file_path=input_file_path,
+            shard=processing_procedure(input_file_path)
+        )
+
+        return self.get_shard_file_path(input_file_path)
+
+    def update_manifest(
+            self,
+            input_file_paths: Iterable[str]
+    ) -> None:
+        """
+        Atomically write the manifest file with the progress of the input files.
+
+        :parameter input_file_paths: The paths to the input files.
+        """
+
+        try:
+            self.__unverified_shards = {
+                shard_file_name: shard_file_version
+                for shard_file_name, shard_file_version in self.__unverified_shards.items()
+                if exists(join(self.__checkpoint_directory_path, shard_file_name)) and
+                shard_file_version == PreparationCheckpoint._get_file_version(
+                    file_path=join(self.__checkpoint_directory_path, shard_file_name)
+                )
+            }
+
+            self.__write_manifest(
+                input_files=[{
+                    "input_file_path": abspath(input_file_path),
+                    "shard_file_name": basename(self.get_shard_file_path(input_file_path)),
+                    "is_completed": self.is_completed(input_file_path),
+                } for input_file_path in input_file_paths]
+            )
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.PreparationCheckpoint.update_manifest".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def __write_manifest(
+            self,
+            input_files: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Atomically write the manifest file.
+
+        :parameter input_files: The progress of the input files.
+        """
+
+        manifest_file_path = join(self.__checkpoint_directory_path, PreparationCheckpoint.MANIFEST_FILE_NAME)
+
+        with open(manifest_file_path + ".tmp", "w") as file_handle:
+            dump({
+                "parameters": self.__parameters,
+                "number_of_input_files": len(input_files),
+                "number_of_completed_input_files": sum(
+                    1 for input_file in input_files if input_file["is_completed"]
+                ),
+                "input_files": input_files,
+                "unverified_shards": self.__unverified_shards,
+            }, file_handle, indent=2)
+
+        replace(manifest_file_path + ".tmp", manifest_file_path)
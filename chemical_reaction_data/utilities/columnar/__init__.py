@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_data.utilities.columnar' package initialization module. """
+
+from .record_batches import RecordBatchUtilities
@@ -0,0 +1,120 @@
+""" The 'chemical_reaction_data.utilities.columnar' package 'record_batches' module. """
+
+from logging import getLogger
+from pandas import DataFrame
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class RecordBatchUtilities:
+    """
+    The 'pyarrow' library RecordBatch utilities class. The RecordBatch objects are transferred from the worker processes
+    as contiguous column buffers instead of one pickled Python object per value, and are concatenated without copying
+    their contents.
+    """
+
+    @staticmethod
+    def _import_pyarrow() -> ModuleType:
+        """
+        Import the optional 'pyarrow' library.
+
+        :returns: The 'pyarrow' library module.
+        """
+
+        try:
+            import pyarrow
+
+        except ImportError as exception_handle:
+            raise ImportError(
+                "The 'pyarrow' library is required to utilize the RecordBatch objects of the 'use_record_batches' "
+                "option. It can be installed using the 'pip install pyarrow' command."
+            ) from exception_handle
+
+        return pyarrow
+
+    @staticmethod
+    def rows_to_record_batch(
+            rows: Sequence[Tuple[Optional[str], ...]],
+            column_names: List[str],
+            enable_logger: bool = False
+    ) -> Any:
+        """
+        Convert rows of strings to a 'pyarrow' library RecordBatch object.
+
+        :parameter rows: The rows of strings.
+        :parameter column_names: The names of the columns.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The 'pyarrow' library RecordBatch object.
+        """
+
+        try:
+            pyarrow = RecordBatchUtilities._import_pyarrow()
+
+            columns = list(zip(*rows)) if len(rows) > 0 else [()] * len(column_names)
+
+            return pyarrow.RecordBatch.from_arrays(
+                arrays=[
+                    pyarrow.array(column, type=pyarrow.string())
+                    for column in columns
+                ],
+                names=column_names
+            )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RecordBatchUtilities.rows_to_record_batch".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def record_batches_to_data_frame(
+            record_batches: Iterable[Tuple[Dict[str, Any], Any]],
+            column_names: List[str],
+            enable_logger: bool = False
+    ) -> DataFrame:
+        """
+        Concatenate 'pyarrow' library RecordBatch objects, extended with constant columns, to a DataFrame object.
+
+        :parameter record_batches: The values of the constant columns and the 'pyarrow' library RecordBatch object for
+                                   each 'pyarrow' library RecordBatch object.
+        :parameter column_names: The names of the columns of the DataFrame object in the order they should appear.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The DataFrame object.
+        """
+
+        try:
+            pyarrow = RecordBatchUtilities._import_pyarrow()
+
+            tables = list()
+
+            for constant_column_values, record_batch in record_batches:
+                table = pyarrow.Table.from_batches([record_batch])
+
+                for constant_column_name, constant_column_value in constant_column_values.items():
+                    table = table.append_column(
+                        constant_column_name,
+                        pyarrow.repeat(pyarrow.scalar(constant_column_value), table.num_rows)
+                    )
+
+                tables.append(
+                    table.select(column_names)
+                )
+
+            if len(tables) == 0:
+                return DataFrame(
+                    columns=column_names
+                )
+
+            return pyarrow.concat_tables(tables).to_pandas()
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.RecordBatchUtilities.record_batches_to_data_frame".format(__name__)
+                ).exception(exception_handle)
+
+            raise
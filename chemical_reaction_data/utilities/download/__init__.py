@@ -1,3 +1,11 @@
 """ The 'chemical_reaction_data.utilities.download' package initialization module. """
 
 from .download import DownloadUtilities
+
+from .download_cache import DownloadCache
+
+from .download_engine import DownloadEngine
+
+from .download_mirror import DownloadMirror
+
+from .download_session import DownloadSession
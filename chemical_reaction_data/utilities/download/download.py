@@ -1,43 +1,1327 @@
 """ The 'chemical_reaction_data.utilities.download' package 'download' module. """
 
+from functools import partial
+from hashlib import algorithms_available, new
+from itertools import count
+from json import dump, load
 from logging import getLogger
+from math import ceil
+from os import environ, getpid, remove, replace
+from re import match
+from threading import Lock
+from time import sleep
 from tqdm import tqdm
-from typing import Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from os.path import basename, join
-from urllib.request import urlretrieve
+from http.client import HTTPException, HTTPResponse
+from os.path import basename, exists, getsize, join
+from urllib.error import ContentTooShortError, HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+from .download_cache import DownloadCache
+from .download_engine import DownloadEngine
+from .download_mirror import DownloadMirror
+from .download_session import DownloadSession
+
+from ..archive import ArchiveExtractionUtilities
+from ..multiprocessing import MultiprocessingUtilities
+
+
+_download_session = None
+
+_download_session_lock = Lock()
+
+_download_engine = None
+
+_download_engine_lock = Lock()
 
 
 class _DownloadUtilitiesTqdm(tqdm):
-    """ The download utilities 'tqdm' class wrapper. """
+    """ The download utilities 'tqdm' class wrapper, which can be updated by concurrent transfers. """
+
+    def __init__(
+            self,
+            *args,
+            **kwargs
+    ) -> None:
+        """ The constructor method of the class. """
+
+        super().__init__(*args, **kwargs)
+
+        self.__lock = Lock()
+
+    def add_total_size(
+            self,
+            total_size: int
+    ) -> None:
+        """
+        Add the size of a transfer to the total size.
+
+        :parameter total_size: The size of the transfer in 'tqdm' units.
+        """
+
+        with self.__lock:
+            self.total = (self.total or 0) + total_size
+
+            self.refresh()
+
+    def update_transferred_size(
+            self,
+            transferred_size: int
+    ) -> None:
+        """
+        Add the size of a transferred block to the transferred size.
+
+        :parameter transferred_size: The size of the transferred block in 'tqdm' units.
+        """
+
+        with self.__lock:
+            self.update(transferred_size)
+
+
+class _DownloadUtilitiesDigest:
+    """
+    The download utilities digest class, which hashes the contents of a file in order while they are written. Blocks
+    that are written ahead of the hashed part by concurrent transfers are recorded, and read back from the file once
+    the hashed part reaches them.
+    """
+
+    def __init__(
+            self,
+            file_path: str,
+            algorithm_names: Iterable[str]
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter file_path: The path to the file that is written.
+        :parameter algorithm_names: The names of the 'hashlib' algorithms that should be computed.
+        """
+
+        self.__file_path = file_path
+        self.__hashes = {algorithm_name: new(algorithm_name) for algorithm_name in algorithm_names}
+        self.__hashed_size = 0
+        self.__written_interval_ends = dict()
+        self.__written_interval_starts = dict()
+        self.__lock = Lock()
+
+    def __hash(
+            self,
+            block: bytes
+    ) -> None:
+        """
+        Hash the block that directly follows the hashed part of the file.
+
+        :parameter block: The block.
+        """
+
+        for content_hash in self.__hashes.values():
+            content_hash.update(block)
+
+        self.__hashed_size += len(block)
+
+    def __hash_written_intervals(
+            self
+    ) -> None:
+        """ Read back and hash the written intervals of the file that directly follow the hashed part of the file. """
+
+        while self.__hashed_size in self.__written_interval_ends:
+            written_interval_end = self.__written_interval_ends.pop(self.__hashed_size)
+
+            del self.__written_interval_starts[written_interval_end]
+
+            with open(self.__file_path, "rb") as file_handle:
+                file_handle.seek(self.__hashed_size)
+
+                while self.__hashed_size < written_interval_end:
+                    block = file_handle.read(
+                        min(DownloadUtilities.TRANSFER_BLOCK_SIZE, written_interval_end - self.__hashed_size)
+                    )
+
+                    if len(block) == 0:
+                        raise ContentTooShortError(
+                            "The written bytes {0}-{1} of '{2}' could not be read back.".format(
+                                self.__hashed_size,
+                                written_interval_end - 1,
+                                self.__file_path
+                            ),
+                            None
+                        )
+
+                    self.__hash(block)
+
+    def __add_written_interval(
+            self,
+            start: int,
+            end: int
+    ) -> None:
+        """
+        Record a written interval of the file, and merge it with the adjacent written intervals.
+
+        :parameter start: The first byte of the written interval.
+        :parameter end: The byte after the last byte of the written interval.
+        """
+
+        if start in self.__written_interval_starts:
+            start = self.__written_interval_starts.pop(start)
+
+            del self.__written_interval_ends[start]
+
+        if end in self.__written_interval_ends:
+            following_interval_end = self.__written_interval_ends.pop(end)
+
+            del self.__written_interval_starts[following_interval_end]
+
+            end = following_interval_end
+
+        self.__written_interval_ends[start] = end
+        self.__written_interval_starts[end] = start
+
+    def mark_written(
+            self,
+            start: int,
+            end: int
+    ) -> None:
+        """
+        Record an interval of the file that was written before the transfer started.
+
+        :parameter start: The first byte of the written interval.
+        :parameter end: The byte after the last byte of the written interval.
+        """
+
+        with self.__lock:
+            if end > start >= self.__hashed_size:
+                self.__add_written_interval(start, end)
+
+            self.__hash_written_intervals()
+
+    def update(
+            self,
+            position: int,
+            block: bytes
+    ) -> None:
+        """
+        Hash a block that was written and flushed to a position of the file.
+
+        :parameter position: The position of the block in the file.
+        :parameter block: The block.
+        """
+
+        with self.__lock:
+            if position == self.__hashed_size:
+                self.__hash(block)
+
+            elif position > self.__hashed_size:
+                self.__add_written_interval(position, position + len(block))
+
+            self.__hash_written_intervals()
+
+    def finalize(
+            self
+    ) -> Dict[str, str]:
+        """
+        Hash the remaining bytes of the completely written file.
+
+        :returns: The hexadecimal digest of the file for each algorithm.
+        """
+
+        with self.__lock:
+            self.__hash_written_intervals()
+
+            if len(self.__written_interval_ends) > 0:
+                raise ContentTooShortError(
+                    "The bytes {0}-{1} of '{2}' were never written.".format(
+                        self.__hashed_size,
+                        min(self.__written_interval_ends) - 1,
+                        self.__file_path
+                    ),
+                    None
+                )
+
+            with open(self.__file_path, "rb") as file_handle:
+                file_handle.seek(self.__hashed_size)
+
+                for block in iter(lambda: file_handle.read(DownloadUtilities.TRANSFER_BLOCK_SIZE), b""):
+                    self.__hash(block)
+
+            return {
+                algorithm_name: content_hash.hexdigest() for algorithm_name, content_hash in self.__hashes.items()
+            }
+
+
+class _DownloadUtilitiesResponseStream:
+    """
+    The download utilities response stream class, which reports and hashes the blocks of the body of an HTTP response
+    while they are read by a consumer.
+    """
+
+    def __init__(
+            self,
+            response: HTTPResponse,
+            progress_bar: Optional[_DownloadUtilitiesTqdm] = None,
+            algorithm_names: Iterable[str] = ()
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter response: The HTTP response.
+        :parameter progress_bar: The progress bar that should be updated with each read block.
+        :parameter algorithm_names: The names of the 'hashlib' algorithms that should be computed.
+        """
+
+        content_length = response.headers.get("Content-Length")
+
+        self.__response = response
+        self.__progress_bar = progress_bar
+        self.__hashes = {algorithm_name: new(algorithm_name) for algorithm_name in algorithm_names}
+        self.__expected_size = int(content_length) if content_length is not None and content_length.isdigit() else None
+        self.__transferred_size = 0
+
+    @property
+    def expected_size(
+            self
+    ) -> Optional[int]:
+        """
+        Get the size of the body announced by the HTTP 'Content-Length' header.
+
+        :returns: The size of the body in bytes, or None if it is unknown.
+        """
+
+        return self.__expected_size
+
+    @property
+    def transferred_size(
+            self
+    ) -> int:
+        """
+        Get the number of bytes read from the body.
+
+        :returns: The number of bytes read from the body.
+        """
+
+        return self.__transferred_size
+
+    def read(
+            self,
+            size: int = -1
+    ) -> bytes:
+        """
+        Read a block of the body.
+
+        :parameter size: The maximum size of the block in bytes, or a negative value if the rest of the body should be
+                         read.
+
+        :returns: The block, which is empty at the end of the body.
+        """
+
+        block = self.__response.read(size) if size is not None and size >= 0 else self.__response.read()
+
+        if len(block) == 0:
+            if size != 0 and self.__expected_size is not None and self.__transferred_size < self.__expected_size:
+                raise ContentTooShortError(
+                    "Retrieval incomplete: got only {0} out of {1} bytes.".format(
+                        self.__transferred_size,
+                        self.__expected_size
+                    ),
+                    None
+                )
+
+            return block
+
+        for content_hash in self.__hashes.values():
+            content_hash.update(block)
+
+        self.__transferred_size += len(block)
+
+        if self.__progress_bar is not None:
+            self.__progress_bar.update_transferred_size(len(block))
+
+        return block
+
+    def drain(
+            self
+    ) -> None:
+        """ Read the rest of the body, so the digests cover the complete body. """
+
+        while len(self.read(DownloadUtilities.TRANSFER_BLOCK_SIZE)) > 0:
+            pass
+
+    def get_digests(
+            self
+    ) -> Dict[str, str]:
+        """
+        Get the digests of the bytes read from the body.
+
+        :returns: The hexadecimal digest of the read bytes for each algorithm.
+        """
+
+        return {algorithm_name: content_hash.hexdigest() for algorithm_name, content_hash in self.__hashes.items()}
+
+
+class DownloadUtilities:
+    """ The download utilities class. """
+
+    TRANSFER_BLOCK_SIZE = 1024 * 1024
+
+    DEFAULT_NUMBER_OF_SEGMENTS = 8
+
+    MINIMUM_SEGMENT_SIZE = 16 * 1024 * 1024
+
+    PARTIAL_FILE_EXTENSION = ".part"
+
+    SEGMENT_STATE_FILE_EXTENSION = ".json"
+
+    DEFAULT_MAXIMUM_NUMBER_OF_RETRIES = 5
+
+    DEFAULT_RETRY_BACKOFF_FACTOR = 1.0
+
+    MAXIMUM_RETRY_DELAY = 60.0
+
+    RETRIABLE_HTTP_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
+
+    CACHE_DIRECTORY_PATH_ENVIRONMENT_VARIABLE = "CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH"
+
+    @staticmethod
+    def get_download_session() -> DownloadSession:
+        """
+        Get the download session that is shared by all downloads of the current process, so the downloads of all data
+        sources reuse the persistent connections to their hosts. A new download session is created in a forked process.
+
+        :returns: The shared download session.
+        """
+
+        global _download_session
+
+        with _download_session_lock:
+            if _download_session is None or _download_session.process_id != getpid():
+                _download_session = DownloadSession()
+
+            return _download_session
+
+    @staticmethod
+    def get_download_engine() -> DownloadEngine:
+        """
+        Get the download engine that is shared by all downloads of the current process, so the downloads of all data
+        sources are scheduled on a single event loop with shared total and per host limits. A new download engine is
+        created in a forked process.
+
+        :returns: The shared download engine.
+        """
+
+        global _download_engine
+
+        with _download_engine_lock:
+            if _download_engine is None or _download_engine.process_id != getpid():
+                _download_engine = DownloadEngine()
+
+            return _download_engine
+
+    @staticmethod
+    def resolve_download_information(
+            download_information: Dict[str, Any],
+            enable_logger: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Redirect the base URL string of the download information of a data source to the configured download mirror.
+
+        :parameter download_information: The download information of the data source.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The download information with the base URL string of the mirrored contents, or the download
+                  information itself if no download mirror is configured.
+        """
+
+        download_mirror = DownloadMirror.get_configured_download_mirror(
+            enable_logger=enable_logger
+        )
+
+        return download_mirror.resolve_download_information(
+            download_information=download_information
+        ) if download_mirror is not None else download_information
+
+    @staticmethod
+    def _get_download_cache(
+            cache_directory_path: Optional[str],
+            enable_logger: bool = False
+    ) -> Optional[DownloadCache]:
+        """
+        Get the download cache at a directory, or at the directory specified by the environment variable.
+
+        :parameter cache_directory_path: The path to the directory of the download cache. If None, the value of the
+                                         'CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH' environment variable is
+                                         utilized.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The download cache, or None if no directory is specified.
+        """
+
+        if cache_directory_path is None:
+            cache_directory_path = environ.get(DownloadUtilities.CACHE_DIRECTORY_PATH_ENVIRONMENT_VARIABLE) or None
+
+        return DownloadCache(
+            cache_directory_path=cache_directory_path,
+            enable_logger=enable_logger
+        ) if cache_directory_path is not None else None
+
+    @staticmethod
+    def _transfer(
+            response: HTTPResponse,
+            file_handle: BinaryIO,
+            progress_bar: Optional[_DownloadUtilitiesTqdm] = None,
+            segment: List[int] = None,
+            digest: Optional[_DownloadUtilitiesDigest] = None
+    ) -> int:
+        """
+        Transfer the body of an HTTP response to a file in blocks.
+
+        :parameter response: The HTTP response.
+        :parameter file_handle: The handle of the file opened for writing at the offset of the body.
+        :parameter progress_bar: The progress bar that should be updated with each transferred block.
+        :parameter segment: The first byte, the last byte and the number of transferred bytes of the byte range that
+                            should be updated with each transferred block.
+        :parameter digest: The digest that should be updated with each transferred block.
+
+        :returns: The number of transferred bytes.
+        """
+
+        transferred_size = 0
+
+        while True:
+            block = response.read(DownloadUtilities.TRANSFER_BLOCK_SIZE)
+
+            if len(block) == 0:
+                return transferred_size
+
+            position = file_handle.tell() if digest is not None else None
+
+            file_handle.write(block)
+
+            if digest is not None:
+                file_handle.flush()
+
+                digest.update(position, block)
+
+            transferred_size += len(block)
+
+            if segment is not None:
+                segment[2] += len(block)
+
+            if progress_bar is not None:
+                progress_bar.update_transferred_size(len(block))
+
+    @staticmethod
+    def _get_content_range(
+            content_range: Optional[str]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the first byte and the total size of the resource from the value of an HTTP 'Content-Range' header.
+
+        :parameter content_range: The value of the HTTP 'Content-Range' header, for example 'bytes 0-99/1000'.
+
+        :returns: The first byte of the range and the total size of the resource in bytes, or None if they are unknown.
+        """
+
+        content_range_match = match(r"^bytes\s+(\d+)-\d+/(\d+|\*)$", (content_range or "").strip())
+
+        if content_range_match is None:
+            return None, None
+
+        return int(content_range_match.group(1)), \
+            int(content_range_match.group(2)) if content_range_match.group(2) != "*" else None
+
+    @staticmethod
+    def _is_retriable(
+            exception_handle: BaseException
+    ) -> bool:
+        """
+        Get the indicator whether a failed download should be retried.
+
+        :parameter exception_handle: The exception raised by the download.
+
+        :returns: The indicator whether the failed download should be retried.
+        """
+
+        if isinstance(exception_handle, HTTPError):
+            return exception_handle.code in DownloadUtilities.RETRIABLE_HTTP_STATUS_CODES
+
+        return isinstance(exception_handle, (URLError, HTTPException, ConnectionError, TimeoutError))
+
+    @staticmethod
+    def _run_with_retries(
+            url: str,
+            attempt_procedure: Callable[[], Any],
+            maximum_number_of_retries: int,
+            retry_backoff_factor: float,
+            enable_logger: bool = False
+    ) -> Any:
+        """
+        Run the attempts of a download until one succeeds, and wait with an exponential backoff after each retriable
+        failure.
+
+        :parameter url: The URL string of the download.
+        :parameter attempt_procedure: The procedure of an attempt of the download.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The output of the successful attempt.
+        """
+
+        for attempt_index in count():
+            try:
+                return attempt_procedure()
+
+            except Exception as exception_handle:
+                if attempt_index >= maximum_number_of_retries or not DownloadUtilities._is_retriable(exception_handle):
+                    raise
+
+                retry_delay = min(retry_backoff_factor * 2 ** attempt_index, DownloadUtilities.MAXIMUM_RETRY_DELAY)
+
+                if enable_logger:
+                    getLogger(__name__).warning(
+                        "Retrying the download of '{0}' in {1:.1f} seconds after attempt {2} failed: {3}".format(
+                            url,
+                            retry_delay,
+                            attempt_index + 1,
+                            repr(exception_handle)
+                        )
+                    )
+
+                sleep(retry_delay)
+
+    @staticmethod
+    def _parse_expected_hash(
+            expected_hash: str
+    ) -> Tuple[str, str]:
+        """
+        Get the algorithm name and the hexadecimal digest of an expected hash.
+
+        :parameter expected_hash: The expected hash in the '<algorithm>:<hexadecimal digest>' format, for example
+                                  'sha256:9f86d081884c7d65...'.
+
+        :returns: The name of the 'hashlib' algorithm and the hexadecimal digest.
+        """
+
+        algorithm_name, separator, hexadecimal_digest = expected_hash.partition(":")
+        algorithm_name = algorithm_name.strip().lower()
+
+        if separator == "" or algorithm_name not in algorithms_available or algorithm_name.startswith("shake_"):
+            raise ValueError(
+                "The expected hash '{0}' is not in the '<algorithm>:<hexadecimal digest>' format with a supported "
+                "'hashlib' algorithm.".format(expected_hash)
+            )
+
+        return algorithm_name, hexadecimal_digest.strip().lower()
+
+    @staticmethod
+    def _verify_integrity(
+            url: str,
+            size: int,
+            digests: Dict[str, str],
+            expected_size: Optional[int],
+            expected_hash: Optional[str],
+            file_path: str = None
+    ) -> None:
+        """
+        Verify the size and the hash of the downloaded contents of a URL string.
+
+        :parameter url: The URL string.
+        :parameter size: The size of the downloaded contents in bytes.
+        :parameter digests: The already computed hexadecimal digest of the contents for each algorithm.
+        :parameter expected_size: The expected size of the contents in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the contents in the '<algorithm>:<hexadecimal digest>' format,
+                                  or None if it should not be verified.
+        :parameter file_path: The path to the file of the downloaded contents, which is hashed again only if the
+                              algorithm of the expected hash is missing from the already computed digests.
+        """
+
+        if expected_size is not None and size != expected_size:
+            raise ValueError(
+                "The size of the downloaded contents of '{0}' is {1} bytes instead of the expected {2} bytes.".format(
+                    url,
+                    size,
+                    expected_size
+                )
+            )
+
+        if expected_hash is not None:
+            algorithm_name, expected_hexadecimal_digest = DownloadUtilities._parse_expected_hash(expected_hash)
+
+            hexadecimal_digest = digests[algorithm_name] if algorithm_name in digests else _DownloadUtilitiesDigest(
+                file_path=file_path,
+                algorithm_names=(algorithm_name, )
+            ).finalize()[algorithm_name]
+
+            if hexadecimal_digest != expected_hexadecimal_digest:
+                raise ValueError(
+                    "The {0} hash of the downloaded contents of '{1}' is '{2}' instead of the expected '{3}'.".format(
+                        algorithm_name,
+                        url,
+                        hexadecimal_digest,
+                        expected_hexadecimal_digest
+                    )
+                )
+
+    @staticmethod
+    def _read_segment_state(
+            segment_state_file_path: str,
+            url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the state of the byte ranges of an interrupted segmented download.
+
+        :parameter segment_state_file_path: The path to the segment state file.
+        :parameter url: The URL string of the download.
+
+        :returns: The total size and the byte ranges of the download, or None if there is no usable state.
+        """
+
+        try:
+            with open(segment_state_file_path, "r") as file_handle:
+                segment_state = load(file_handle)
+
+            return segment_state if segment_state["url"] == url else None
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_segment_state(
+            segment_state_file_path: str,
+            segment_state: Dict[str, Any]
+    ) -> None:
+        """
+        Atomically write the state of the byte ranges of a segmented download.
+
+        :parameter segment_state_file_path: The path to the segment state file.
+        :parameter segment_state: The total size and the byte ranges of the download.
+        """
+
+        with open(segment_state_file_path + ".tmp", "w") as file_handle:
+            dump(segment_state, file_handle)
+
+        replace(segment_state_file_path + ".tmp", segment_state_file_path)
+
+    @staticmethod
+    def _download_segment(
+            url: str,
+            partial_file_path: str,
+            progress_bar: Optional[_DownloadUtilitiesTqdm],
+            digest: Optional[_DownloadUtilitiesDigest],
+            segment: Tuple[List[int], Optional[HTTPResponse]]
+    ) -> Optional[BaseException]:
+        """
+        Download the remaining bytes of a byte range of the contents from a URL string into its place in the partial
+        file.
+
+        :parameter url: The URL string.
+        :parameter partial_file_path: The path to the preallocated partial file.
+        :parameter progress_bar: The progress bar that should be updated with each transferred block.
+        :parameter digest: The digest that should be updated with each transferred block.
+        :parameter segment: The first byte, the last byte and the number of transferred bytes of the byte range, and the
+                            already opened HTTP response of the remaining bytes or None if they should be requested.
+
+        :returns: The exception raised by the download of the byte range, or None if it succeeded.
+        """
+
+        (segment_start, segment_end, _), response = segment
+
+        try:
+            if response is None:
+                response = DownloadUtilities.get_download_session().request(
+                    url=url,
+                    headers={"Range": "bytes={0}-{1}".format(segment_start + segment[0][2], segment_end)}
+                )
+
+            with response:
+                if response.status != 206:
+                    raise ValueError(
+                        "The server did not honour the request for the byte range {0}-{1} of '{2}'.".format(
+                            segment_start + segment[0][2],
+                            segment_end,
+                            url
+                        )
+                    )
+
+                with open(partial_file_path, "r+b") as file_handle:
+                    file_handle.seek(segment_start + segment[0][2])
+
+                    DownloadUtilities._transfer(
+                        response=response,
+                        file_handle=file_handle,
+                        progress_bar=progress_bar,
+                        segment=segment[0],
+                        digest=digest
+                    )
+
+            if segment[0][2] != segment_end - segment_start + 1:
+                raise ContentTooShortError(
+                    "Retrieval incomplete: got only {0} out of {1} bytes of the byte range {2}-{3}.".format(
+                        segment[0][2],
+                        segment_end - segment_start + 1,
+                        segment_start,
+                        segment_end
+                    ),
+                    None
+                )
+
+            return None
+
+        except Exception as exception_handle:
+            return exception_handle
+
+    @staticmethod
+    def _download_segments(
+            url: str,
+            partial_file_path: str,
+            segment_state: Dict[str, Any],
+            progress_bar: Optional[_DownloadUtilitiesTqdm],
+            digest: Optional[_DownloadUtilitiesDigest],
+            first_segment_response: HTTPResponse = None,
+            download_engine: Optional[DownloadEngine] = None
+    ) -> None:
+        """
+        Download the remaining bytes of the byte ranges of the contents from a URL string in parallel, and store the
+        state of the byte ranges so an interrupted download can be resumed. If the download runs on a download engine,
+        each parallel connection beyond the first one occupies an additional slot of the per host limit, so only as many
+        byte ranges are downloaded at once as the limit allows, and the rest are downloaded after them.
+
+        :parameter url: The URL string.
+        :parameter partial_file_path: The path to the preallocated partial file.
+        :parameter segment_state: The total size and the byte ranges of the download.
+        :parameter progress_bar: The progress bar that should be updated with each transferred block.
+        :parameter digest: The digest that should be updated with each transferred block.
+        :parameter first_segment_response: The already opened HTTP response of the first byte range.
+        :parameter download_engine: The download engine that runs the download, or None if the number of parallel
+                                    connections should not be limited.
+        """
+
+        segment_state_file_path = partial_file_path + DownloadUtilities.SEGMENT_STATE_FILE_EXTENSION
+
+        incomplete_segments = [
+            (segment, first_segment_response if segment_index == 0 else None)
+            for segment_index, segment in enumerate(segment_state["segments"])
+            if segment[2] < segment[1] - segment[0] + 1
+        ]
+
+        if first_segment_response is not None and (
+            len(incomplete_segments) == 0 or incomplete_segments[0][1] is None
+        ):
+            first_segment_response.close()
+
+        number_of_additional_connections = max(len(incomplete_segments) - 1, 0)
+
+        if download_engine is not None:
+            number_of_additional_connections = download_engine.acquire_additional_host_slots(
+                url=url,
+                maximum_number_of_slots=number_of_additional_connections
+            )
+
+        try:
+            segment_exceptions = MultiprocessingUtilities.run(
+                processing_procedure=partial(
+                    DownloadUtilities._download_segment,
+                    url,
+                    partial_file_path,
+                    progress_bar,
+                    digest
+                ),
+                primary_input_arguments=incomplete_segments,
+                number_of_cpu_cores=number_of_additional_connections + 1,
+                backend="threads",
+                chunk_size=1
+            )
+
+        finally:
+            if download_engine is not None:
+                download_engine.release_additional_host_slots(
+                    url=url,
+                    number_of_slots=number_of_additional_connections
+                )
+
+            DownloadUtilities._write_segment_state(
+                segment_state_file_path=segment_state_file_path,
+                segment_state=segment_state
+            )
+
+        for segment_exception in segment_exceptions:
+            if segment_exception is not None:
+                raise segment_exception
+
+    @staticmethod
+    def _download_partial_file(
+            url: str,
+            partial_file_path: str,
+            number_of_segments: int,
+            minimum_segment_size: int,
+            progress_bar: Optional[_DownloadUtilitiesTqdm],
+            progress_state: Dict[str, bool],
+            algorithm_names: Iterable[str] = (),
+            download_engine: Optional[DownloadEngine] = None,
+            cache_state: Dict[str, Any] = None
+    ) -> Dict[str, str]:
+        """
+        Download the contents from a URL string to a partial file, and continue from the bytes already stored in the
+        partial file if the server supports byte range requests. If the download starts from scratch, the first request
+        carries the conditional request headers of the cached contents, and the download stops if the server responds
+        with the HTTP status code 304. The digests of the contents are computed in order
+        while the blocks are transferred. For a single stream, only the bytes stored by earlier attempts are read back
+        from the partial file. For parallel byte ranges, the blocks that arrive ahead of the hashed part are read back
+        from the partial file once the hashed part reaches them, which is most of the contents.
 
-    def urlretrieve_reporthook_update(
-            self,
-            number_of_transferred_blocks: int = 1,
-            block_size: int = 1,
-            total_size: int = None
-    ) -> Optional[bool]:
+        :parameter url: The URL string.
+        :parameter partial_file_path: The path to the partial file.
+        :parameter number_of_segments: The maximum number of byte ranges that should be downloaded in parallel.
+        :parameter minimum_segment_size: The minimum size of a byte range in bytes.
+        :parameter progress_bar: The progress bar that should be updated with each transferred block.
+        :parameter progress_state: The state of the progress reports shared by the attempts of the download.
+        :parameter algorithm_names: The names of the 'hashlib' algorithms of the digests that should be computed.
+        :parameter download_engine: The download engine that runs the download, or None if the number of parallel
+                                    connections should not be limited.
+        :parameter cache_state: The state of the download cache shared by the attempts of the download, which holds the
+                                'conditional_request_headers', and receives the 'is_not_modified' indicator and the
+                                'etag' and 'last_modified' validators of the response, or None if no cache is utilized.
+
+        :returns: The hexadecimal digest of the complete partial file for each algorithm, which is empty if the cached
+                  contents are not modified.
+        """
+
+        algorithm_names = tuple(algorithm_names)
+
+        def get_digest() -> Optional[_DownloadUtilitiesDigest]:
+            return _DownloadUtilitiesDigest(
+                file_path=partial_file_path,
+                algorithm_names=algorithm_names
+            ) if len(algorithm_names) > 0 else None
+
+        def report_total_size(
+                total_size: Optional[int],
+                transferred_size: int
+        ) -> None:
+            if progress_bar is not None and not progress_state["is_total_size_reported"]:
+                if total_size is not None:
+                    progress_bar.add_total_size(total_size)
+
+                progress_bar.update_transferred_size(transferred_size)
+
+                progress_state["is_total_size_reported"] = True
+
+        segment_state_file_path = partial_file_path + DownloadUtilities.SEGMENT_STATE_FILE_EXTENSION
+
+        segment_state = DownloadUtilities._read_segment_state(
+            segment_state_file_path=segment_state_file_path,
+            url=url
+        ) if exists(partial_file_path) else None
+
+        if segment_state is not None:
+            report_total_size(segment_state["total_size"], sum(segment[2] for segment in segment_state["segments"]))
+
+            digest = get_digest()
+
+            if digest is not None:
+                for segment_start, _, segment_transferred_size in segment_state["segments"]:
+                    digest.mark_written(segment_start, segment_start + segment_transferred_size)
+
+            DownloadUtilities._download_segments(
+                url=url,
+                partial_file_path=partial_file_path,
+                segment_state=segment_state,
+                progress_bar=progress_bar,
+                digest=digest,
+                download_engine=download_engine
+            )
+
+            return digest.finalize() if digest is not None else dict()
+
+        if exists(segment_state_file_path):
+            remove(segment_state_file_path)
+
+        offset = getsize(partial_file_path) if exists(partial_file_path) else 0
+
+        download_session = DownloadUtilities.get_download_session()
+
+        conditional_request_headers = cache_state["conditional_request_headers"] \
+            if cache_state is not None and offset == 0 else dict()
+
+        try:
+            if offset > 0:
+                response = download_session.request(url=url, headers={"Range": "bytes={0}-".format(offset)})
+
+            elif number_of_segments > 1:
+                response = download_session.request(
+                    url=url,
+                    headers=dict(conditional_request_headers, Range="bytes=0-{0}".format(minimum_segment_size - 1))
+                )
+
+            else:
+                response = download_session.request(url=url, headers=conditional_request_headers)
+
+        except HTTPError as exception_handle:
+            if exception_handle.code == 304 and len(conditional_request_headers) > 0:
+                cache_state["is_not_modified"] = True
+
+                return dict()
+
+            if exception_handle.code != 416 or offset == 0:
+                raise
+
+            remove(partial_file_path)
+
+            offset, response = 0, download_session.request(url=url)
+
+        if response.status == 304 and len(conditional_request_headers) > 0:
+            response.close()
+
+            cache_state["is_not_modified"] = True
+
+            return dict()
+
+        if cache_state is not None:
+            cache_state["etag"], cache_state["last_modified"] = \
+                response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        range_start, total_size = DownloadUtilities._get_content_range(
+            response.headers.get("Content-Range")
+        ) if response.status == 206 else (None, None)
+
+        if response.status == 206 and offset == 0 and range_start == 0 and total_size is not None:
+            with open(partial_file_path, "wb") as file_handle:
+                file_handle.truncate(total_size)
+
+            first_segment_end = min(minimum_segment_size, total_size) - 1
+
+            segments = [[0, first_segment_end, 0], ]
+
+            if first_segment_end + 1 < total_size:
+                remaining_segment_size = max(
+                    ceil((total_size - first_segment_end - 1) / max(number_of_segments - 1, 1)),
+                    minimum_segment_size
+                )
+
+                segments.extend(
+                    [segment_start, min(segment_start + remaining_segment_size, total_size) - 1, 0]
+                    for segment_start in range(first_segment_end + 1, total_size, remaining_segment_size)
+                )
+
+            report_total_size(total_size, 0)
+
+            digest = get_digest()
+
+            DownloadUtilities._download_segments(
+                url=url,
+                partial_file_path=partial_file_path,
+                segment_state={"url": url, "total_size": total_size, "segments": segments},
+                progress_bar=progress_bar,
+                digest=digest,
+                first_segment_response=response,
+                download_engine=download_engine
+            )
+
+            return digest.finalize() if digest is not None else dict()
+
+        if response.status == 206 and (range_start != offset or offset == 0):
+            response.close()
+
+            response = download_session.request(url=url)
+
+        if response.status == 206:
+            report_total_size(total_size, offset)
+
+            file_mode, expected_size = "ab", total_size
+
+        else:
+            content_length = response.headers.get("Content-Length")
+
+            if progress_state["is_total_size_reported"] and offset > 0 and progress_bar is not None:
+                progress_bar.update_transferred_size(-offset)
+
+            file_mode, offset = "wb", 0
+            expected_size = int(content_length) if content_length is not None and content_length.isdigit() else None
+
+            report_total_size(expected_size, 0)
+
+        digest = get_digest()
+
+        if digest is not None:
+            digest.mark_written(0, offset)
+
+        with response, open(partial_file_path, file_mode) as file_handle:
+            transferred_size = offset + DownloadUtilities._transfer(
+                response=response,
+                file_handle=file_handle,
+                progress_bar=progress_bar,
+                digest=digest
+            )
+
+        if expected_size is not None and transferred_size < expected_size:
+            raise ContentTooShortError(
+                "Retrieval incomplete: got only {0} out of {1} bytes.".format(transferred_size, expected_size),
+                None
+            )
+
+        return digest.finalize() if digest is not None else dict()
+
+    @staticmethod
+    def _download_local_file(
+            url: str,
+            output_file_path: str,
+            progress_bar: Optional[_DownloadUtilitiesTqdm] = None,
+            expected_size: int = None,
+            expected_hash: str = None,
+            enable_logger: bool = False
+    ) -> str:
         """
-        The 'tqdm' class 'update' method wrapper for the 'urllib.request.urlretrieve' function 'reporthook' argument.
+        Transfer the contents from a 'file://' URL string, for example of a download mirror, to a file. The local file
+        is cloned to the partial file where possible and copied otherwise, verified, and renamed to the output file.
+
+        :parameter url: The 'file://' URL string.
+        :parameter output_file_path: The path to the output file.
+        :parameter progress_bar: The progress bar that should be updated with the transferred size.
+        :parameter expected_size: The expected size of the contents in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the contents in the '<algorithm>:<hexadecimal digest>' format,
+                                  or None if it should not be verified.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
 
-        :parameter number_of_transferred_blocks: The number of blocks transferred so far.
-        :parameter block_size: Size of each block in 'tqdm' units.
-        :parameter total_size: Total size in 'tqdm' units.
+        :returns: The path to the output file.
         """
 
-        if total_size is not None:
-            self.total = total_size
+        source_file_path = url2pathname(urlsplit(url).path)
+
+        if not exists(source_file_path):
+            raise FileNotFoundError(
+                "The local file '{0}' of '{1}' does not exist.".format(source_file_path, url)
+            )
 
-        return self.update(number_of_transferred_blocks * block_size - self.n)
+        size = getsize(source_file_path)
 
+        if progress_bar is not None:
+            progress_bar.add_total_size(size)
 
-class DownloadUtilities:
-    """ The download utilities class. """
+        partial_file_path = output_file_path + DownloadUtilities.PARTIAL_FILE_EXTENSION
+
+        transfer_method = DownloadMirror.transfer_file(source_file_path, partial_file_path)
+
+        try:
+            DownloadUtilities._verify_integrity(
+                url=url,
+                size=getsize(partial_file_path),
+                digests=dict(),
+                expected_size=expected_size,
+                expected_hash=expected_hash,
+                file_path=partial_file_path
+            )
+
+        except ValueError:
+            remove(partial_file_path)
+
+            raise
+
+        replace(partial_file_path, output_file_path)
+
+        if progress_bar is not None:
+            progress_bar.update_transferred_size(size)
+
+        if enable_logger:
+            getLogger(__name__).debug(
+                "Transferred '{0}' to '{1}' with the '{2}' method.".format(url, output_file_path, transfer_method)
+            )
+
+        return output_file_path
+
+    @staticmethod
+    def _download_file(
+            url: str,
+            output_file_path: str,
+            number_of_segments: int = DEFAULT_NUMBER_OF_SEGMENTS,
+            minimum_segment_size: int = MINIMUM_SEGMENT_SIZE,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            progress_bar: Optional[_DownloadUtilitiesTqdm] = None,
+            download_cache: Optional[DownloadCache] = None,
+            expected_size: int = None,
+            expected_hash: str = None,
+            download_engine: Optional[DownloadEngine] = None,
+            enable_logger: bool = False
+    ) -> str:
+        """
+        Download the contents from a URL string to a file. The contents are written to a partial file, which is renamed
+        to the output file once it is complete, so an interrupted download can be continued from the partial file. If
+        multiple segments are requested, the first segment is requested as a byte range. If the server honours it and
+        the contents are large enough, the remaining byte ranges are downloaded in parallel into their places in the
+        preallocated partial file. Otherwise, the contents are downloaded as a single stream from the same response.
+        Failed attempts are retried with an exponential backoff. If a download cache is utilized, the first request
+        carries the validators of the cached contents, which are restored instead if the server responds with the HTTP
+        status code 304, or if the server cannot be reached, so outdated contents cost no additional request. If the
+        expected size or hash is known, the complete partial file is verified before it is renamed. If the expected
+        hash is known, the contents are downloaded as a single stream, so the digest is computed during the transfer
+        instead of reading the parallel byte ranges back from the partial file. The contents of a 'file://' URL string
+        are cloned or copied instead, without the download cache.
+
+        :parameter url: The URL string.
+        :parameter output_file_path: The path to the output file.
+        :parameter number_of_segments: The maximum number of byte ranges that should be downloaded in parallel. It is
+                                       ignored if the expected hash is known.
+        :parameter minimum_segment_size: The minimum size of a byte range in bytes.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter progress_bar: The progress bar that should be updated with each transferred block.
+        :parameter download_cache: The download cache that should be utilized.
+        :parameter expected_size: The expected size of the contents in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the contents in the '<algorithm>:<hexadecimal digest>' format,
+                                  or None if it should not be verified.
+        :parameter download_engine: The download engine that runs the download, whose per host limit also counts the
+                                    parallel byte range connections, or None if they should not be limited.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The path to the output file.
+        """
+
+        if urlsplit(url).scheme == "file":
+            return DownloadUtilities._download_local_file(
+                url=url,
+                output_file_path=output_file_path,
+                progress_bar=progress_bar,
+                expected_size=expected_size,
+                expected_hash=expected_hash,
+                enable_logger=enable_logger
+            )
+
+        algorithm_names = set()
+
+        if expected_hash is not None:
+            algorithm_names.add(DownloadUtilities._parse_expected_hash(expected_hash)[0])
+
+            number_of_segments = 1
+
+        if download_cache is not None:
+            algorithm_names.add("sha256")
+
+        partial_file_path = output_file_path + DownloadUtilities.PARTIAL_FILE_EXTENSION
+        progress_state = {"is_total_size_reported": False}
+
+        entry = download_cache.get_entry(url) if download_cache is not None else None
+
+        cache_state = {
+            "conditional_request_headers": download_cache.get_conditional_request_headers(url)
+            if entry is not None else dict(),
+            "is_not_modified": False,
+            "etag": None,
+            "last_modified": None,
+        } if download_cache is not None else None
+
+        def restore_cached_contents() -> bool:
+            if not download_cache.restore(url=url, output_file_path=output_file_path):
+                return False
+
+            try:
+                DownloadUtilities._verify_integrity(
+                    url=url,
+                    size=getsize(output_file_path),
+                    digests={"sha256": entry["content_hash"]},
+                    expected_size=expected_size,
+                    expected_hash=expected_hash,
+                    file_path=output_file_path
+                )
+
+                return True
+
+            except ValueError as exception_handle:
+                remove(output_file_path)
+
+                if enable_logger:
+                    getLogger(__name__).warning(
+                        "Discarding the cached contents of '{0}': {1}".format(url, exception_handle)
+                    )
+
+                return False
+
+        while True:
+            try:
+                digests = DownloadUtilities._run_with_retries(
+                    url=url,
+                    attempt_procedure=partial(
+                        DownloadUtilities._download_partial_file,
+                        url=url,
+                        partial_file_path=partial_file_path,
+                        number_of_segments=number_of_segments,
+                        minimum_segment_size=minimum_segment_size,
+                        progress_bar=progress_bar,
+                        progress_state=progress_state,
+                        algorithm_names=algorithm_names,
+                        download_engine=download_engine,
+                        cache_state=cache_state
+                    ),
+                    maximum_number_of_retries=maximum_number_of_retries,
+                    retry_backoff_factor=retry_backoff_factor,
+                    enable_logger=enable_logger
+                )
+
+            except (URLError, HTTPException, ConnectionError, TimeoutError) as exception_handle:
+                if entry is None or isinstance(exception_handle, HTTPError) or not restore_cached_contents():
+                    raise
+
+                if enable_logger:
+                    getLogger(__name__).warning(
+                        "Utilizing the cached contents of '{0}', which could not be revalidated: {1}".format(
+                            url,
+                            repr(exception_handle)
+                        )
+                    )
+
+                return output_file_path
+
+            if cache_state is None or not cache_state["is_not_modified"]:
+                break
+
+            if restore_cached_contents():
+                return output_file_path
+
+            cache_state.update(conditional_request_headers=dict(), is_not_modified=False)
+
+        if exists(partial_file_path + DownloadUtilities.SEGMENT_STATE_FILE_EXTENSION):
+            remove(partial_file_path + DownloadUtilities.SEGMENT_STATE_FILE_EXTENSION)
+
+        try:
+            DownloadUtilities._verify_integrity(
+                url=url,
+                size=getsize(partial_file_path),
+                digests=digests,
+                expected_size=expected_size,
+                expected_hash=expected_hash,
+                file_path=partial_file_path
+            )
+
+        except ValueError:
+            remove(partial_file_path)
+
+            raise
+
+        replace(partial_file_path, output_file_path)
+
+        if download_cache is not None:
+            download_cache.store(
+                url=url,
+                file_path=output_file_path,
+                etag=cache_state["etag"],
+                last_modified=cache_state["last_modified"],
+                content_hash=digests.get("sha256")
+            )
+
+        return output_file_path
 
     @staticmethod
     def download(
             url: str,
             output_directory_path: str,
+            number_of_segments: int = DEFAULT_NUMBER_OF_SEGMENTS,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            cache_directory_path: str = None,
+            expected_size: int = None,
+            expected_hash: str = None,
             enable_logger: bool = False
     ) -> None:
         """
@@ -45,13 +1329,36 @@ class DownloadUtilities:
 
         :parameter url: The URL string.
         :parameter output_directory_path: The path to the directory where the downloaded URL contents should be stored.
+        :parameter number_of_segments: The maximum number of byte ranges of large contents that should be downloaded in
+                                       parallel. It is ignored if the server does not support byte range requests,
+                                       or if the expected hash is known.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried. The retry
+                                              continues from the bytes already stored in the partial file.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter cache_directory_path: The path to the directory of the download cache that should be utilized. If
+                                         None, the 'CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH' environment
+                                         variable is utilized, and no cache is utilized if it is not set either.
+        :parameter expected_size: The expected size of the contents in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the contents in the '<algorithm>:<hexadecimal digest>' format,
+                                  for example 'sha256:9f86d081884c7d65...', or None if it should not be verified.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
         try:
-            urlretrieve(
+            DownloadUtilities._download_file(
                 url=url,
-                filename=join(output_directory_path, basename(url))
+                output_file_path=join(output_directory_path, basename(url)),
+                number_of_segments=number_of_segments,
+                maximum_number_of_retries=maximum_number_of_retries,
+                retry_backoff_factor=retry_backoff_factor,
+                download_cache=DownloadUtilities._get_download_cache(
+                    cache_directory_path=cache_directory_path,
+                    enable_logger=enable_logger
+                ),
+                expected_size=expected_size,
+                expected_hash=expected_hash,
+                enable_logger=enable_logger
             )
 
         except Exception as exception_handle:
@@ -67,6 +1374,12 @@ class DownloadUtilities:
             url: str,
             output_directory_path: str,
             description_message: str = None,
+            number_of_segments: int = DEFAULT_NUMBER_OF_SEGMENTS,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            cache_directory_path: str = None,
+            expected_size: int = None,
+            expected_hash: str = None,
             enable_logger: bool = False
     ) -> None:
         """
@@ -75,6 +1388,19 @@ class DownloadUtilities:
         :parameter url: The URL string.
         :parameter output_directory_path: The path to the directory where the downloaded URL contents should be stored.
         :parameter description_message: The progress bar description message.
+        :parameter number_of_segments: The maximum number of byte ranges of large contents that should be downloaded in
+                                       parallel. It is ignored if the server does not support byte range requests,
+                                       or if the expected hash is known.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried. The retry
+                                              continues from the bytes already stored in the partial file.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter cache_directory_path: The path to the directory of the download cache that should be utilized. If
+                                         None, the 'CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH' environment
+                                         variable is utilized, and no cache is utilized if it is not set either.
+        :parameter expected_size: The expected size of the contents in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the contents in the '<algorithm>:<hexadecimal digest>' format,
+                                  for example 'sha256:9f86d081884c7d65...', or None if it should not be verified.
         :parameter enable_logger: The indicator whether the logger should be enabled.
         """
 
@@ -89,10 +1415,20 @@ class DownloadUtilities:
                     description_message if description_message is not None else "Downloading"
                 )
             ) as progress_bar:
-                urlretrieve(
+                DownloadUtilities._download_file(
                     url=url,
-                    filename=join(output_directory_path, basename(url)),
-                    reporthook=progress_bar.urlretrieve_reporthook_update
+                    output_file_path=join(output_directory_path, basename(url)),
+                    number_of_segments=number_of_segments,
+                    maximum_number_of_retries=maximum_number_of_retries,
+                    retry_backoff_factor=retry_backoff_factor,
+                    progress_bar=progress_bar,
+                    download_cache=DownloadUtilities._get_download_cache(
+                        cache_directory_path=cache_directory_path,
+                        enable_logger=enable_logger
+                    ),
+                    expected_size=expected_size,
+                    expected_hash=expected_hash,
+                    enable_logger=enable_logger
                 )
 
                 progress_bar.total = progress_bar.n
@@ -104,3 +1440,285 @@ class DownloadUtilities:
                 ).exception(exception_handle)
 
             raise
+
+    @staticmethod
+    async def download_multiple_async(
+            urls: Iterable[str],
+            output_directory_path: str,
+            maximum_number_of_concurrent_downloads: int = 4,
+            description_message: str = None,
+            number_of_segments: int = DEFAULT_NUMBER_OF_SEGMENTS,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            cache_directory_path: str = None,
+            expected_file_integrity: Dict[str, Dict[str, Union[int, str]]] = None,
+            enable_logger: bool = False
+    ) -> Dict[str, str]:
+        """
+        Asynchronously download the contents from multiple URL strings on the event loop of the shared download engine,
+        and visualize the aggregated progress with a progress bar. The downloads of all concurrent calls share the total
+        and per host limits of the download engine, so the downloads of multiple data sources can be awaited together,
+        for example with the 'asyncio.gather' function. The per host limit counts the parallel byte range connections of
+        the downloads as well, so the segments of a download are only downloaded in parallel while slots are available.
+        Only the scheduling is asynchronous: each download runs the blocking '_download_file' method in a thread of the
+        download engine, so at most 64 downloads run at once across all calls, and each parallel byte range occupies one
+        more thread.
+
+        :parameter urls: The URL strings.
+        :parameter output_directory_path: The path to the directory where the downloaded URL contents should be stored.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of downloads of the call that should
+                                                           run at once.
+        :parameter description_message: The progress bar description message.
+        :parameter number_of_segments: The maximum number of byte ranges of large contents that should be downloaded in
+                                       parallel per download. It is ignored if the server does not support byte range
+                                       requests, or for the URL strings whose expected hash is known.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried. The retry
+                                              continues from the bytes already stored in the partial file.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter cache_directory_path: The path to the directory of the download cache that should be utilized. If
+                                         None, the 'CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH' environment
+                                         variable is utilized, and no cache is utilized if it is not set either.
+        :parameter expected_file_integrity: The expected 'size' in bytes and 'hash' in the '<algorithm>:<hexadecimal
+                                            digest>' format of the contents of the URL strings. The URL strings that are
+                                            missing, and the missing keys, are not verified.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The path to the downloaded file of each URL string.
+        """
+
+        try:
+            urls = list(urls)
+
+            download_cache = DownloadUtilities._get_download_cache(
+                cache_directory_path=cache_directory_path,
+                enable_logger=enable_logger
+            )
+
+            expected_file_integrity = expected_file_integrity if expected_file_integrity is not None else dict()
+
+            download_engine = DownloadUtilities.get_download_engine()
+
+            with _DownloadUtilitiesTqdm(
+                unit="B",
+                unit_scale=True,
+                miniters=1,
+                ascii=True,
+                ncols=150,
+                desc="{0}".format(
+                    description_message if description_message is not None else "Downloading {0} file(s)".format(
+                        len(urls)
+                    )
+                )
+            ) as progress_bar:
+                output_file_paths = await download_engine.transfer_multiple(
+                    transfers=[
+                        (url, partial(
+                            DownloadUtilities._download_file,
+                            url=url,
+                            output_file_path=join(output_directory_path, basename(url)),
+                            number_of_segments=number_of_segments,
+                            maximum_number_of_retries=maximum_number_of_retries,
+                            retry_backoff_factor=retry_backoff_factor,
+                            progress_bar=progress_bar,
+                            download_cache=download_cache,
+                            expected_size=expected_file_integrity.get(url, dict()).get("size"),
+                            expected_hash=expected_file_integrity.get(url, dict()).get("hash"),
+                            download_engine=download_engine,
+                            enable_logger=enable_logger
+                        )) for url in urls
+                    ],
+                    maximum_number_of_concurrent_transfers=maximum_number_of_concurrent_downloads
+                )
+
+                progress_bar.total = progress_bar.n
+
+            if enable_logger:
+                download_session_statistics = DownloadUtilities.get_download_session().get_statistics()
+
+                getLogger(__name__).info(
+                    "The download session has sent {0} request(s) over {1} opened connection(s), and reused an idle "
+                    "connection {2} time(s).".format(
+                        download_session_statistics["number_of_requests"],
+                        download_session_statistics["number_of_opened_connections"],
+                        download_session_statistics["number_of_reused_connections"]
+                    )
+                )
+
+            return dict(zip(urls, output_file_paths))
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.DownloadUtilities.download_multiple_async".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_multiple_with_progress_bar(
+            urls: List[str],
+            output_directory_path: str,
+            maximum_number_of_concurrent_downloads: int = 4,
+            description_message: str = None,
+            number_of_segments: int = DEFAULT_NUMBER_OF_SEGMENTS,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            cache_directory_path: str = None,
+            expected_file_integrity: Dict[str, Dict[str, Union[int, str]]] = None,
+            enable_logger: bool = False
+    ) -> Dict[str, str]:
+        """
+        Concurrently download the contents from multiple URL strings, and visualize the aggregated progress with a
+        progress bar. It is the synchronous wrapper of the 'download_multiple_async' method, so it can be called from
+        any thread, and the downloads of the concurrent calls share the limits of the download engine.
+
+        :parameter urls: The URL strings.
+        :parameter output_directory_path: The path to the directory where the downloaded URL contents should be stored.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of downloads that should run at once.
+        :parameter description_message: The progress bar description message.
+        :parameter number_of_segments: The maximum number of byte ranges of large contents that should be downloaded in
+                                       parallel per download. It is ignored if the server does not support byte range
+                                       requests, or for the URL strings whose expected hash is known.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried. The retry
+                                              continues from the bytes already stored in the partial file.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter cache_directory_path: The path to the directory of the download cache that should be utilized. If
+                                         None, the 'CHEMICAL_REACTION_DATA_DOWNLOAD_CACHE_DIRECTORY_PATH' environment
+                                         variable is utilized, and no cache is utilized if it is not set either.
+        :parameter expected_file_integrity: The expected 'size' in bytes and 'hash' in the '<algorithm>:<hexadecimal
+                                            digest>' format of the contents of the URL strings. The URL strings that are
+                                            missing, and the missing keys, are not verified.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The path to the downloaded file of each URL string.
+        """
+
+        try:
+            return DownloadUtilities.get_download_engine().run(
+                DownloadUtilities.download_multiple_async(
+                    urls=urls,
+                    output_directory_path=output_directory_path,
+                    maximum_number_of_concurrent_downloads=maximum_number_of_concurrent_downloads,
+                    description_message=description_message,
+                    number_of_segments=number_of_segments,
+                    maximum_number_of_retries=maximum_number_of_retries,
+                    retry_backoff_factor=retry_backoff_factor,
+                    cache_directory_path=cache_directory_path,
+                    expected_file_integrity=expected_file_integrity,
+                    enable_logger=enable_logger
+                )
+            )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.DownloadUtilities.download_multiple_with_progress_bar".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def download_and_extract_tar_gz_archive_with_progress_bar(
+            url: str,
+            output_directory_path: str,
+            archive_file_content_base_paths: Iterable[str] = None,
+            description_message: str = None,
+            maximum_number_of_retries: int = DEFAULT_MAXIMUM_NUMBER_OF_RETRIES,
+            retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+            expected_size: int = None,
+            expected_hash: str = None,
+            enable_logger: bool = False
+    ) -> List[str]:
+        """
+        Download a '.tar.gz' archive file from a URL string and extract its contents while it is transferred, and
+        visualize the progress with a progress bar. The body of the HTTP response is decompressed as it arrives and only
+        the requested archive file contents are written, so the archive file itself is never stored. A failed attempt
+        is retried from the start of the archive file, because a compressed stream cannot be continued mid-way.
+
+        :parameter url: The URL string.
+        :parameter output_directory_path: The path to the directory where the extracted archive file contents should be
+                                          stored.
+        :parameter archive_file_content_base_paths: The base paths of the archive file contents that should be
+                                                    extracted.
+        :parameter description_message: The progress bar description message.
+        :parameter maximum_number_of_retries: The maximum number of times a failed attempt should be retried.
+        :parameter retry_backoff_factor: The number of seconds to wait before the first retry, which is doubled for each
+                                         subsequent retry.
+        :parameter expected_size: The expected size of the archive file in bytes, or None if it should not be verified.
+        :parameter expected_hash: The expected hash of the archive file in the '<algorithm>:<hexadecimal digest>'
+                                  format, or None if it should not be verified. The extracted archive file contents are
+                                  kept even if the verification fails, because they are written before the end of the
+                                  archive file is received.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The paths of the extracted archive file contents.
+        """
+
+        def download_and_extract(
+                progress_bar: _DownloadUtilitiesTqdm
+        ) -> Tuple[List[str], int, Dict[str, str]]:
+            with DownloadUtilities.get_download_session().request(url=url) as response:
+                response_stream = _DownloadUtilitiesResponseStream(
+                    response=response,
+                    progress_bar=progress_bar,
+                    algorithm_names=algorithm_names
+                )
+
+                progress_bar.reset(total=response_stream.expected_size)
+
+                extracted_archive_file_content_paths = ArchiveExtractionUtilities.extract_from_tar_gz_stream(
+                    archive_file_stream=response_stream,
+                    output_directory_path=output_directory_path,
+                    archive_file_content_base_paths=archive_file_content_base_paths
+                )
+
+                response_stream.drain()
+
+            return extracted_archive_file_content_paths, response_stream.transferred_size, response_stream.get_digests()
+
+        try:
+            algorithm_names = (DownloadUtilities._parse_expected_hash(expected_hash)[0], ) \
+                if expected_hash is not None else ()
+
+            archive_file_content_base_paths = list(archive_file_content_base_paths) \
+                if archive_file_content_base_paths is not None else None
+
+            with _DownloadUtilitiesTqdm(
+                unit="B",
+                unit_scale=True,
+                miniters=1,
+                ascii=True,
+                ncols=150,
+                desc="{0}".format(
+                    description_message if description_message is not None else "Downloading and extracting"
+                )
+            ) as progress_bar:
+                extracted_archive_file_content_paths, transferred_size, digests = DownloadUtilities._run_with_retries(
+                    url=url,
+                    attempt_procedure=partial(download_and_extract, progress_bar),
+                    maximum_number_of_retries=maximum_number_of_retries,
+                    retry_backoff_factor=retry_backoff_factor,
+                    enable_logger=enable_logger
+                )
+
+                progress_bar.total = progress_bar.n
+
+            DownloadUtilities._verify_integrity(
+                url=url,
+                size=transferred_size,
+                digests=digests,
+                expected_size=expected_size,
+                expected_hash=expected_hash
+            )
+
+            return extracted_archive_file_content_paths
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.DownloadUtilities.download_and_extract_tar_gz_archive_with_progress_bar".format(__name__)
+                ).exception(exception_handle)
+
+            raise
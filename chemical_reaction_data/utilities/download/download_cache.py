@@ -0,0 +1,398 @@
+""" The 'chemical_reaction_data.utilities.download' package 'download_cache' module. """
+
+from hashlib import sha1, sha256
+from json import dump, load
+from logging import getLogger
+from os import chmod, getpid, link, makedirs, remove, replace
+from shutil import copyfile
+from threading import get_ident
+from typing import Any, Dict, Optional
+
+from os.path import abspath, exists, getsize, join, samefile
+
+
+class DownloadCache:
+    """
+    The download cache class. The contents of the downloaded files are stored once per content hash, and the entry of
+    each URL string records the content hash and the validators of the server. The cached contents are cloned to the
+    output files if the file system supports reflinks, and hard-linked or copied otherwise, so the cache can be shared
+    by multiple datasets and users of the same machine. The cached contents are read-only, so an output file that is
+    hard-linked to them cannot be modified in place, which would corrupt the cached contents.
+    """
+
+    OBJECTS_DIRECTORY_NAME = "objects"
+
+    ENTRIES_DIRECTORY_NAME = "entries"
+
+    HASHING_BLOCK_SIZE = 1024 * 1024
+
+    OBJECT_FILE_MODE = 0o444
+
+    DEFAULT_DIRECTORY_MODE = 0o777
+
+    FILE_CLONE_IOCTL_REQUEST = 0x40049409
+
+    def __init__(
+            self,
+            cache_directory_path: str,
+            directory_mode: int = DEFAULT_DIRECTORY_MODE,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter cache_directory_path: The path to the directory where the cache should be stored.
+        :parameter directory_mode: The permissions of the directories of the cached contents and the entries, which are
+                                   set explicitly because the default umask would prevent the other users from adding
+                                   to a shared cache.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        self.__cache_directory_path = cache_directory_path
+        self.__directory_mode = directory_mode
+        self.__enable_logger = enable_logger
+
+        try:
+            self.__make_shared_directory(join(cache_directory_path, DownloadCache.OBJECTS_DIRECTORY_NAME))
+            self.__make_shared_directory(join(cache_directory_path, DownloadCache.ENTRIES_DIRECTORY_NAME))
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.DownloadCache.__init__".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def __make_shared_directory(
+            self,
+            directory_path: str
+    ) -> None:
+        """
+        Create a directory of the cache, and set its permissions. The permissions of a directory created by another
+        user are left unchanged.
+
+        :parameter directory_path: The path to the directory.
+        """
+
+        makedirs(directory_path, exist_ok=True)
+
+        try:
+            chmod(directory_path, self.__directory_mode)
+
+        except PermissionError:
+            pass
+
+    @staticmethod
+    def _get_temporary_file_path(
+            file_path: str
+    ) -> str:
+        """
+        Get the path to a temporary file next to a file, which is unique to the current process and thread.
+
+        :parameter file_path: The path to the file.
+
+        :returns: The path to the temporary file.
+        """
+
+        return "{0}.{1}.{2}.tmp".format(file_path, getpid(), get_ident())
+
+    @staticmethod
+    def get_content_hash(
+            file_path: str
+    ) -> str:
+        """
+        Get the SHA-256 content hash of a file.
+
+        :parameter file_path: The path to the file.
+
+        :returns: The hexadecimal SHA-256 content hash of the file.
+        """
+
+        content_hash = sha256()
+
+        with open(file_path, "rb") as file_handle:
+            for block in iter(lambda: file_handle.read(DownloadCache.HASHING_BLOCK_SIZE), b""):
+                content_hash.update(block)
+
+        return content_hash.hexdigest()
+
+    def get_object_file_path(
+            self,
+            content_hash: str
+    ) -> str:
+        """
+        Get the path to the cached contents with a content hash.
+
+        :parameter content_hash: The hexadecimal SHA-256 content hash.
+
+        :returns: The path to the cached contents.
+        """
+
+        return join(self.__cache_directory_path, DownloadCache.OBJECTS_DIRECTORY_NAME, content_hash[:2], content_hash)
+
+    def get_entry_file_path(
+            self,
+            url: str
+    ) -> str:
+        """
+        Get the path to the entry of a URL string.
+
+        :parameter url: The URL string.
+
+        :returns: The path to the entry of the URL string.
+        """
+
+        return join(
+            self.__cache_directory_path,
+            DownloadCache.ENTRIES_DIRECTORY_NAME,
+            sha1(url.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    def get_entry(
+            self,
+            url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry of a URL string.
+
+        :parameter url: The URL string.
+
+        :returns: The content hash, the size and the server validators of the cached contents of the URL string, or
+                  None if the contents are not cached.
+        """
+
+        try:
+            try:
+                with open(self.get_entry_file_path(url), "r") as file_handle:
+                    entry = load(file_handle)
+
+            except (OSError, ValueError):
+                return None
+
+            if entry.get("url") != url or not exists(self.get_object_file_path(entry["content_hash"])):
+                return None
+
+            return entry
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadCache.get_entry".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def get_conditional_request_headers(
+            self,
+            url: str
+    ) -> Dict[str, str]:
+        """
+        Get the HTTP headers that make a request for a URL string conditional on the cached contents being outdated.
+
+        :parameter url: The URL string.
+
+        :returns: The conditional HTTP request headers, which are empty if the contents are not cached.
+        """
+
+        try:
+            entry = self.get_entry(url)
+
+            conditional_request_headers = dict()
+
+            if entry is not None and entry.get("etag") is not None:
+                conditional_request_headers["If-None-Match"] = entry["etag"]
+
+            if entry is not None and entry.get("last_modified") is not None:
+                conditional_request_headers["If-Modified-Since"] = entry["last_modified"]
+
+            return conditional_request_headers
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadCache.get_conditional_request_headers".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def _clone(
+            source_file_path: str,
+            destination_file_path: str
+    ) -> bool:
+        """
+        Clone a file to a destination as a copy-on-write reflink, which shares the data blocks of the source file until
+        either file is modified. It is supported by the 'FICLONE' request of Linux file systems like Btrfs and XFS.
+
+        :parameter source_file_path: The path to the source file.
+        :parameter destination_file_path: The path to the destination file.
+
+        :returns: The indicator whether the file was cloned.
+        """
+
+        try:
+            from fcntl import ioctl
+
+        except ImportError:
+            return False
+
+        try:
+            with open(source_file_path, "rb") as source_file_handle, \
+                    open(destination_file_path, "wb") as destination_file_handle:
+                ioctl(destination_file_handle.fileno(), DownloadCache.FILE_CLONE_IOCTL_REQUEST,
+                      source_file_handle.fileno())
+
+            return True
+
+        except OSError:
+            if exists(destination_file_path):
+                remove(destination_file_path)
+
+            return False
+
+    @staticmethod
+    def _transfer_file(
+            source_file_path: str,
+            destination_file_path: str,
+            allow_link: bool = True
+    ) -> str:
+        """
+        Atomically transfer a file to a destination without copying its contents where possible. The file is cloned if
+        the file system supports reflinks, hard-linked if it is allowed and both files are on the same file system, and
+        copied otherwise, which the 'shutil.copyfile' function performs in the kernel where the platform supports it.
+
+        :parameter source_file_path: The path to the source file.
+        :parameter destination_file_path: The path to the destination file.
+        :parameter allow_link: The indicator whether the file may be hard-linked, so both paths share the same contents.
+
+        :returns: The method of the transfer, which is 'clone', 'link' or 'copy'.
+        """
+
+        temporary_file_path = DownloadCache._get_temporary_file_path(destination_file_path)
+
+        try:
+            transfer_method = "clone" if DownloadCache._clone(source_file_path, temporary_file_path) else None
+
+            if transfer_method is None and allow_link:
+                try:
+                    link(source_file_path, temporary_file_path)
+
+                    transfer_method = "link"
+
+                except OSError:
+                    pass
+
+            if transfer_method is None:
+                copyfile(source_file_path, temporary_file_path)
+
+                transfer_method = "copy"
+
+            replace(temporary_file_path, destination_file_path)
+
+            return transfer_method
+
+        except BaseException:
+            if exists(temporary_file_path):
+                remove(temporary_file_path)
+
+            raise
+
+    def store(
+            self,
+            url: str,
+            file_path: str,
+            etag: str = None,
+            last_modified: str = None,
+            content_hash: str = None
+    ) -> Dict[str, Any]:
+        """
+        Store the downloaded contents of a URL string in the cache.
+
+        :parameter url: The URL string.
+        :parameter file_path: The path to the downloaded file.
+        :parameter etag: The value of the HTTP 'ETag' header of the response.
+        :parameter last_modified: The value of the HTTP 'Last-Modified' header of the response.
+        :parameter content_hash: The hexadecimal SHA-256 content hash of the file, if it is already known.
+
+        :returns: The entry of the URL string.
+        """
+
+        try:
+            content_hash = content_hash if content_hash is not None else DownloadCache.get_content_hash(file_path)
+            object_file_path = self.get_object_file_path(content_hash)
+
+            if not exists(object_file_path):
+                self.__make_shared_directory(
+                    join(self.__cache_directory_path, DownloadCache.OBJECTS_DIRECTORY_NAME, content_hash[:2])
+                )
+
+                DownloadCache._transfer_file(file_path, object_file_path)
+
+                chmod(object_file_path, DownloadCache.OBJECT_FILE_MODE)
+
+            entry = {
+                "url": url,
+                "content_hash": content_hash,
+                "size": getsize(file_path),
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+
+            entry_file_path = self.get_entry_file_path(url)
+            temporary_entry_file_path = DownloadCache._get_temporary_file_path(entry_file_path)
+
+            with open(temporary_entry_file_path, "w") as file_handle:
+                dump(entry, file_handle)
+
+            replace(temporary_entry_file_path, entry_file_path)
+
+            return entry
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadCache.store".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def restore(
+            self,
+            url: str,
+            output_file_path: str
+    ) -> bool:
+        """
+        Restore the cached contents of a URL string to an output file.
+
+        :parameter url: The URL string.
+        :parameter output_file_path: The path to the output file.
+
+        :returns: The indicator whether the contents of the URL string were cached and restored.
+        """
+
+        try:
+            entry = self.get_entry(url)
+
+            if entry is None:
+                return False
+
+            object_file_path = self.get_object_file_path(entry["content_hash"])
+
+            if not (exists(output_file_path) and samefile(object_file_path, output_file_path)):
+                DownloadCache._transfer_file(object_file_path, output_file_path)
+
+            if self.__enable_logger:
+                getLogger(__name__).info(
+                    "Restored '{0}' from the download cache at '{1}'.".format(url, abspath(self.__cache_directory_path))
+                )
+
+            return True
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadCache.restore".format(__name__)
+                ).exception(exception_handle)
+
+            raise
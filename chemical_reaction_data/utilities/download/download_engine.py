@@ -0,0 +1,436 @@
+""" The 'chemical_reaction_data.utilities.download' package 'download_engine' module. """
+
+from asyncio import (
+    AbstractEventLoop,
+    gather,
+    get_running_loop,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    Semaphore,
+    wrap_future,
+)
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from os import getpid
+from threading import current_thread, Lock, Thread
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from urllib.parse import urlsplit
+
+
+class DownloadEngine:
+    """
+    The download engine class. The transfers are scheduled on a single event loop, which runs in a background thread,
+    and are limited in total and per host, so the engine can be awaited from any event loop and utilized from
+    synchronous code alike. The event loop only schedules the transfers: the transfer procedures perform blocking I/O,
+    and each running transfer occupies one thread of a thread pool executor for its whole duration. The total limit is
+    therefore also the number of transfer threads, which is 64 by default, and the parallel byte ranges of a transfer
+    run in threads of their own. The per host limit counts connections: each transfer occupies one slot of its host,
+    and a running transfer that opens more connections, for example for parallel byte ranges, must acquire an
+    additional slot for each of them.
+    """
+
+    DEFAULT_MAXIMUM_NUMBER_OF_CONCURRENT_TRANSFERS = 64
+
+    DEFAULT_MAXIMUM_NUMBER_OF_CONCURRENT_HOST_TRANSFERS = 4
+
+    def __init__(
+            self,
+            maximum_number_of_concurrent_transfers: int = DEFAULT_MAXIMUM_NUMBER_OF_CONCURRENT_TRANSFERS,
+            maximum_number_of_concurrent_transfers_per_host: int = DEFAULT_MAXIMUM_NUMBER_OF_CONCURRENT_HOST_TRANSFERS,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter maximum_number_of_concurrent_transfers: The maximum number of transfers that should run at once,
+                                                           which is also the number of threads of the transfers.
+        :parameter maximum_number_of_concurrent_transfers_per_host: The maximum number of transfers from the same host
+                                                                    that should run at once.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        self.__maximum_number_of_concurrent_transfers = max(maximum_number_of_concurrent_transfers, 1)
+        self.__maximum_number_of_concurrent_transfers_per_host = max(maximum_number_of_concurrent_transfers_per_host, 1)
+        self.__enable_logger = enable_logger
+        self.__process_id = getpid()
+        self.__event_loop: Optional[AbstractEventLoop] = None
+        self.__event_loop_thread: Optional[Thread] = None
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__host_semaphores: Dict[str, Semaphore] = dict()
+        self.__lock = Lock()
+
+    def __enter__(
+            self
+    ) -> "DownloadEngine":
+        """ The context manager entry method of the class. """
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception_value: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """ The context manager exit method of the class. """
+
+        self.close()
+
+    @property
+    def process_id(
+            self
+    ) -> int:
+        """
+        Get the ID of the process that created the download engine. The event loop thread is not inherited by forked
+        processes, so they must create their own download engine.
+
+        :returns: The ID of the process that created the download engine.
+        """
+
+        return self.__process_id
+
+    def __get_event_loop(
+            self
+    ) -> AbstractEventLoop:
+        """
+        Get the event loop of the download engine, and start it in a background thread if it is not running yet.
+
+        :returns: The event loop of the download engine.
+        """
+
+        with self.__lock:
+            if self.__event_loop is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__maximum_number_of_concurrent_transfers,
+                    thread_name_prefix="DownloadEngineTransfer"
+                )
+
+                self.__event_loop = new_event_loop()
+                self.__event_loop.set_default_executor(self.__executor)
+
+                self.__event_loop_thread = Thread(
+                    target=self.__event_loop.run_forever,
+                    name="DownloadEngineEventLoop",
+                    daemon=True
+                )
+
+                self.__event_loop_thread.start()
+
+            return self.__event_loop
+
+    def __get_host_semaphore(
+            self,
+            url: str
+    ) -> Semaphore:
+        """
+        Get the semaphore of the host of a URL string, which must be called from the event loop of the download engine.
+
+        :parameter url: The URL string.
+
+        :returns: The semaphore of the host.
+        """
+
+        return self.__host_semaphores.setdefault(
+            urlsplit(url).netloc,
+            Semaphore(self.__maximum_number_of_concurrent_transfers_per_host)
+        )
+
+    async def __submit(
+            self,
+            awaitable: Awaitable[Any]
+    ) -> Any:
+        """
+        Await an awaitable on the event loop of the download engine, from any event loop.
+
+        :parameter awaitable: The awaitable.
+
+        :returns: The output of the awaitable.
+        """
+
+        event_loop = self.__get_event_loop()
+
+        if get_running_loop() is event_loop:
+            return await awaitable
+
+        return await wrap_future(run_coroutine_threadsafe(awaitable, event_loop))
+
+    async def __transfer(
+            self,
+            url: str,
+            transfer_procedure: Callable[[], Any],
+            call_semaphore: Optional[Semaphore] = None
+    ) -> Any:
+        """
+        Run a blocking transfer procedure on the event loop of the download engine once the limits allow it.
+
+        :parameter url: The URL string of the transfer, which determines the host limit.
+        :parameter transfer_procedure: The blocking transfer procedure.
+        :parameter call_semaphore: The semaphore of the limit of the call that scheduled the transfer, if any.
+
+        :returns: The output of the transfer procedure.
+        """
+
+        host_semaphore = self.__get_host_semaphore(url)
+
+        if call_semaphore is not None:
+            await call_semaphore.acquire()
+
+        try:
+            async with host_semaphore:
+                return await get_running_loop().run_in_executor(self.__executor, transfer_procedure)
+
+        finally:
+            if call_semaphore is not None:
+                call_semaphore.release()
+
+    async def transfer(
+            self,
+            url: str,
+            transfer_procedure: Callable[[], Any]
+    ) -> Any:
+        """
+        Run a blocking transfer procedure of a URL string once the total and per host limits allow it.
+
+        :parameter url: The URL string of the transfer, which determines the host limit.
+        :parameter transfer_procedure: The blocking transfer procedure.
+
+        :returns: The output of the transfer procedure.
+        """
+
+        try:
+            return await self.__submit(self.__transfer(url, transfer_procedure))
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.transfer".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    async def __transfer_multiple(
+            self,
+            transfers: List[Tuple[str, Callable[[], Any]]],
+            maximum_number_of_concurrent_transfers: Optional[int]
+    ) -> List[Any]:
+        """
+        Run multiple blocking transfer procedures on the event loop of the download engine.
+
+        :parameter transfers: The URL string and the blocking transfer procedure of each transfer.
+        :parameter maximum_number_of_concurrent_transfers: The maximum number of the transfers that should run at once,
+                                                           in addition to the limits of the download engine.
+
+        :returns: The output of each transfer procedure.
+        """
+
+        call_semaphore = Semaphore(max(maximum_number_of_concurrent_transfers, 1)) \
+            if maximum_number_of_concurrent_transfers is not None else None
+
+        transfer_outputs = await gather(*[
+            self.__transfer(url, transfer_procedure, call_semaphore) for url, transfer_procedure in transfers
+        ], return_exceptions=True)
+
+        for transfer_output in transfer_outputs:
+            if isinstance(transfer_output, BaseException):
+                raise transfer_output
+
+        return transfer_outputs
+
+    async def transfer_multiple(
+            self,
+            transfers: Iterable[Tuple[str, Callable[[], Any]]],
+            maximum_number_of_concurrent_transfers: int = None
+    ) -> List[Any]:
+        """
+        Run multiple blocking transfer procedures once the total and per host limits allow it. All transfers are
+        awaited before the first exception, if any, is raised.
+
+        :parameter transfers: The URL string and the blocking transfer procedure of each transfer.
+        :parameter maximum_number_of_concurrent_transfers: The maximum number of the transfers that should run at once,
+                                                           in addition to the limits of the download engine.
+
+        :returns: The output of each transfer procedure.
+        """
+
+        try:
+            return await self.__submit(self.__transfer_multiple(
+                list(transfers),
+                maximum_number_of_concurrent_transfers
+            ))
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.transfer_multiple".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    async def __acquire_available_host_slots(
+            self,
+            url: str,
+            maximum_number_of_slots: int
+    ) -> int:
+        """
+        Acquire up to a number of the slots of the host of a URL string that are available without waiting.
+
+        :parameter url: The URL string.
+        :parameter maximum_number_of_slots: The maximum number of slots that should be acquired.
+
+        :returns: The number of acquired slots.
+        """
+
+        host_semaphore, number_of_slots = self.__get_host_semaphore(url), 0
+
+        while number_of_slots < maximum_number_of_slots and not host_semaphore.locked():
+            await host_semaphore.acquire()
+
+            number_of_slots += 1
+
+        return number_of_slots
+
+    def __release_host_slots(
+            self,
+            url: str,
+            number_of_slots: int
+    ) -> None:
+        """
+        Release a number of the slots of the host of a URL string.
+
+        :parameter url: The URL string.
+        :parameter number_of_slots: The number of slots that should be released.
+        """
+
+        host_semaphore = self.__get_host_semaphore(url)
+
+        for _ in range(number_of_slots):
+            host_semaphore.release()
+
+    def acquire_additional_host_slots(
+            self,
+            url: str,
+            maximum_number_of_slots: int
+    ) -> int:
+        """
+        Acquire additional slots of the host of a URL string for the extra connections of a running transfer, without
+        waiting for the slots that are occupied or claimed by waiting transfers. It should be called from the transfer
+        procedure, and the acquired slots must be released with the 'release_additional_host_slots' method.
+
+        :parameter url: The URL string.
+        :parameter maximum_number_of_slots: The maximum number of additional slots that should be acquired.
+
+        :returns: The number of acquired additional slots, which can be zero.
+        """
+
+        try:
+            if maximum_number_of_slots <= 0:
+                return 0
+
+            event_loop = self.__get_event_loop()
+
+            if current_thread() is self.__event_loop_thread:
+                raise RuntimeError(
+                    "The additional host slots cannot be acquired from the thread of the event loop of the download "
+                    "engine."
+                )
+
+            return run_coroutine_threadsafe(
+                self.__acquire_available_host_slots(url, maximum_number_of_slots),
+                event_loop
+            ).result()
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.acquire_additional_host_slots".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def release_additional_host_slots(
+            self,
+            url: str,
+            number_of_slots: int
+    ) -> None:
+        """
+        Release the additional slots of the host of a URL string that were acquired for a running transfer.
+
+        :parameter url: The URL string.
+        :parameter number_of_slots: The number of additional slots that should be released.
+        """
+
+        try:
+            with self.__lock:
+                event_loop = self.__event_loop
+
+            if number_of_slots > 0 and event_loop is not None:
+                event_loop.call_soon_threadsafe(self.__release_host_slots, url, number_of_slots)
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.release_additional_host_slots".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def run(
+            self,
+            awaitable: Awaitable[Any]
+    ) -> Any:
+        """
+        Synchronously await an awaitable on the event loop of the download engine. It can be called from any thread,
+        including threads that run another event loop, except the event loop thread of the download engine.
+
+        :parameter awaitable: The awaitable.
+
+        :returns: The output of the awaitable.
+        """
+
+        try:
+            event_loop = self.__get_event_loop()
+
+            if current_thread() is self.__event_loop_thread:
+                raise RuntimeError(
+                    "The download engine cannot be run synchronously from the thread of its own event loop."
+                )
+
+            return run_coroutine_threadsafe(self.__submit(awaitable), event_loop).result()
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.run".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def close(
+            self
+    ) -> None:
+        """ Stop the event loop of the download engine, and shut down its thread pool executor. """
+
+        try:
+            with self.__lock:
+                event_loop, event_loop_thread, executor = self.__event_loop, self.__event_loop_thread, self.__executor
+
+                self.__event_loop, self.__event_loop_thread, self.__executor = None, None, None
+                self.__host_semaphores = dict()
+
+            if event_loop is not None:
+                event_loop.call_soon_threadsafe(event_loop.stop)
+                event_loop_thread.join()
+                event_loop.close()
+
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadEngine.close".format(__name__)
+                ).exception(exception_handle)
+
+            raise
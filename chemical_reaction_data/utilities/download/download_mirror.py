@@ -0,0 +1,192 @@
+""" The 'chemical_reaction_data.utilities.download' package 'download_mirror' module. """
+
+from json import load
+from logging import getLogger
+from os import environ
+from typing import Any, Dict, Optional
+
+from os.path import abspath, exists, expanduser, join
+from urllib.parse import urlsplit
+from urllib.request import pathname2url, url2pathname
+
+from .download_cache import DownloadCache
+
+
+class DownloadMirror:
+    """
+    The download mirror class. A mirror is a local directory tree, or a 'file://' URL of one, that stores the files of
+    the data sources under their '<host>/<URL path>' paths, which is the layout created by the 'wget --mirror' command.
+    The base URL strings of the download information are redirected to the mirror, so the data sources can be prepared
+    without internet access, and the mirrored files are cloned to the output files where possible.
+    """
+
+    MIRROR_ENVIRONMENT_VARIABLE = "CHEMICAL_REACTION_DATA_DOWNLOAD_MIRROR"
+
+    CONFIGURATION_FILE_PATH_ENVIRONMENT_VARIABLE = "CHEMICAL_REACTION_DATA_CONFIGURATION_FILE_PATH"
+
+    DEFAULT_CONFIGURATION_FILE_PATH = join("~", ".chemical_reaction_data.json")
+
+    CONFIGURATION_FILE_MIRROR_KEY = "download_mirror"
+
+    MIRRORED_URL_SCHEMES = ("http", "https", "ftp")
+
+    def __init__(
+            self,
+            mirror: str,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter mirror: The path to the directory of the mirror, or its 'file://' URL string.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        self.__mirror_directory_path = abspath(expanduser(
+            url2pathname(urlsplit(mirror).path) if urlsplit(mirror).scheme == "file" else mirror
+        ))
+
+        self.__enable_logger = enable_logger
+
+    @property
+    def mirror_directory_path(
+            self
+    ) -> str:
+        """
+        Get the path to the directory of the mirror.
+
+        :returns: The absolute path to the directory of the mirror.
+        """
+
+        return self.__mirror_directory_path
+
+    @staticmethod
+    def get_configured_download_mirror(
+            enable_logger: bool = False
+    ) -> Optional["DownloadMirror"]:
+        """
+        Get the mirror specified by the 'CHEMICAL_REACTION_DATA_DOWNLOAD_MIRROR' environment variable, or otherwise by
+        the 'download_mirror' key of the JSON configuration file. The configuration file is located at the path
+        specified by the 'CHEMICAL_REACTION_DATA_CONFIGURATION_FILE_PATH' environment variable, or at the
+        '~/.chemical_reaction_data.json' path by default.
+
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The configured mirror, or None if no mirror is configured.
+        """
+
+        try:
+            mirror = environ.get(DownloadMirror.MIRROR_ENVIRONMENT_VARIABLE) or None
+
+            if mirror is None:
+                configuration_file_path = expanduser(
+                    environ.get(DownloadMirror.CONFIGURATION_FILE_PATH_ENVIRONMENT_VARIABLE) or
+                    DownloadMirror.DEFAULT_CONFIGURATION_FILE_PATH
+                )
+
+                if exists(configuration_file_path):
+                    with open(configuration_file_path, "r") as file_handle:
+                        mirror = load(file_handle).get(DownloadMirror.CONFIGURATION_FILE_MIRROR_KEY) or None
+
+            return DownloadMirror(
+                mirror=mirror,
+                enable_logger=enable_logger
+            ) if mirror is not None else None
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.DownloadMirror.get_configured_download_mirror".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def get_mirror_url(
+            self,
+            url: str
+    ) -> str:
+        """
+        Get the 'file://' URL string of the mirrored contents of a URL string.
+
+        :parameter url: The URL string.
+
+        :returns: The 'file://' URL string of the mirrored contents, or the URL string itself if its scheme is not
+                  mirrored.
+        """
+
+        try:
+            split_url = urlsplit(url)
+
+            if split_url.scheme not in DownloadMirror.MIRRORED_URL_SCHEMES:
+                return url
+
+            return "file://" + pathname2url(join(self.__mirror_directory_path, split_url.netloc)) + split_url.path
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadMirror.get_mirror_url".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def resolve_download_information(
+            self,
+            download_information: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Redirect the base URL string of the download information of a data source to the mirror.
+
+        :parameter download_information: The download information of the data source.
+
+        :returns: The copy of the download information with the 'file://' URL string of the mirrored base URL string.
+        """
+
+        try:
+            resolved_download_information = dict(download_information)
+            resolved_download_information["base_url"] = self.get_mirror_url(download_information["base_url"])
+
+            if self.__enable_logger:
+                getLogger(__name__).debug(
+                    "Resolved '{0}' to the download mirror as '{1}'.".format(
+                        download_information["base_url"],
+                        resolved_download_information["base_url"]
+                    )
+                )
+
+            return resolved_download_information
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadMirror.resolve_download_information".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def transfer_file(
+            source_file_path: str,
+            destination_file_path: str,
+            allow_link: bool = False
+    ) -> str:
+        """
+        Atomically transfer a mirrored file to a destination without copying its contents where possible. The file is
+        cloned if the file system supports reflinks, and copied otherwise, which the 'shutil.copyfile' function performs
+        in the kernel where the platform supports it. A hard link would share the inode of the mirrored file, so writing
+        to or changing the permissions of the destination file would modify the mirror as well, and it is therefore
+        only created if it is explicitly allowed.
+
+        :parameter source_file_path: The path to the source file.
+        :parameter destination_file_path: The path to the destination file.
+        :parameter allow_link: The indicator whether the file may be hard-linked if it cannot be cloned and both files
+                               are on the same file system.
+
+        :returns: The method of the transfer, which is 'clone', 'link' or 'copy'.
+        """
+
+        return DownloadCache._transfer_file(
+            source_file_path=source_file_path,
+            destination_file_path=destination_file_path,
+            allow_link=allow_link
+        )
@@ -0,0 +1,505 @@
+""" The 'chemical_reaction_data.utilities.download' package 'download_session' module. """
+
+from io import BytesIO
+from logging import getLogger
+from os import getpid
+from ssl import create_default_context
+from threading import Lock
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from http.client import HTTPConnection, HTTPException, HTTPMessage, HTTPResponse, HTTPSConnection
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass, Request, urlopen
+
+
+class _DownloadSessionResponse:
+    """
+    The download session response class wrapper, which returns the persistent connection to the download session once
+    the body of the HTTP response is completely read and the response is closed.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            response: HTTPResponse,
+            release_connection: Optional[Callable[[bool], None]] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter url: The URL string of the response.
+        :parameter response: The HTTP response.
+        :parameter release_connection: The procedure that returns the connection to the download session, which accepts
+                                       the indicator whether the connection can be reused, or None if the response does
+                                       not utilize a persistent connection.
+        """
+
+        self.__url = url
+        self.__response = response
+        self.__release_connection = release_connection
+
+    def __enter__(
+            self
+    ) -> "_DownloadSessionResponse":
+        """ The context manager entry method of the class. """
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception_value: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """ The context manager exit method of the class. """
+
+        self.close()
+
+    @property
+    def url(
+            self
+    ) -> str:
+        """
+        Get the URL string of the response, which differs from the requested URL string if it was redirected.
+
+        :returns: The URL string of the response.
+        """
+
+        return self.__url
+
+    @property
+    def status(
+            self
+    ) -> int:
+        """
+        Get the HTTP status code of the response.
+
+        :returns: The HTTP status code of the response.
+        """
+
+        return self.__response.status
+
+    @property
+    def reason(
+            self
+    ) -> str:
+        """
+        Get the HTTP reason phrase of the response.
+
+        :returns: The HTTP reason phrase of the response.
+        """
+
+        return self.__response.reason
+
+    @property
+    def headers(
+            self
+    ) -> HTTPMessage:
+        """
+        Get the HTTP headers of the response.
+
+        :returns: The HTTP headers of the response.
+        """
+
+        return self.__response.headers
+
+    def read(
+            self,
+            size: int = -1
+    ) -> bytes:
+        """
+        Read a block of the body of the response.
+
+        :parameter size: The maximum size of the block in bytes, or a negative value if the rest of the body should be
+                         read.
+
+        :returns: The block, which is empty at the end of the body.
+        """
+
+        return self.__response.read(size) if size is not None and size >= 0 else self.__response.read()
+
+    def close(
+            self
+    ) -> None:
+        """ Close the response, and return the persistent connection to the download session if it can be reused. """
+
+        if not self.__response.isclosed() and self.__response.length == 0:
+            self.__response.read()
+
+        is_reusable = self.__response.isclosed() and not self.__response.will_close
+
+        self.__response.close()
+
+        if self.__release_connection is not None:
+            self.__release_connection(is_reusable)
+
+            self.__release_connection = None
+
+
+class DownloadSession:
+    """
+    The download session class. The HTTP and HTTPS connections are kept alive and pooled per host, so consecutive and
+    concurrent requests to the same host reuse the established TCP connections and TLS sessions. Requests that are
+    routed through a proxy or use other URL schemes are delegated to the 'urllib.request.urlopen' function. The
+    connections time out by default, so an unresponsive server fails the request, which can then be retried, instead of
+    blocking the download indefinitely.
+    """
+
+    DEFAULT_CONNECT_TIMEOUT = 30.0
+
+    DEFAULT_READ_TIMEOUT = 60.0
+
+    MAXIMUM_NUMBER_OF_REDIRECTS = 10
+
+    REDIRECT_HTTP_STATUS_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(
+            self,
+            maximum_number_of_idle_connections_per_host: int = 16,
+            connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+            read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter maximum_number_of_idle_connections_per_host: The maximum number of idle connections per host that
+                                                                should be kept alive for reuse.
+        :parameter connect_timeout: The timeout of establishing a connection, including the TLS handshake, in seconds,
+                                    or None if it should never time out.
+        :parameter read_timeout: The timeout of each read from an established connection in seconds, or None if it
+                                 should never time out. The requests that are delegated to the 'urllib.request.urlopen'
+                                 function utilize it as their only timeout.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        self.__maximum_number_of_idle_connections_per_host = maximum_number_of_idle_connections_per_host
+        self.__connect_timeout = connect_timeout
+        self.__read_timeout = read_timeout
+        self.__enable_logger = enable_logger
+        self.__process_id = getpid()
+        self.__ssl_context = None
+        self.__idle_connections = dict()
+        self.__statistics = dict()
+        self.__lock = Lock()
+
+    def __enter__(
+            self
+    ) -> "DownloadSession":
+        """ The context manager entry method of the class. """
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception_value: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """ The context manager exit method of the class. """
+
+        self.close()
+
+    @property
+    def process_id(
+            self
+    ) -> int:
+        """
+        Get the ID of the process that created the download session. The pooled connections must not be utilized by
+        other processes, for example by forked worker processes.
+
+        :returns: The ID of the process that created the download session.
+        """
+
+        return self.__process_id
+
+    def __get_host_statistics(
+            self,
+            connection_key: Tuple[str, str, int]
+    ) -> Dict[str, int]:
+        """
+        Get the connection statistics of a host, which must be called while the lock is held.
+
+        :parameter connection_key: The URL scheme, the host name and the port of the host.
+
+        :returns: The connection statistics of the host.
+        """
+
+        return self.__statistics.setdefault("{0}://{1}:{2}".format(*connection_key), {
+            "number_of_requests": 0,
+            "number_of_opened_connections": 0,
+            "number_of_reused_connections": 0,
+            "number_of_discarded_connections": 0,
+        })
+
+    def __acquire_connection(
+            self,
+            connection_key: Tuple[str, str, int]
+    ) -> Tuple[HTTPConnection, bool]:
+        """
+        Acquire an idle connection to a host, or open a new one.
+
+        :parameter connection_key: The URL scheme, the host name and the port of the host.
+
+        :returns: The connection, and the indicator whether it is a reused idle connection.
+        """
+
+        with self.__lock:
+            host_statistics = self.__get_host_statistics(connection_key)
+            host_statistics["number_of_requests"] += 1
+
+            idle_connections = self.__idle_connections.get(connection_key, list())
+
+            if len(idle_connections) > 0:
+                host_statistics["number_of_reused_connections"] += 1
+
+                return idle_connections.pop(), True
+
+            host_statistics["number_of_opened_connections"] += 1
+
+            if connection_key[0] == "https" and self.__ssl_context is None:
+                self.__ssl_context = create_default_context()
+
+        if connection_key[0] == "https":
+            return HTTPSConnection(
+                connection_key[1],
+                connection_key[2],
+                timeout=self.__connect_timeout,
+                context=self.__ssl_context
+            ), False
+
+        return HTTPConnection(connection_key[1], connection_key[2], timeout=self.__connect_timeout), False
+
+    def __release_connection(
+            self,
+            connection_key: Tuple[str, str, int],
+            connection: HTTPConnection,
+            is_reusable: bool
+    ) -> None:
+        """
+        Return a connection to the pool of idle connections of a host, or close it if it cannot be reused.
+
+        :parameter connection_key: The URL scheme, the host name and the port of the host.
+        :parameter connection: The connection.
+        :parameter is_reusable: The indicator whether the connection can be reused.
+        """
+
+        with self.__lock:
+            idle_connections = self.__idle_connections.setdefault(connection_key, list())
+
+            if is_reusable and getpid() == self.__process_id and \
+                    len(idle_connections) < self.__maximum_number_of_idle_connections_per_host:
+                idle_connections.append(connection)
+
+                return
+
+            self.__get_host_statistics(connection_key)["number_of_discarded_connections"] += 1
+
+        connection.close()
+
+    def __send(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            method: str
+    ) -> _DownloadSessionResponse:
+        """
+        Send a single HTTP request over a persistent connection, without following redirects. If an idle connection
+        turns out to be closed by the server, the request is sent once more over a new connection.
+
+        :parameter url: The URL string.
+        :parameter headers: The HTTP request headers.
+        :parameter method: The HTTP request method.
+
+        :returns: The HTTP response.
+        """
+
+        split_url = urlsplit(url)
+
+        connection_key = (
+            split_url.scheme,
+            split_url.hostname,
+            split_url.port if split_url.port is not None else 443 if split_url.scheme == "https" else 80
+        )
+
+        request_path = split_url.path if split_url.path != "" else "/"
+        request_path += "?" + split_url.query if split_url.query != "" else ""
+
+        request_headers = {
+            "Host": split_url.netloc.rpartition("@")[2],
+            "User-Agent": "Python-urllib",
+            "Accept-Encoding": "identity",
+        }
+
+        request_headers.update(headers)
+
+        while True:
+            connection, is_reused = self.__acquire_connection(connection_key)
+
+            try:
+                connection.request(method, request_path, headers=request_headers)
+
+                if connection.sock is not None:
+                    connection.sock.settimeout(self.__read_timeout)
+
+                response = connection.getresponse()
+
+            except (HTTPException, ConnectionError) as exception_handle:
+                connection.close()
+
+                with self.__lock:
+                    self.__get_host_statistics(connection_key)["number_of_discarded_connections"] += 1
+
+                if is_reused:
+                    if self.__enable_logger:
+                        getLogger(__name__).debug(
+                            "Reopening the idle connection to '{0}', which was closed by the server: {1}".format(
+                                split_url.netloc,
+                                repr(exception_handle)
+                            )
+                        )
+
+                    continue
+
+                raise
+
+            except BaseException:
+                connection.close()
+
+                raise
+
+            return _DownloadSessionResponse(
+                url=url,
+                response=response,
+                release_connection=lambda is_reusable: self.__release_connection(
+                    connection_key,
+                    connection,
+                    is_reusable
+                )
+            )
+
+    def request(
+            self,
+            url: str,
+            headers: Dict[str, str] = None,
+            method: str = "GET"
+    ) -> Any:
+        """
+        Send an HTTP request, and follow the redirects. Like the 'urllib.request.urlopen' function, an HTTP status code
+        of 400 or above raises an 'urllib.error.HTTPError' exception.
+
+        :parameter url: The URL string.
+        :parameter headers: The HTTP request headers.
+        :parameter method: The HTTP request method.
+
+        :returns: The HTTP response, which should be closed after its body is read.
+        """
+
+        headers = dict(headers) if headers is not None else dict()
+
+        try:
+            for _ in range(DownloadSession.MAXIMUM_NUMBER_OF_REDIRECTS + 1):
+                split_url = urlsplit(url)
+
+                if split_url.scheme not in ("http", "https") or (
+                    split_url.scheme in getproxies() and not proxy_bypass(split_url.hostname)
+                ):
+                    return urlopen(Request(url=url, headers=headers, method=method), timeout=self.__read_timeout)
+
+                response = self.__send(url=url, headers=headers, method=method)
+
+                if response.status in DownloadSession.REDIRECT_HTTP_STATUS_CODES and \
+                        response.headers.get("Location") is not None:
+                    with response:
+                        response.read()
+
+                    url = urljoin(url, response.headers["Location"])
+                    method = "GET" if response.status == 303 and method != "HEAD" else method
+
+                    continue
+
+                if response.status >= 400:
+                    with response:
+                        body = response.read()
+
+                    raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(body))
+
+                return response
+
+            raise HTTPError(url, 310, "Too many redirects.", HTTPMessage(), BytesIO())
+
+        except Exception as exception_handle:
+            if self.__enable_logger and not isinstance(exception_handle, HTTPError):
+                getLogger(
+                    "{0}.DownloadSession.request".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def get_statistics(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the connection statistics of the download session.
+
+        :returns: The number of requests, and opened, reused and discarded connections in total and per host, and the
+                  number of idle connections.
+        """
+
+        try:
+            with self.__lock:
+                hosts = {host: dict(host_statistics) for host, host_statistics in self.__statistics.items()}
+
+                statistics = {
+                    statistic_name: sum(host_statistics[statistic_name] for host_statistics in hosts.values())
+                    for statistic_name in (
+                        "number_of_requests",
+                        "number_of_opened_connections",
+                        "number_of_reused_connections",
+                        "number_of_discarded_connections",
+                    )
+                }
+
+                statistics["number_of_idle_connections"] = sum(
+                    len(idle_connections) for idle_connections in self.__idle_connections.values()
+                )
+
+                statistics["hosts"] = hosts
+
+                return statistics
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadSession.get_statistics".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def close(
+            self
+    ) -> None:
+        """ Close the idle connections of the download session. """
+
+        try:
+            with self.__lock:
+                idle_connections: List[HTTPConnection] = [
+                    idle_connection
+                    for host_idle_connections in self.__idle_connections.values()
+                    for idle_connection in host_idle_connections
+                ]
+
+                self.__idle_connections.clear()
+
+            for idle_connection in idle_connections:
+                idle_connection.close()
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.DownloadSession.close".format(__name__)
+                ).exception(exception_handle)
+
+            raise
@@ -1,3 +1,9 @@
 """ The 'chemical_reaction_data.utilities.multiprocessing' package initialization module. """
 
+from .distributed import DistributedWorkerPool
+
+from .instrumentation import MultiprocessingInstrumentationUtilities
+
 from .multiprocessing import MultiprocessingUtilities
+
+from .pool_session import MultiprocessingPoolSession
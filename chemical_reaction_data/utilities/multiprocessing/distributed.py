@@ -0,0 +1,942 @@
+""" The 'chemical_reaction_data.utilities.multiprocessing' package 'distributed' module. """
+
+from collections import deque
+from ipaddress import ip_address
+from itertools import count, islice
+from logging import getLogger
+from multiprocessing import get_context
+from multiprocessing.managers import BaseManager, DictProxy
+from os import getpid
+from pickle import dumps, HIGHEST_PROTOCOL, loads
+from queue import Empty, Queue
+from secrets import token_hex
+from socket import gethostname
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+
+_distributed_queues = dict()
+
+_distributed_configuration = dict()
+
+_distributed_task_ledger = None
+
+_distributed_task_ledger_lock = Lock()
+
+
+def _get_distributed_queue(
+        queue_name: str
+) -> Queue:
+    """
+    Get a queue of the coordinator, and create it if it does not exist yet. It is run by the coordinator server process.
+
+    :parameter queue_name: The name of the queue.
+
+    :returns: The queue.
+    """
+
+    return _distributed_queues.setdefault(queue_name, Queue())
+
+
+def _get_distributed_configuration() -> Dict[str, Any]:
+    """
+    Get the configuration of the coordinator. It is run by the coordinator server process.
+
+    :returns: The configuration of the coordinator.
+    """
+
+    return _distributed_configuration
+
+
+class _DistributedTaskLedger:
+    """
+    The distributed task ledger class, which leases the tasks of the task queue to the worker processes, and returns the
+    leased tasks of the worker processes whose heartbeats expired to the task queue. It is run by the coordinator server
+    process, so a task is taken from the task queue and leased in a single step.
+    """
+
+    def __init__(
+            self,
+            task_queue: Queue,
+            result_queue: Queue
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter task_queue: The task queue.
+        :parameter result_queue: The result queue.
+        """
+
+        self.__task_queue = task_queue
+        self.__result_queue = result_queue
+
+        self.__leased_tasks = dict()
+        self.__worker_heartbeat_times = dict()
+        self.__lock = Lock()
+
+    def lease(
+            self,
+            worker_identifier: str
+    ) -> Optional[Tuple[int, bytes]]:
+        """
+        Wait for the next task of the task queue, and lease it to a worker process.
+
+        :parameter worker_identifier: The identifier of the worker process.
+
+        :returns: The identifier and the serialized procedure of the task, or None if the worker process should stop.
+        """
+
+        serialized_task = self.__task_queue.get()
+
+        if serialized_task is not None:
+            with self.__lock:
+                self.__leased_tasks[serialized_task[0]] = (worker_identifier, serialized_task)
+                self.__worker_heartbeat_times[worker_identifier] = monotonic()
+
+        return serialized_task
+
+    def renew(
+            self,
+            worker_identifier: str
+    ) -> None:
+        """
+        Record the heartbeat of a worker process, which renews the leases of its tasks.
+
+        :parameter worker_identifier: The identifier of the worker process.
+        """
+
+        with self.__lock:
+            self.__worker_heartbeat_times[worker_identifier] = monotonic()
+
+    def complete(
+            self,
+            task_identifier: int,
+            serialized_task_output: bytes
+    ) -> None:
+        """
+        Release the lease of a task, and put its serialized output on the result queue.
+
+        :parameter task_identifier: The identifier of the task.
+        :parameter serialized_task_output: The serialized output of the task.
+        """
+
+        with self.__lock:
+            self.__leased_tasks.pop(task_identifier, None)
+
+        self.__result_queue.put(serialized_task_output)
+
+    def requeue_expired_tasks(
+            self,
+            heartbeat_timeout: float
+    ) -> int:
+        """
+        Return the leased tasks of the worker processes whose last heartbeat is older than the timeout to the task
+        queue, and forget those worker processes.
+
+        :parameter heartbeat_timeout: The maximum number of seconds since the last heartbeat of a worker process.
+
+        :returns: The number of returned tasks.
+        """
+
+        with self.__lock:
+            expired_worker_identifiers = {
+                worker_identifier for worker_identifier, heartbeat_time in self.__worker_heartbeat_times.items()
+                if monotonic() - heartbeat_time > heartbeat_timeout
+            }
+
+            expired_tasks = [
+                (task_identifier, serialized_task)
+                for task_identifier, (worker_identifier, serialized_task) in self.__leased_tasks.items()
+                if worker_identifier in expired_worker_identifiers
+            ]
+
+            for task_identifier, _ in expired_tasks:
+                del self.__leased_tasks[task_identifier]
+
+            for worker_identifier in expired_worker_identifiers:
+                del self.__worker_heartbeat_times[worker_identifier]
+
+        for _, serialized_task in expired_tasks:
+            self.__task_queue.put(serialized_task)
+
+        return len(expired_tasks)
+
+
+def _get_distributed_task_ledger() -> _DistributedTaskLedger:
+    """
+    Get the task ledger of the coordinator, and create it if it does not exist yet. It is run by the coordinator server
+    process.
+
+    :returns: The task ledger.
+    """
+
+    global _distributed_task_ledger
+
+    with _distributed_task_ledger_lock:
+        if _distributed_task_ledger is None:
+            _distributed_task_ledger = _DistributedTaskLedger(
+                task_queue=_get_distributed_queue(DistributedWorkerPool.TASK_QUEUE_NAME),
+                result_queue=_get_distributed_queue(DistributedWorkerPool.RESULT_QUEUE_NAME)
+            )
+
+        return _distributed_task_ledger
+
+
+class DistributedQueueManager(BaseManager):
+    """ The distributed queue manager class. """
+
+
+DistributedQueueManager.register("get_queue", callable=_get_distributed_queue)
+
+DistributedQueueManager.register("get_configuration", callable=_get_distributed_configuration, proxytype=DictProxy)
+
+DistributedQueueManager.register("get_task_ledger", callable=_get_distributed_task_ledger)
+
+
+class DistributedAsyncResult:
+    """ The distributed asynchronous result class, which mirrors the 'multiprocessing.pool.AsyncResult' class. """
+
+    def __init__(
+            self,
+            callback: Callable[[Any], Any] = None,
+            error_callback: Callable[[BaseException], Any] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter callback: The procedure that should be run with the output of the task if it succeeds.
+        :parameter error_callback: The procedure that should be run with the exception of the task if it fails.
+        """
+
+        self.__callback = callback
+        self.__error_callback = error_callback
+
+        self.__event = Event()
+        self.__is_successful = None
+        self.__value = None
+
+    def _set(
+            self,
+            is_successful: bool,
+            value: Any
+    ) -> None:
+        """
+        Set the output or the exception of the task, and run the corresponding callback.
+
+        :parameter is_successful: The indicator whether the task succeeded.
+        :parameter value: The output of the task if it succeeded, or its exception otherwise.
+        """
+
+        self.__is_successful, self.__value = is_successful, value
+
+        if is_successful and self.__callback is not None:
+            self.__callback(value)
+
+        elif not is_successful and self.__error_callback is not None:
+            self.__error_callback(value)
+
+        self.__event.set()
+
+    def ready(
+            self
+    ) -> bool:
+        """
+        Get the indicator whether the task is completed.
+
+        :returns: The indicator whether the task is completed.
+        """
+
+        return self.__event.is_set()
+
+    def successful(
+            self
+    ) -> bool:
+        """
+        Get the indicator whether the task completed without raising an exception.
+
+        :returns: The indicator whether the task completed without raising an exception.
+        """
+
+        if not self.ready():
+            raise ValueError(
+                "The task is not completed yet."
+            )
+
+        return self.__is_successful
+
+    def wait(
+            self,
+            timeout: float = None
+    ) -> None:
+        """
+        Wait until the task is completed or the timeout elapses.
+
+        :parameter timeout: The maximum number of seconds to wait. If None, there is no limit.
+        """
+
+        self.__event.wait(timeout)
+
+    def get(
+            self,
+            timeout: float = None
+    ) -> Any:
+        """
+        Wait until the task is completed, and get its output.
+
+        :parameter timeout: The maximum number of seconds to wait. If None, there is no limit.
+
+        :returns: The output of the task. If the task failed, its exception is raised instead.
+        """
+
+        if not self.__event.wait(timeout):
+            raise TimeoutError(
+                "The task did not complete within {0} seconds.".format(timeout)
+            )
+
+        if not self.__is_successful:
+            raise self.__value
+
+        return self.__value
+
+
+class DistributedWorkerPool:
+    """
+    The distributed worker pool class, which mirrors the interface of the 'multiprocessing.pool.Pool' class. The
+    coordinator serves a task queue and a result queue over TCP, and the worker processes on any host connect to it and
+    run the tasks. The tasks and their outputs are serialized by the coordinator and the worker processes, so the
+    coordinator server process never needs to import the processing procedures.
+
+    Each task is leased to the worker process that takes it, and the worker process renews its leases with periodic
+    heartbeats. If a worker process dies or disconnects, its heartbeats stop, and its leased tasks are returned to the
+    task queue for the other worker processes once the heartbeat timeout elapses.
+    """
+
+    TASK_QUEUE_NAME = "tasks"
+
+    RESULT_QUEUE_NAME = "results"
+
+    DEFAULT_HEARTBEAT_INTERVAL = 5.0
+
+    DEFAULT_HEARTBEAT_TIMEOUT = 30.0
+
+    DEFAULT_MAXIMUM_NUMBER_OF_PENDING_CHUNKS = 256
+
+    def __init__(
+            self,
+            address: Tuple[str, int] = ("127.0.0.1", 0),
+            authentication_key: bytes = None,
+            number_of_local_workers: int = 0,
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            start_method: str = None,
+            heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+            heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT,
+            maximum_number_of_pending_chunks: int = DEFAULT_MAXIMUM_NUMBER_OF_PENDING_CHUNKS,
+            result_timeout: float = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter address: The host name and the port on which the coordinator should listen. If the port is 0, a
+                            free port is chosen.
+        :parameter authentication_key: The key that the worker processes have to present to connect to the coordinator.
+                                       If None, a random key is generated, which is only allowed if the coordinator
+                                       listens on a loopback address. The key is available as the
+                                       'authentication_key' property.
+        :parameter number_of_local_workers: The number of worker processes that should be started on the current host.
+        :parameter initializer: The procedure that should be run once per worker process before any tasks. It is sent
+                                to every worker process that connects to the coordinator.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter start_method: The method that should be utilized to start the local worker processes.
+        :parameter heartbeat_interval: The number of seconds between two consecutive heartbeats of a worker process,
+                                       which is also the interval of the checks for expired leases.
+        :parameter heartbeat_timeout: The number of seconds without a heartbeat after which the leased tasks of a worker
+                                      process are returned to the task queue.
+        :parameter maximum_number_of_pending_chunks: The maximum number of chunks of a 'map', 'imap' or
+                                                     'imap_unordered' call that are submitted but not yet consumed.
+        :parameter result_timeout: The maximum number of seconds to wait for the next output of a 'map', 'imap' or
+                                   'imap_unordered' call or for a pending task on 'join', after which a 'TimeoutError'
+                                   is raised. If None, there is no limit.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        if authentication_key is None:
+            if not DistributedWorkerPool._is_loopback_host(address[0]):
+                raise ValueError(
+                    "An explicit authentication key is required for the coordinator to listen on the non-loopback "
+                    "address '{0}'.".format(address[0])
+                )
+
+            authentication_key = DistributedWorkerPool.generate_authentication_key()
+
+        self.__authentication_key = authentication_key
+        self.__heartbeat_interval = heartbeat_interval
+        self.__heartbeat_timeout = heartbeat_timeout
+        self.__maximum_number_of_pending_chunks = max(maximum_number_of_pending_chunks, 1)
+        self.__result_timeout = result_timeout
+        self.__enable_logger = enable_logger
+
+        multiprocessing_context = get_context(start_method)
+
+        self.__queue_manager = DistributedQueueManager(
+            address=address,
+            authkey=authentication_key,
+            ctx=multiprocessing_context
+        )
+
+        self.__queue_manager.start()
+
+        self.__address = self.__queue_manager.address
+
+        self.__queue_manager.get_configuration().update({
+            "initializer": dumps((initializer, tuple(initializer_arguments)), protocol=HIGHEST_PROTOCOL),
+            "heartbeat_interval": heartbeat_interval,
+        })
+
+        self.__task_queue = self.__queue_manager.get_queue(DistributedWorkerPool.TASK_QUEUE_NAME)
+        self.__result_queue = self.__queue_manager.get_queue(DistributedWorkerPool.RESULT_QUEUE_NAME)
+        self.__task_ledger = self.__queue_manager.get_task_ledger()
+
+        self.__task_identifiers = count()
+        self.__pending_tasks = dict()
+        self.__pending_tasks_lock = Lock()
+        self.__is_closed = False
+
+        self.__result_collector = Thread(
+            target=self.__collect_results,
+            daemon=True
+        )
+
+        self.__result_collector.start()
+
+        self.__local_worker_processes = [
+            multiprocessing_context.Process(
+                target=DistributedWorkerPool.run_worker,
+                args=(self.address, authentication_key),
+                daemon=True
+            ) for _ in range(max(number_of_local_workers, 0))
+        ]
+
+        for local_worker_process in self.__local_worker_processes:
+            local_worker_process.start()
+
+        if enable_logger:
+            getLogger(__name__).info(
+                "The distributed coordinator is listening at '{0}:{1}' with {2} local worker process(es).".format(
+                    self.address[0],
+                    self.address[1],
+                    len(self.__local_worker_processes)
+                )
+            )
+
+    @property
+    def address(
+            self
+    ) -> Tuple[str, int]:
+        """
+        Get the host name and the port on which the coordinator listens.
+
+        :returns: The host name and the port on which the coordinator listens.
+        """
+
+        return self.__address
+
+    @property
+    def authentication_key(
+            self
+    ) -> bytes:
+        """
+        Get the key that the worker processes have to present to connect to the coordinator.
+
+        :returns: The key that the worker processes have to present to connect to the coordinator.
+        """
+
+        return self.__authentication_key
+
+    @staticmethod
+    def generate_authentication_key() -> bytes:
+        """
+        Generate a random authentication key. It consists of hexadecimal digits, so it can be passed to the
+        'scripts/run_distributed_worker.py' script as a command line argument.
+
+        :returns: The random authentication key.
+        """
+
+        return token_hex(32).encode("utf-8")
+
+    @staticmethod
+    def _is_loopback_host(
+            host_name: str
+    ) -> bool:
+        """
+        Get the indicator whether a host name refers to a loopback address.
+
+        :parameter host_name: The host name.
+
+        :returns: The indicator whether the host name refers to a loopback address.
+        """
+
+        try:
+            return ip_address(host_name).is_loopback
+
+        except ValueError:
+            return host_name == "localhost"
+
+    @staticmethod
+    def _run_chunk(
+            processing_procedure: Callable[..., Any],
+            primary_input_argument_chunk: List[Any]
+    ) -> List[Any]:
+        """
+        Run a processing procedure for each primary input argument of a chunk.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_argument_chunk: The chunk of primary input arguments of the processing procedure.
+
+        :returns: The output of the processing procedure for each primary input argument of the chunk.
+        """
+
+        return [
+            processing_procedure(primary_input_argument)
+            for primary_input_argument in primary_input_argument_chunk
+        ]
+
+    @staticmethod
+    def _send_heartbeats(
+            task_ledger: Any,
+            worker_identifier: str,
+            heartbeat_interval: float,
+            stop_event: Event
+    ) -> None:
+        """
+        Periodically send the heartbeats of a worker process until it stops or the coordinator becomes unavailable.
+
+        :parameter task_ledger: The proxy of the task ledger of the coordinator.
+        :parameter worker_identifier: The identifier of the worker process.
+        :parameter heartbeat_interval: The number of seconds between two consecutive heartbeats.
+        :parameter stop_event: The event that is set once the worker process stops.
+        """
+
+        while not stop_event.wait(heartbeat_interval):
+            try:
+                task_ledger.renew(worker_identifier)
+
+            except (EOFError, OSError):
+                return
+
+    @staticmethod
+    def run_worker(
+            address: Tuple[str, int],
+            authentication_key: bytes,
+            connection_timeout: float = 60.0
+    ) -> None:
+        """
+        Connect to a coordinator, run its initializer, and run its tasks until the coordinator shuts down or sends the
+        stop signal. The heartbeats that renew the leases of the tasks are sent from a background thread, so they
+        continue while a long task runs.
+
+        :parameter address: The host name and the port on which the coordinator listens.
+        :parameter authentication_key: The key that should be presented to the coordinator.
+        :parameter connection_timeout: The maximum number of seconds to wait for the coordinator to become available.
+        """
+
+        queue_manager = DistributedQueueManager(
+            address=tuple(address),
+            authkey=authentication_key
+        )
+
+        connection_deadline = monotonic() + connection_timeout
+
+        while True:
+            try:
+                queue_manager.connect()
+
+                break
+
+            except (ConnectionError, OSError):
+                if monotonic() > connection_deadline:
+                    raise
+
+                sleep(0.5)
+
+        task_ledger = queue_manager.get_task_ledger()
+        worker_identifier = "{0}:{1}:{2}".format(gethostname(), getpid(), uuid4().hex)
+
+        configuration = queue_manager.get_configuration()
+
+        initializer, initializer_arguments = loads(configuration.get("initializer"))
+
+        if initializer is not None:
+            initializer(*initializer_arguments)
+
+        stop_event = Event()
+
+        Thread(
+            target=DistributedWorkerPool._send_heartbeats,
+            args=(
+                task_ledger,
+                worker_identifier,
+                configuration.get("heartbeat_interval", DistributedWorkerPool.DEFAULT_HEARTBEAT_INTERVAL),
+                stop_event
+            ),
+            daemon=True
+        ).start()
+
+        try:
+            DistributedWorkerPool._run_leased_tasks(task_ledger, worker_identifier)
+
+        finally:
+            stop_event.set()
+
+    @staticmethod
+    def _run_leased_tasks(
+            task_ledger: Any,
+            worker_identifier: str
+    ) -> None:
+        """
+        Lease and run the tasks of a coordinator until it shuts down or sends the stop signal.
+
+        :parameter task_ledger: The proxy of the task ledger of the coordinator.
+        :parameter worker_identifier: The identifier of the worker process.
+        """
+
+        while True:
+            try:
+                serialized_task = task_ledger.lease(worker_identifier)
+
+            except (EOFError, OSError):
+                return
+
+            if serialized_task is None:
+                return
+
+            task_identifier, serialized_task_procedure = serialized_task
+
+            try:
+                processing_procedure, arguments, keyword_arguments = loads(serialized_task_procedure)
+
+                task_output = (task_identifier, True, processing_procedure(*arguments, **keyword_arguments))
+
+            except Exception as exception_handle:
+                task_output = (task_identifier, False, exception_handle)
+
+            try:
+                serialized_task_output = dumps(task_output, protocol=HIGHEST_PROTOCOL)
+
+            except Exception as exception_handle:
+                serialized_task_output = dumps((task_identifier, False, RuntimeError(
+                    "The output of the task could not be serialized: {0}".format(repr(exception_handle))
+                )), protocol=HIGHEST_PROTOCOL)
+
+            try:
+                task_ledger.complete(task_identifier, serialized_task_output)
+
+            except (EOFError, OSError):
+                return
+
+    def __collect_results(
+            self
+    ) -> None:
+        """
+        Receive the outputs of the tasks from the result queue, and complete the corresponding pending tasks. Between
+        the outputs, the leased tasks of the worker processes whose heartbeats expired are returned to the task queue.
+        An output of a returned task that arrives more than once is ignored.
+        """
+
+        lease_check_time = monotonic()
+
+        while True:
+            try:
+                if monotonic() - lease_check_time >= self.__heartbeat_interval:
+                    number_of_requeued_tasks = self.__task_ledger.requeue_expired_tasks(self.__heartbeat_timeout)
+
+                    lease_check_time = monotonic()
+
+                    if number_of_requeued_tasks > 0 and self.__enable_logger:
+                        getLogger(__name__).warning(
+                            "Returned {0} task(s) of unresponsive worker process(es) to the task queue.".format(
+                                number_of_requeued_tasks
+                            )
+                        )
+
+                serialized_task_output = self.__result_queue.get(timeout=self.__heartbeat_interval)
+
+            except Empty:
+                continue
+
+            except (EOFError, OSError):
+                return
+
+            if serialized_task_output is None:
+                return
+
+            task_identifier, is_successful, value = loads(serialized_task_output)
+
+            with self.__pending_tasks_lock:
+                pending_task = self.__pending_tasks.pop(task_identifier, None)
+
+            if pending_task is not None:
+                pending_task._set(is_successful, value)
+
+    def apply_async(
+            self,
+            func: Callable[..., Any],
+            args: Tuple[Any, ...] = (),
+            kwds: Dict[str, Any] = None,
+            callback: Callable[[Any], Any] = None,
+            error_callback: Callable[[BaseException], Any] = None
+    ) -> DistributedAsyncResult:
+        """
+        Submit a task to the worker processes.
+
+        :parameter func: The procedure of the task.
+        :parameter args: The positional arguments of the procedure.
+        :parameter kwds: The keyword arguments of the procedure.
+        :parameter callback: The procedure that should be run with the output of the task if it succeeds.
+        :parameter error_callback: The procedure that should be run with the exception of the task if it fails.
+
+        :returns: The asynchronous result of the task.
+        """
+
+        if self.__is_closed:
+            raise ValueError(
+                "The distributed worker pool is not running."
+            )
+
+        task_identifier = next(self.__task_identifiers)
+        pending_task = DistributedAsyncResult(callback=callback, error_callback=error_callback)
+
+        serialized_task = (task_identifier, dumps(
+            (func, tuple(args), dict(kwds) if kwds is not None else dict()),
+            protocol=HIGHEST_PROTOCOL
+        ))
+
+        with self.__pending_tasks_lock:
+            self.__pending_tasks[task_identifier] = pending_task
+
+        self.__task_queue.put(serialized_task)
+
+        return pending_task
+
+    def __submit_chunks(
+            self,
+            func: Callable[..., Any],
+            iterable: Iterable[Any],
+            chunksize: Optional[int],
+            callback: Callable[[Any], Any] = None,
+            error_callback: Callable[[BaseException], Any] = None
+    ) -> Iterator[DistributedAsyncResult]:
+        """
+        Lazily split the arguments of a procedure into chunks, and submit a task for each chunk once it is requested,
+        so the caller controls how many chunks are in flight.
+
+        :parameter func: The procedure.
+        :parameter iterable: The arguments of the procedure.
+        :parameter chunksize: The number of arguments per chunk.
+        :parameter callback: The procedure that should be run with the outputs of each chunk if it succeeds.
+        :parameter error_callback: The procedure that should be run with the exception of each chunk if it fails.
+
+        :returns: The asynchronous result of each chunk.
+        """
+
+        iterator = iter(iterable)
+
+        while True:
+            argument_chunk = list(islice(iterator, max(chunksize or 1, 1)))
+
+            if len(argument_chunk) == 0:
+                return
+
+            yield self.apply_async(
+                DistributedWorkerPool._run_chunk,
+                (func, argument_chunk),
+                callback=callback,
+                error_callback=error_callback
+            )
+
+    def map(
+            self,
+            func: Callable[..., Any],
+            iterable: Iterable[Any],
+            chunksize: int = None
+    ) -> List[Any]:
+        """
+        Run a procedure for each argument, and wait for all outputs.
+
+        :parameter func: The procedure.
+        :parameter iterable: The arguments of the procedure.
+        :parameter chunksize: The number of arguments that should be sent to a worker process at once.
+
+        :returns: The output of the procedure for each argument.
+        """
+
+        return list(self.imap(func, iterable, chunksize=chunksize))
+
+    def imap(
+            self,
+            func: Callable[..., Any],
+            iterable: Iterable[Any],
+            chunksize: int = 1
+    ) -> Iterator[Any]:
+        """
+        Run a procedure for each argument, and lazily yield the outputs in the order of the arguments.
+
+        :parameter func: The procedure.
+        :parameter iterable: The arguments of the procedure.
+        :parameter chunksize: The number of arguments that should be sent to a worker process at once.
+
+        :returns: The output of the procedure for each argument.
+        """
+
+        pending_chunks = deque()
+
+        for pending_chunk in self.__submit_chunks(func, iterable, chunksize):
+            pending_chunks.append(pending_chunk)
+
+            if len(pending_chunks) >= self.__maximum_number_of_pending_chunks:
+                yield from pending_chunks.popleft().get(self.__result_timeout)
+
+        while len(pending_chunks) > 0:
+            yield from pending_chunks.popleft().get(self.__result_timeout)
+
+    def imap_unordered(
+            self,
+            func: Callable[..., Any],
+            iterable: Iterable[Any],
+            chunksize: int = 1
+    ) -> Iterator[Any]:
+        """
+        Run a procedure for each argument, and lazily yield the outputs in the order of completion.
+
+        :parameter func: The procedure.
+        :parameter iterable: The arguments of the procedure.
+        :parameter chunksize: The number of arguments that should be sent to a worker process at once.
+
+        :returns: The output of the procedure for each argument.
+        """
+
+        completed_chunk_outputs, number_of_pending_chunks = Queue(), 0
+
+        def get_completed_chunk_outputs() -> Any:
+            try:
+                is_successful, value = completed_chunk_outputs.get(timeout=self.__result_timeout)
+
+            except Empty:
+                raise TimeoutError(
+                    "No chunk completed within {0} seconds.".format(self.__result_timeout)
+                )
+
+            if not is_successful:
+                raise value
+
+            return value
+
+        for _ in self.__submit_chunks(
+            func,
+            iterable,
+            chunksize,
+            callback=lambda chunk_outputs: completed_chunk_outputs.put((True, chunk_outputs)),
+            error_callback=lambda exception_handle: completed_chunk_outputs.put((False, exception_handle))
+        ):
+            number_of_pending_chunks += 1
+
+            if number_of_pending_chunks >= self.__maximum_number_of_pending_chunks:
+                yield from get_completed_chunk_outputs()
+
+                number_of_pending_chunks -= 1
+
+        for _ in range(number_of_pending_chunks):
+            yield from get_completed_chunk_outputs()
+
+    def close(
+            self
+    ) -> None:
+        """ Prevent any further tasks from being submitted. """
+
+        self.__is_closed = True
+
+    def join(
+            self
+    ) -> None:
+        """
+        Wait for the pending tasks, and stop the coordinator and the local worker processes. If a pending task does not
+        complete within the result timeout, a 'TimeoutError' is raised and the coordinator keeps running.
+        """
+
+        while True:
+            with self.__pending_tasks_lock:
+                pending_tasks = list(self.__pending_tasks.values())
+
+            if len(pending_tasks) == 0:
+                break
+
+            pending_tasks[0].wait(self.__result_timeout)
+
+            if not pending_tasks[0].ready():
+                raise TimeoutError(
+                    "A pending task did not complete within {0} seconds.".format(self.__result_timeout)
+                )
+
+        self.__shut_down(wait_for_local_workers=True)
+
+    def terminate(
+            self
+    ) -> None:
+        """
+        Stop the coordinator and the local worker processes without waiting for the pending tasks, which are failed.
+        """
+
+        self.__is_closed = True
+
+        self.__shut_down(wait_for_local_workers=False)
+
+    def __shut_down(
+            self,
+            wait_for_local_workers: bool
+    ) -> None:
+        """
+        Stop the coordinator and the local worker processes.
+
+        :parameter wait_for_local_workers: The indicator whether the local worker processes should be allowed to exit
+                                           on their own.
+        """
+
+        if self.__queue_manager is None:
+            return
+
+        try:
+            self.__result_queue.put(None)
+
+        except (EOFError, OSError):
+            pass
+
+        self.__result_collector.join(5.0)
+
+        self.__queue_manager.shutdown()
+        self.__queue_manager = None
+
+        for local_worker_process in self.__local_worker_processes:
+            if wait_for_local_workers:
+                local_worker_process.join(5.0)
+
+            if local_worker_process.is_alive():
+                local_worker_process.terminate()
+                local_worker_process.join()
+
+        with self.__pending_tasks_lock:
+            pending_tasks = list(self.__pending_tasks.values())
+
+            self.__pending_tasks.clear()
+
+        for pending_task in pending_tasks:
+            pending_task._set(False, RuntimeError(
+                "The distributed worker pool was terminated before the task completed."
+            ))
+
+        if self.__enable_logger:
+            getLogger(__name__).info(
+                "The distributed coordinator is stopped."
+            )
@@ -0,0 +1,258 @@
+""" The 'chemical_reaction_data.utilities.multiprocessing' package 'instrumentation' module. """
+
+from itertools import count
+from json import dumps
+from logging import getLogger
+from os import getpid
+from os.path import abspath
+from pickle import dumps as pickle_dumps, HIGHEST_PROTOCOL
+from threading import get_ident
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+_instrumented_task_counter = count()
+
+
+class MultiprocessingInstrumentationUtilities:
+    """
+    The multiprocessing instrumentation utilities class. All timestamps are taken from the monotonic clock, which is
+    shared by the processes of the same host.
+    """
+
+    TASK_DURATION_HISTOGRAM_UPPER_BOUNDS = (
+        0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, None
+    )
+
+    RESULT_SERIALIZATION_SAMPLING_INTERVAL = 16
+
+    @staticmethod
+    def enqueue(
+            primary_input_arguments: Iterable[Any]
+    ) -> Iterator[Tuple[float, Any]]:
+        """
+        Lazily attach the submission timestamp to each primary input argument of a processing procedure.
+
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+
+        :returns: The submission timestamp and the primary input argument.
+        """
+
+        for primary_input_argument in primary_input_arguments:
+            yield monotonic(), primary_input_argument
+
+    @staticmethod
+    def run_instrumented_task(
+            processing_procedure: Callable[..., Any],
+            measure_result_serialization: bool,
+            enqueued_primary_input_argument: Tuple[float, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Run a processing procedure for an enqueued primary input argument, and record the task timings. Measuring the
+        serialization pickles the output once more, so it is only measured for every 16th task of each process.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter measure_result_serialization: The indicator whether the duration and size of the serialization of
+                                                 the output for the transfer to the parent process should be measured
+                                                 for a sample of the tasks.
+        :parameter enqueued_primary_input_argument: The submission timestamp and the primary input argument of the
+                                                    processing procedure.
+
+        :returns: The output of the processing procedure, and the task record.
+        """
+
+        submission_time, primary_input_argument = enqueued_primary_input_argument
+
+        start_time = monotonic()
+
+        processing_procedure_output = processing_procedure(primary_input_argument)
+
+        end_time = monotonic()
+
+        task_record = {
+            "worker_id": "{0}:{1}".format(getpid(), get_ident()),
+            "submission_time": submission_time,
+            "start_time": start_time,
+            "end_time": end_time,
+            "result_serialization_duration": None,
+            "result_size": None,
+        }
+
+        if measure_result_serialization and next(_instrumented_task_counter) % \
+                MultiprocessingInstrumentationUtilities.RESULT_SERIALIZATION_SAMPLING_INTERVAL == 0:
+            task_record["result_size"] = len(pickle_dumps(processing_procedure_output, protocol=HIGHEST_PROTOCOL))
+            task_record["result_serialization_duration"] = monotonic() - end_time
+
+        return processing_procedure_output, task_record
+
+    @staticmethod
+    def receive(
+            task_outputs: Iterable[Tuple[Any, Dict[str, Any]]],
+            task_records: List[Dict[str, Any]]
+    ) -> Iterator[Any]:
+        """
+        Lazily receive the outputs of instrumented tasks, and collect the task records extended with the timestamp of
+        the receipt of the output.
+
+        :parameter task_outputs: The outputs of the instrumented tasks.
+        :parameter task_records: The list to which the task records should be appended.
+
+        :returns: The output of the processing procedure for each task.
+        """
+
+        for processing_procedure_output, task_record in task_outputs:
+            task_record["receipt_time"] = monotonic()
+
+            task_records.append(task_record)
+
+            yield processing_procedure_output
+
+    @staticmethod
+    def _summarize(
+            values: List[float]
+    ) -> Optional[Dict[str, float]]:
+        """
+        Summarize values by their total, mean, median, 90th and 99th percentile and maximum.
+
+        :parameter values: The values.
+
+        :returns: The summary of the values, or None if there are no values.
+        """
+
+        if len(values) == 0:
+            return None
+
+        sorted_values = sorted(values)
+
+        return {
+            "total": sum(sorted_values),
+            "mean": sum(sorted_values) / len(sorted_values),
+            "p50": sorted_values[int(0.50 * (len(sorted_values) - 1))],
+            "p90": sorted_values[int(0.90 * (len(sorted_values) - 1))],
+            "p99": sorted_values[int(0.99 * (len(sorted_values) - 1))],
+            "max": sorted_values[-1],
+        }
+
+    @staticmethod
+    def build_report(
+            processing_procedure: Callable[..., Any],
+            task_records: List[Dict[str, Any]],
+            run_start_time: float,
+            run_end_time: float,
+            backend: str,
+            number_of_cpu_cores: int
+    ) -> Dict[str, Any]:
+        """
+        Build the instrumentation report of a processing procedure run.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter task_records: The task records, each extended with the timestamp of the receipt of the output.
+        :parameter run_start_time: The timestamp of the start of the run.
+        :parameter run_end_time: The timestamp of the end of the run.
+        :parameter backend: The backend that ran the tasks.
+        :parameter number_of_cpu_cores: The number of CPU cores utilized by the run.
+
+        :returns: The instrumentation report of the processing procedure run, in which the result serialization and
+                  size summaries cover the sampled tasks only.
+        """
+
+        task_durations = [task_record["end_time"] - task_record["start_time"] for task_record in task_records]
+
+        task_duration_histogram = list()
+
+        for upper_bound_index, upper_bound in enumerate(
+            MultiprocessingInstrumentationUtilities.TASK_DURATION_HISTOGRAM_UPPER_BOUNDS
+        ):
+            lower_bound = MultiprocessingInstrumentationUtilities.TASK_DURATION_HISTOGRAM_UPPER_BOUNDS[
+                upper_bound_index - 1
+            ] if upper_bound_index > 0 else None
+
+            task_duration_histogram.append({
+                "upper_bound": upper_bound,
+                "number_of_tasks": sum(
+                    1 for task_duration in task_durations
+                    if (lower_bound is None or task_duration > lower_bound) and
+                    (upper_bound is None or task_duration <= upper_bound)
+                ),
+            })
+
+        workers = dict()
+
+        for task_record, task_duration in zip(task_records, task_durations):
+            worker = workers.setdefault(task_record["worker_id"], {
+                "number_of_tasks": 0,
+                "busy_time": 0.0,
+            })
+
+            worker["number_of_tasks"] += 1
+            worker["busy_time"] += task_duration
+
+        for worker in workers.values():
+            worker["idle_time"] = max(run_end_time - run_start_time - worker["busy_time"], 0.0)
+            worker["utilization"] = worker["busy_time"] / (run_end_time - run_start_time) \
+                if run_end_time > run_start_time else None
+
+        return {
+            "processing_procedure": getattr(
+                getattr(processing_procedure, "func", processing_procedure),
+                "__qualname__",
+                repr(processing_procedure)
+            ),
+            "backend": backend,
+            "number_of_cpu_cores": number_of_cpu_cores,
+            "number_of_tasks": len(task_records),
+            "wall_time": run_end_time - run_start_time,
+            "task_duration": MultiprocessingInstrumentationUtilities._summarize(task_durations),
+            "task_duration_histogram": task_duration_histogram,
+            "queue_wait_duration": MultiprocessingInstrumentationUtilities._summarize([
+                task_record["start_time"] - task_record["submission_time"] for task_record in task_records
+            ]),
+            "number_of_result_serialization_samples": sum(
+                1 for task_record in task_records if task_record["result_serialization_duration"] is not None
+            ),
+            "result_serialization_duration": MultiprocessingInstrumentationUtilities._summarize([
+                task_record["result_serialization_duration"] for task_record in task_records
+                if task_record["result_serialization_duration"] is not None
+            ]),
+            "result_transfer_duration": MultiprocessingInstrumentationUtilities._summarize([
+                task_record["receipt_time"] - task_record["end_time"] for task_record in task_records
+            ]),
+            "result_size": MultiprocessingInstrumentationUtilities._summarize([
+                task_record["result_size"] for task_record in task_records if task_record["result_size"] is not None
+            ]),
+            "workers": workers,
+        }
+
+    @staticmethod
+    def write_report(
+            report: Dict[str, Any],
+            report_file_path: str,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        Append an instrumentation report to a JSON Lines file.
+
+        :parameter report: The instrumentation report.
+        :parameter report_file_path: The path to the JSON Lines file.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        try:
+            with open(report_file_path, "a") as file_handle:
+                file_handle.write(dumps(report) + "\n")
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Stored the instrumentation report of {0} task(s) at: '{1}'.".format(
+                        report["number_of_tasks"],
+                        abspath(report_file_path)
+                    )
+                )
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingInstrumentationUtilities.write_report".format(__name__)
+                ).exception(exception_handle)
+
+            raise
@@ -1,19 +1,464 @@
 """ The 'chemical_reaction_data.utilities.multiprocessing' package 'multiprocessing' module. """
 
+from collections import deque
+from contextlib import nullcontext
+from functools import partial
+from itertools import chain, count, islice
 from logging import getLogger
-from multiprocessing import cpu_count, Pool
-from tqdm import tqdm
-from typing import Any, Callable, Iterable, List, Optional
+from math import ceil
+from multiprocessing import active_children
+from operator import itemgetter
+from os import getpid, sysconf
+from pickle import dump, load
+from queue import Empty, Queue
+from time import monotonic, perf_counter
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sized, Tuple, Union
+
+from .instrumentation import MultiprocessingInstrumentationUtilities
+from .pool_session import MultiprocessingPoolSession
+
+from ..progress import ProgressReporter
 
 
 class MultiprocessingUtilities:
     """ The multiprocessing utilities class. """
 
+    AUTOMATIC_CHUNK_DURATION = 0.1
+
+    MAXIMUM_AUTOMATIC_CHUNK_SIZE = 1024
+
+    TASK_MONITORING_INTERVAL = 0.1
+
+    CHEMISTRY_MODULE_NAMES = (
+        "rdkit.Chem",
+        "rdkit.Chem.AllChem",
+        "ord_schema.message_helpers",
+        "ord_schema.proto.dataset_pb2",
+        "ord_schema.proto.reaction_pb2",
+        "chemical_reaction_data.utilities.chemistry",
+    )
+
+    @staticmethod
+    def open_pool_session(
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            start_method: str = None,
+            preloaded_module_names: Tuple[str, ...] = (),
+            distributed_address: Tuple[str, int] = ("127.0.0.1", 0),
+            distributed_authentication_key: bytes = None,
+            number_of_local_distributed_workers: int = None,
+            pool_session: MultiprocessingPoolSession = None,
+            enable_logger: bool = False
+    ) -> ContextManager[MultiprocessingPoolSession]:
+        """
+        Open a new multiprocessing pool session, or reuse an existing one without taking over its life cycle.
+
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized by a new session, or 'auto'.
+        :parameter backend: The indicator of the backend of a new session: 'processes', 'threads', 'serial' or
+                            'distributed'.
+        :parameter initializer: The procedure that should be run once per worker process of a new session.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter start_method: The method that should be utilized to start the worker processes of a new session:
+                                 'fork', 'spawn', 'forkserver' or None for the default method of the platform.
+        :parameter preloaded_module_names: The names of the modules that should be imported before any tasks of a new
+                                           session, such as the 'CHEMISTRY_MODULE_NAMES' constant.
+        :parameter distributed_address: The host name and the port on which a new 'distributed' session should listen.
+        :parameter distributed_authentication_key: The key that the worker processes of a new 'distributed' session
+                                                   have to present. It is required for a non-loopback address.
+        :parameter number_of_local_distributed_workers: The number of worker processes of a new 'distributed' session
+                                                        that should be started on the current host.
+        :parameter pool_session: The existing multiprocessing pool session that should be reused.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The runtime context of the multiprocessing pool session.
+        """
+
+        if pool_session is not None:
+            return nullcontext(pool_session)
+
+        return MultiprocessingPoolSession(
+            number_of_cpu_cores=number_of_cpu_cores,
+            backend=backend,
+            initializer=initializer,
+            initializer_arguments=initializer_arguments,
+            start_method=start_method,
+            preloaded_module_names=preloaded_module_names,
+            distributed_address=distributed_address,
+            distributed_authentication_key=distributed_authentication_key,
+            number_of_local_distributed_workers=number_of_local_distributed_workers,
+            enable_logger=enable_logger
+        )
+
+    @staticmethod
+    def get_worker_state() -> Dict[str, Any]:
+        """
+        Get the state of the current worker process, as prepared by the initializer of the multiprocessing pool session.
+
+        :returns: The state of the current worker process.
+        """
+
+        return MultiprocessingPoolSession.get_worker_state()
+
+    @staticmethod
+    def get_number_of_available_cpu_cores() -> int:
+        """
+        Get the number of CPU cores available to the current process, respecting the CPU affinity mask and the CPU
+        bandwidth limit of the control group (cgroup) of the current process.
+
+        :returns: The number of CPU cores available to the current process.
+        """
+
+        return MultiprocessingPoolSession.get_number_of_available_cpu_cores()
+
+    @staticmethod
+    def _split_into_chunks(
+            primary_input_arguments: Iterable[Any],
+            chunk_size: int
+    ) -> Iterator[List[Any]]:
+        """
+        Lazily split the primary input arguments of a processing procedure into chunks.
+
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter chunk_size: The maximum number of primary input arguments per chunk.
+
+        :returns: The chunks of primary input arguments.
+        """
+
+        primary_input_argument_iterator = iter(primary_input_arguments)
+
+        while True:
+            primary_input_argument_chunk = list(islice(primary_input_argument_iterator, max(chunk_size, 1)))
+
+            if len(primary_input_argument_chunk) == 0:
+                return
+
+            yield primary_input_argument_chunk
+
+    @staticmethod
+    def _get_largest_first_task_indices(
+            primary_input_arguments: List[Any],
+            task_size_procedure: Optional[Callable[[Any], float]]
+    ) -> List[int]:
+        """
+        Get the indices of the tasks of a processing procedure run in the order in which they should be submitted.
+
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter task_size_procedure: The procedure that estimates the size of the task of a primary input argument.
+                                        If None, the tasks are submitted in the order of the primary input arguments.
+
+        :returns: The indices of the tasks, ordered from the largest to the smallest task.
+        """
+
+        if task_size_procedure is None:
+            return list(range(len(primary_input_arguments)))
+
+        task_sizes = [task_size_procedure(primary_input_argument) for primary_input_argument in primary_input_arguments]
+
+        return sorted(range(len(primary_input_arguments)), key=lambda task_index: task_sizes[task_index], reverse=True)
+
+    @staticmethod
+    def _run_indexed_task(
+            processing_procedure: Callable[..., Any],
+            indexed_primary_input_argument: Tuple[int, Any]
+    ) -> Tuple[int, Any]:
+        """
+        Run a processing procedure for an indexed primary input argument, and keep the index with the output.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter indexed_primary_input_argument: The index and the primary input argument of the processing procedure.
+
+        :returns: The index and the output of the processing procedure.
+        """
+
+        task_index, primary_input_argument = indexed_primary_input_argument
+
+        return task_index, processing_procedure(primary_input_argument)
+
+    @staticmethod
+    def _process_chunk(
+            processing_procedure: Callable[..., Any],
+            primary_input_argument_chunk: List[Any]
+    ) -> List[Any]:
+        """
+        Run a processing procedure for each primary input argument of a chunk.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_argument_chunk: The chunk of primary input arguments of the processing procedure.
+
+        :returns: The output of the processing procedure for each primary input argument of the chunk.
+        """
+
+        return [
+            processing_procedure(primary_input_argument)
+            for primary_input_argument in primary_input_argument_chunk
+        ]
+
+    @staticmethod
+    def _process_timed_chunk(
+            processing_procedure: Callable[..., Any],
+            primary_input_argument_chunk: List[Any]
+    ) -> Tuple[List[Any], float]:
+        """
+        Run a processing procedure for each primary input argument of a chunk, and measure the duration.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_argument_chunk: The chunk of primary input arguments of the processing procedure.
+
+        :returns: The output of the processing procedure for each primary input argument of the chunk, and the duration
+                  of the processing in seconds.
+        """
+
+        processing_start_time = perf_counter()
+
+        chunk_outputs = MultiprocessingUtilities._process_chunk(
+            processing_procedure=processing_procedure,
+            primary_input_argument_chunk=primary_input_argument_chunk
+        )
+
+        return chunk_outputs, perf_counter() - processing_start_time
+
+    @staticmethod
+    def _determine_chunk_size(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            chunk_size: Optional[Union[int, str]],
+            pool_session: MultiprocessingPoolSession,
+            number_of_primary_input_arguments: int = None,
+            enable_logger: bool = False
+    ) -> Tuple[Optional[int], List[Any], Iterable[Any]]:
+        """
+        Determine the chunk size of a processing procedure run. If the chunk size is 'auto', the first primary input
+        argument of each worker process is processed individually to observe the average duration of a task, and the
+        chunk size is chosen so that a chunk takes approximately the automatic chunk duration, while each worker
+        process still receives several chunks.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter chunk_size: The requested chunk size, or 'auto'.
+        :parameter pool_session: The multiprocessing pool session.
+        :parameter number_of_primary_input_arguments: The number of primary input arguments of the processing procedure,
+                                                      if it cannot be determined from the primary input arguments.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The chunk size, the outputs of the processing procedure for the primary input arguments processed to
+                  observe the average duration of a task, and the remaining primary input arguments.
+        """
+
+        if chunk_size != "auto":
+            return chunk_size, list(), primary_input_arguments
+
+        if isinstance(primary_input_arguments, Sized):
+            number_of_primary_input_arguments = len(primary_input_arguments)
+
+        primary_input_argument_iterator = iter(primary_input_arguments)
+
+        calibration_chunk_outputs = [
+            pool_session.worker_pool.apply_async(
+                MultiprocessingUtilities._process_timed_chunk,
+                (processing_procedure, [primary_input_argument, ])
+            ) for primary_input_argument in islice(primary_input_argument_iterator, pool_session.number_of_cpu_cores)
+        ]
+
+        calibration_outputs, calibration_durations = list(), list()
+
+        for calibration_chunk_output in calibration_chunk_outputs:
+            chunk_outputs, chunk_duration = calibration_chunk_output.get()
+
+            calibration_outputs.extend(chunk_outputs)
+            calibration_durations.append(chunk_duration)
+
+        if len(calibration_durations) == 0:
+            return 1, calibration_outputs, primary_input_argument_iterator
+
+        average_task_duration = sum(calibration_durations) / len(calibration_durations)
+
+        if average_task_duration > 0.0:
+            chunk_size = int(MultiprocessingUtilities.AUTOMATIC_CHUNK_DURATION / average_task_duration)
+
+        else:
+            chunk_size = MultiprocessingUtilities.MAXIMUM_AUTOMATIC_CHUNK_SIZE
+
+        if number_of_primary_input_arguments is not None:
+            chunk_size = min(chunk_size, ceil(
+                (number_of_primary_input_arguments - len(calibration_outputs)) /
+                (4 * pool_session.number_of_cpu_cores)
+            ))
+
+        chunk_size = min(max(chunk_size, 1), MultiprocessingUtilities.MAXIMUM_AUTOMATIC_CHUNK_SIZE)
+
+        if enable_logger:
+            getLogger(__name__).info(
+                "Determined the chunk size of {0} from the average task duration of {1:.6f} seconds, {2} primary "
+                "input arguments and {3} CPU core(s).".format(
+                    chunk_size,
+                    average_task_duration,
+                    number_of_primary_input_arguments if number_of_primary_input_arguments is not None else "unknown",
+                    pool_session.number_of_cpu_cores
+                )
+            )
+
+        return chunk_size, calibration_outputs, primary_input_argument_iterator
+
+    @staticmethod
+    def _instrument_tasks(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            pool_session: MultiprocessingPoolSession,
+            task_records: Optional[List[Dict[str, Any]]]
+    ) -> Tuple[Callable[..., Any], Iterable[Any], Callable[[Iterable[Any]], Iterable[Any]]]:
+        """
+        Instrument the tasks of a processing procedure run if the task records should be collected.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter pool_session: The multiprocessing pool session.
+        :parameter task_records: The list to which the task records should be appended, or None if the tasks should
+                                 not be instrumented.
+
+        :returns: The task procedure, the task arguments, and the procedure that converts the task outputs into the
+                  outputs of the processing procedure.
+        """
+
+        if task_records is None:
+            return processing_procedure, primary_input_arguments, lambda task_outputs: task_outputs
+
+        return partial(
+            MultiprocessingInstrumentationUtilities.run_instrumented_task,
+            processing_procedure,
+            pool_session.backend == "processes" and pool_session.number_of_cpu_cores > 1
+        ), MultiprocessingInstrumentationUtilities.enqueue(
+            primary_input_arguments=primary_input_arguments
+        ), partial(
+            MultiprocessingInstrumentationUtilities.receive,
+            task_records=task_records
+        )
+
+    @staticmethod
+    def _get_completed_chunk_outputs(
+            completed_chunk_outputs: Queue
+    ) -> List[Any]:
+        """
+        Wait for the next completed chunk, and get its outputs.
+
+        :parameter completed_chunk_outputs: The queue of the completed chunk outputs or raised exceptions.
+
+        :returns: The output of the processing procedure for each primary input argument of the completed chunk.
+        """
+
+        chunk_outputs = completed_chunk_outputs.get()
+
+        if isinstance(chunk_outputs, BaseException):
+            raise chunk_outputs
+
+        return chunk_outputs
+
+    @staticmethod
+    def _run_monitored_task(
+            processing_procedure: Callable[..., Any],
+            submission_identifier: int,
+            primary_input_argument: Any
+    ) -> Any:
+        """
+        Notify the multiprocessing pool session that a task has started, and run the processing procedure.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter submission_identifier: The identifier of the submission of the task, which distinguishes the retried
+                                          attempts of the same task.
+        :parameter primary_input_argument: The primary input argument of the processing procedure.
+
+        :returns: The output of the processing procedure.
+        """
+
+        task_notification_queue = MultiprocessingPoolSession.get_task_notification_queue()
+
+        if task_notification_queue is not None:
+            task_notification_queue.put((submission_identifier, getpid(), monotonic()))
+
+        return processing_procedure(primary_input_argument)
+
+    @staticmethod
+    def _get_resident_set_size(
+            process_id: int
+    ) -> Optional[int]:
+        """
+        Get the resident set size (RSS) of a process from the '/proc' file system.
+
+        :parameter process_id: The ID of the process.
+
+        :returns: The resident set size of the process in bytes, or None if it cannot be determined.
+        """
+
+        try:
+            with open("/proc/{0}/statm".format(process_id), "r") as file_handle:
+                return int(file_handle.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+
+        except (OSError, ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _get_worker_resident_set_size(
+            pool_session: MultiprocessingPoolSession
+    ) -> int:
+        """
+        Get the total resident set size (RSS) of the worker processes of a multiprocessing pool session. For the
+        'threads' backend, the resident set size of the current process is returned.
+
+        :parameter pool_session: The multiprocessing pool session.
+
+        :returns: The total resident set size of the worker processes in bytes, or 0 if it cannot be determined.
+        """
+
+        if pool_session.backend == "threads":
+            process_ids = [getpid(), ]
+
+        else:
+            process_ids = [worker_process.pid for worker_process in active_children()]
+
+        return sum(
+            resident_set_size for resident_set_size in (
+                MultiprocessingUtilities._get_resident_set_size(
+                    process_id=process_id
+                ) for process_id in process_ids
+            ) if resident_set_size is not None
+        )
+
+    @staticmethod
+    def _quarantine_primary_input_argument(
+            primary_input_argument: Any,
+            number_of_attempts: int,
+            exception_handle: BaseException,
+            quarantine_file_path: Optional[str]
+    ) -> None:
+        """
+        Append a primary input argument that repeatedly failed to be processed to the quarantine file.
+
+        :parameter primary_input_argument: The primary input argument of the processing procedure.
+        :parameter number_of_attempts: The number of failed processing attempts.
+        :parameter exception_handle: The exception of the last failed processing attempt.
+        :parameter quarantine_file_path: The path to the quarantine file.
+        """
+
+        if quarantine_file_path is not None:
+            with open(quarantine_file_path, "ab") as quarantine_file_handle:
+                dump({
+                    "primary_input_argument": primary_input_argument,
+                    "number_of_attempts": number_of_attempts,
+                    "exception": repr(exception_handle)
+                }, quarantine_file_handle)
+
     @staticmethod
     def run(
             processing_procedure: Callable[..., Any],
             primary_input_arguments: Iterable[Any],
-            number_of_cpu_cores: int = 1,
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            chunk_size: Union[int, str] = None,
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            pool_session: MultiprocessingPoolSession = None,
+            instrumentation_report_file_path: str = None,
             enable_logger: bool = False
     ) -> Optional[List[Any]]:
         """
@@ -21,32 +466,104 @@ class MultiprocessingUtilities:
 
         :parameter processing_procedure: The processing procedure.
         :parameter primary_input_arguments: The primary input arguments of the processing procedure.
-        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the tasks: 'processes', 'threads', 'serial' or
+                            'distributed'.
+        :parameter chunk_size: The number of primary input arguments that should be sent to a worker process at once.
+                               If None, the default chunk size of the pool is used. If 'auto', the chunk size is
+                               determined from the number of primary input arguments and the observed task duration.
+        :parameter initializer: The procedure that should be run once per worker process before any tasks. It is
+                                ignored if an existing multiprocessing pool session is reused.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the run.
+        :parameter instrumentation_report_file_path: The path to the JSON Lines file to which the instrumentation
+                                                     report of the run should be appended. If None, the tasks are not
+                                                     instrumented. For the processes backend, the output of every 16th
+                                                     task of each worker process is pickled once more to measure the
+                                                     duration and size of its serialization, which adds that overhead
+                                                     to the sampled tasks.
         :parameter enable_logger: The indicator whether the logger should be enabled.
 
         :returns: The output of the processing procedure for each primary input argument.
         """
 
         try:
-            number_of_cpu_cores = number_of_cpu_cores if 1 <= number_of_cpu_cores <= cpu_count() else 1
+            processing_procedure_outputs, run_start_time = list(), monotonic()
 
-            processing_procedure_outputs = list()
+            task_records = list() if instrumentation_report_file_path is not None else None
 
-            if number_of_cpu_cores == 1:
-                for primary_input_argument in primary_input_arguments:
-                    processing_procedure_outputs.append(
-                        processing_procedure(primary_input_argument)
+            number_of_primary_input_arguments = len(primary_input_arguments) \
+                if isinstance(primary_input_arguments, Sized) else None
+
+            with MultiprocessingUtilities.open_pool_session(
+                number_of_cpu_cores=number_of_cpu_cores,
+                backend=backend,
+                initializer=initializer,
+                initializer_arguments=initializer_arguments,
+                pool_session=pool_session,
+                enable_logger=enable_logger
+            ) as pool_session:
+                task_procedure, task_arguments, receive_task_outputs = MultiprocessingUtilities._instrument_tasks(
+                    processing_procedure=processing_procedure,
+                    primary_input_arguments=primary_input_arguments,
+                    pool_session=pool_session,
+                    task_records=task_records
+                )
+
+                if pool_session.worker_pool is None:
+                    for processing_procedure_output in receive_task_outputs(map(task_procedure, task_arguments)):
+                        processing_procedure_outputs.append(
+                            processing_procedure_output
+                        )
+
+                else:
+                    chunk_size, calibration_outputs, task_arguments = MultiprocessingUtilities._determine_chunk_size(
+                        processing_procedure=task_procedure,
+                        primary_input_arguments=task_arguments,
+                        chunk_size=chunk_size,
+                        pool_session=pool_session,
+                        number_of_primary_input_arguments=number_of_primary_input_arguments,
+                        enable_logger=enable_logger
                     )
 
-            else:
-                with Pool(number_of_cpu_cores) as process_pool:
-                    for processing_procedure_output in process_pool.map(processing_procedure, primary_input_arguments):
+                    if task_records is None:
+                        task_outputs = pool_session.worker_pool.map(
+                            task_procedure,
+                            task_arguments,
+                            chunksize=chunk_size
+                        )
+
+                    else:
+                        if chunk_size is None:
+                            chunk_size = max(ceil(
+                                number_of_primary_input_arguments / (4 * pool_session.number_of_cpu_cores)
+                            ), 1) if number_of_primary_input_arguments is not None else 1
+
+                        task_outputs = pool_session.worker_pool.imap(
+                            task_procedure,
+                            task_arguments,
+                            chunksize=chunk_size
+                        )
+
+                    for processing_procedure_output in receive_task_outputs(chain(calibration_outputs, task_outputs)):
                         processing_procedure_outputs.append(
                             processing_procedure_output
                         )
 
-                    process_pool.close()
-                    process_pool.join()
+                if task_records is not None:
+                    MultiprocessingInstrumentationUtilities.write_report(
+                        report=MultiprocessingInstrumentationUtilities.build_report(
+                            processing_procedure=processing_procedure,
+                            task_records=task_records,
+                            run_start_time=run_start_time,
+                            run_end_time=monotonic(),
+                            backend=pool_session.backend,
+                            number_of_cpu_cores=pool_session.number_of_cpu_cores
+                        ),
+                        report_file_path=instrumentation_report_file_path,
+                        enable_logger=enable_logger
+                    )
 
             return processing_procedure_outputs
 
@@ -64,8 +581,17 @@ class MultiprocessingUtilities:
             primary_input_argument: Iterable[Any],
             number_of_primary_input_arguments: int = None,
             description_message: str = None,
-            number_of_cpu_cores: int = 1,
-            enable_logger: bool = False,
+            progress_sink: str = "auto",
+            progress_callback: Callable[[int, Optional[int]], Any] = None,
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            chunk_size: Union[int, str] = 1,
+            task_size_procedure: Callable[[Any], float] = None,
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            pool_session: MultiprocessingPoolSession = None,
+            instrumentation_report_file_path: str = None,
+            enable_logger: bool = False
     ) -> Optional[List[Any]]:
         """
         Run a processing procedure for each primary input argument, and visualize the progress with a progress bar.
@@ -74,49 +600,133 @@ class MultiprocessingUtilities:
         :parameter primary_input_argument: The primary input arguments of the processing procedure.
         :parameter number_of_primary_input_arguments: The number of primary input arguments of the processing procedure.
         :parameter description_message: The progress bar description message.
-        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter progress_sink: The indicator of the sink of the progress reports: 'tqdm', 'log', 'callback', 'none'
+                                  or 'auto'. The progress is reported in batches, at most once per second.
+        :parameter progress_callback: The procedure that receives the number of completed and total primary input
+                                      arguments. It is required for the 'callback' progress sink.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the tasks: 'processes', 'threads', 'serial' or
+                            'distributed'.
+        :parameter chunk_size: The number of primary input arguments that should be sent to a worker process at once,
+                               or 'auto' to determine it from the number of primary input arguments and the observed
+                               task duration.
+        :parameter task_size_procedure: The procedure that estimates the size of the task of a primary input argument,
+                                        such as the 'os.path.getsize' function for file paths. If specified, the tasks
+                                        are dispatched dynamically from the largest to the smallest, so that a large
+                                        task does not start last and leave the other worker processes idle. The outputs
+                                        are still returned in the order of the primary input arguments.
+        :parameter initializer: The procedure that should be run once per worker process before any tasks. It is
+                                ignored if an existing multiprocessing pool session is reused.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the run.
+        :parameter instrumentation_report_file_path: The path to the JSON Lines file to which the instrumentation
+                                                     report of the run should be appended. If None, the tasks are not
+                                                     instrumented. For the processes backend, the output of every 16th
+                                                     task of each worker process is pickled once more to measure the
+                                                     duration and size of its serialization, which adds that overhead
+                                                     to the sampled tasks.
         :parameter enable_logger: The indicator whether the logger should be enabled.
 
         :returns: The output of the processing procedure for each primary input argument.
         """
 
         try:
-            number_of_cpu_cores = number_of_cpu_cores if 1 <= number_of_cpu_cores <= cpu_count() else 1
+            processing_procedure_outputs, run_start_time = list(), monotonic()
 
-            processing_procedure_outputs = list()
+            task_records = list() if instrumentation_report_file_path is not None else None
 
-            if number_of_cpu_cores == 1:
-                for input_argument in tqdm(
-                    iterable=primary_input_argument,
-                    total=number_of_primary_input_arguments,
-                    ascii=True,
-                    ncols=150,
-                    desc="{0} (CPU Cores: 1)".format(
-                        description_message if description_message is not None else "Running"
+            scheduled_processing_procedure, scheduled_primary_input_arguments = \
+                processing_procedure, primary_input_argument
+
+            if task_size_procedure is not None:
+                primary_input_argument = list(primary_input_argument)
+
+                scheduled_processing_procedure = partial(
+                    MultiprocessingUtilities._run_indexed_task,
+                    processing_procedure
+                )
+                scheduled_primary_input_arguments = [
+                    (task_index, primary_input_argument[task_index])
+                    for task_index in MultiprocessingUtilities._get_largest_first_task_indices(
+                        primary_input_arguments=primary_input_argument,
+                        task_size_procedure=task_size_procedure
                     )
-                ):
-                    processing_procedure_outputs.append(
-                        processing_procedure(input_argument)
+                ]
+
+            if number_of_primary_input_arguments is None and isinstance(primary_input_argument, Sized):
+                number_of_primary_input_arguments = len(primary_input_argument)
+
+            with MultiprocessingUtilities.open_pool_session(
+                number_of_cpu_cores=number_of_cpu_cores,
+                backend=backend,
+                initializer=initializer,
+                initializer_arguments=initializer_arguments,
+                pool_session=pool_session,
+                enable_logger=enable_logger
+            ) as pool_session:
+                task_procedure, task_arguments, receive_task_outputs = MultiprocessingUtilities._instrument_tasks(
+                    processing_procedure=scheduled_processing_procedure,
+                    primary_input_arguments=scheduled_primary_input_arguments,
+                    pool_session=pool_session,
+                    task_records=task_records
+                )
+
+                if pool_session.worker_pool is None:
+                    task_outputs = map(task_procedure, task_arguments)
+
+                else:
+                    chunk_size, calibration_outputs, task_arguments = MultiprocessingUtilities._determine_chunk_size(
+                        processing_procedure=task_procedure,
+                        primary_input_arguments=task_arguments,
+                        chunk_size=chunk_size,
+                        pool_session=pool_session,
+                        number_of_primary_input_arguments=number_of_primary_input_arguments,
+                        enable_logger=enable_logger
                     )
 
-            else:
-                with Pool(number_of_cpu_cores) as process_pool:
-                    for processing_procedure_output in tqdm(
-                        iterable=process_pool.imap(processing_procedure, primary_input_argument),
-                        total=number_of_primary_input_arguments,
-                        ascii=True,
-                        ncols=150,
-                        desc="{0} (CPU Cores: {1})".format(
-                            description_message if description_message is not None else "Running",
-                            number_of_cpu_cores
-                        )
-                    ):
+                    worker_pool_map = pool_session.worker_pool.imap \
+                        if task_size_procedure is None else pool_session.worker_pool.imap_unordered
+
+                    task_outputs = chain(calibration_outputs, worker_pool_map(
+                        task_procedure,
+                        task_arguments,
+                        chunksize=chunk_size
+                    ))
+
+                with ProgressReporter(
+                    total=number_of_primary_input_arguments,
+                    description="{0} (CPU Cores: {1})".format(
+                        description_message if description_message is not None else "Running",
+                        pool_session.number_of_cpu_cores
+                    ),
+                    sink=progress_sink,
+                    callback=progress_callback
+                ) as progress_reporter:
+                    for processing_procedure_output in progress_reporter.track(receive_task_outputs(task_outputs)):
                         processing_procedure_outputs.append(
                             processing_procedure_output
                         )
 
-                    process_pool.close()
-                    process_pool.join()
+                if task_records is not None:
+                    MultiprocessingInstrumentationUtilities.write_report(
+                        report=MultiprocessingInstrumentationUtilities.build_report(
+                            processing_procedure=processing_procedure,
+                            task_records=task_records,
+                            run_start_time=run_start_time,
+                            run_end_time=monotonic(),
+                            backend=pool_session.backend,
+                            number_of_cpu_cores=pool_session.number_of_cpu_cores
+                        ),
+                        report_file_path=instrumentation_report_file_path,
+                        enable_logger=enable_logger
+                    )
+
+            if task_size_procedure is not None:
+                processing_procedure_outputs = [
+                    processing_procedure_output
+                    for _, processing_procedure_output in sorted(processing_procedure_outputs, key=itemgetter(0))
+                ]
 
             return processing_procedure_outputs
 
@@ -127,3 +737,473 @@ class MultiprocessingUtilities:
                 ).exception(exception_handle)
 
             raise
+
+    @staticmethod
+    def stream(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            chunk_size: Union[int, str] = 1,
+            maximum_number_of_pending_chunks: int = None,
+            preserve_order: bool = True,
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            pool_session: MultiprocessingPoolSession = None,
+            enable_logger: bool = False
+    ) -> Iterator[Any]:
+        """
+        Run a processing procedure for each primary input argument, and yield the outputs as soon as they are available.
+        The primary input arguments are consumed lazily, so at most the maximum number of pending chunks is held in
+        memory at any time.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the tasks: 'processes', 'threads', 'serial' or
+                            'distributed'.
+        :parameter chunk_size: The number of primary input arguments that should be sent to a worker process at once,
+                               or 'auto' to determine it from the number of primary input arguments and the observed
+                               task duration.
+        :parameter maximum_number_of_pending_chunks: The maximum number of chunks that can be submitted to the worker
+                                                     processes without their outputs being consumed. If None, twice the
+                                                     number of CPU cores is used.
+        :parameter preserve_order: The indicator whether the outputs should be yielded in the order of the primary
+                                   input arguments instead of the order of completion.
+        :parameter initializer: The procedure that should be run once per worker process before any tasks. It is
+                                ignored if an existing multiprocessing pool session is reused.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the run.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        try:
+            with MultiprocessingUtilities.open_pool_session(
+                number_of_cpu_cores=number_of_cpu_cores,
+                backend=backend,
+                initializer=initializer,
+                initializer_arguments=initializer_arguments,
+                pool_session=pool_session,
+                enable_logger=enable_logger
+            ) as pool_session:
+                if pool_session.worker_pool is None:
+                    for primary_input_argument in primary_input_arguments:
+                        yield processing_procedure(primary_input_argument)
+
+                else:
+                    if maximum_number_of_pending_chunks is None or maximum_number_of_pending_chunks < 1:
+                        maximum_number_of_pending_chunks = 2 * pool_session.number_of_cpu_cores
+
+                    chunk_size, calibration_outputs, primary_input_arguments = \
+                        MultiprocessingUtilities._determine_chunk_size(
+                            processing_procedure=processing_procedure,
+                            primary_input_arguments=primary_input_arguments,
+                            chunk_size=chunk_size,
+                            pool_session=pool_session,
+                            enable_logger=enable_logger
+                        )
+
+                    yield from calibration_outputs
+
+                    if preserve_order:
+                        pending_chunk_outputs = deque()
+
+                        for primary_input_argument_chunk in MultiprocessingUtilities._split_into_chunks(
+                            primary_input_arguments=primary_input_arguments,
+                            chunk_size=chunk_size
+                        ):
+                            if len(pending_chunk_outputs) >= maximum_number_of_pending_chunks:
+                                yield from pending_chunk_outputs.popleft().get()
+
+                            pending_chunk_outputs.append(
+                                pool_session.worker_pool.apply_async(
+                                    MultiprocessingUtilities._process_chunk,
+                                    (processing_procedure, primary_input_argument_chunk)
+                                )
+                            )
+
+                        while len(pending_chunk_outputs) > 0:
+                            yield from pending_chunk_outputs.popleft().get()
+
+                    else:
+                        completed_chunk_outputs, number_of_pending_chunks = Queue(), 0
+
+                        for primary_input_argument_chunk in MultiprocessingUtilities._split_into_chunks(
+                            primary_input_arguments=primary_input_arguments,
+                            chunk_size=chunk_size
+                        ):
+                            if number_of_pending_chunks >= maximum_number_of_pending_chunks:
+                                yield from MultiprocessingUtilities._get_completed_chunk_outputs(
+                                    completed_chunk_outputs=completed_chunk_outputs
+                                )
+
+                                number_of_pending_chunks -= 1
+
+                            pool_session.worker_pool.apply_async(
+                                MultiprocessingUtilities._process_chunk,
+                                (processing_procedure, primary_input_argument_chunk),
+                                callback=completed_chunk_outputs.put,
+                                error_callback=completed_chunk_outputs.put
+                            )
+
+                            number_of_pending_chunks += 1
+
+                        while number_of_pending_chunks > 0:
+                            yield from MultiprocessingUtilities._get_completed_chunk_outputs(
+                                completed_chunk_outputs=completed_chunk_outputs
+                            )
+
+                            number_of_pending_chunks -= 1
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingUtilities.stream".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def run_with_fault_tolerance(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            task_timeout: float = None,
+            maximum_number_of_retries: int = 0,
+            quarantine_file_path: str = None,
+            raise_failed_tasks: bool = False,
+            task_size_procedure: Callable[[Any], float] = None,
+            memory_budget: int = None,
+            task_memory_procedure: Callable[[Any], float] = None,
+            description_message: str = None,
+            progress_sink: str = "none",
+            progress_callback: Callable[[int, Optional[int]], Any] = None,
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            pool_session: MultiprocessingPoolSession = None,
+            instrumentation_report_file_path: str = None,
+            enable_logger: bool = False
+    ) -> Optional[List[Any]]:
+        """
+        Run a processing procedure for each primary input argument, and tolerate failing, hanging and crashing tasks.
+        If a task exceeds the timeout or its worker process dies, the worker processes are restarted and the unaffected
+        pending tasks are resubmitted. Each failing task is retried up to the maximum number of retries, after which its
+        last exception is raised or its primary input argument is appended to the quarantine file and its output is
+        None.
+
+        If a memory budget is specified, a task is submitted only if the estimated memory footprint of the pending tasks
+        or, if larger, the measured resident set size of the worker processes, together with the estimated memory
+        footprint of the task fits within the budget. A task is always submitted if no other task is pending.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto'.
+        :parameter backend: The indicator of the backend that should run the tasks: 'processes', 'threads', 'serial' or
+                            'distributed'.
+        :parameter task_timeout: The maximum number of seconds a single task is allowed to run. The tasks are timed out
+                                 only if the 'processes' backend is utilized with multiple CPU cores.
+        :parameter maximum_number_of_retries: The maximum number of retries of a failing task.
+        :parameter quarantine_file_path: The path to the file where the repeatedly failing primary input arguments
+                                         should be stored. If None, they are only discarded.
+        :parameter raise_failed_tasks: The indicator whether the last exception of a task that failed after all retries
+                                       should be raised instead of quarantining its primary input argument.
+        :parameter task_size_procedure: The procedure that estimates the size of the task of a primary input argument,
+                                        such as the 'os.path.getsize' function for file paths. If specified, the tasks
+                                        are submitted from the largest to the smallest.
+        :parameter memory_budget: The maximum number of bytes the pending tasks are allowed to occupy. If None, the
+                                  tasks are not throttled by their memory footprint.
+        :parameter task_memory_procedure: The procedure that estimates the memory footprint of the task of a primary
+                                          input argument in bytes, such as the compressed size of an input file times
+                                          an expansion factor. If None, only the measured resident set size of the
+                                          worker processes is considered.
+        :parameter description_message: The progress description message.
+        :parameter progress_sink: The indicator of the sink of the progress reports: 'tqdm', 'log', 'callback', 'none'
+                                  or 'auto'. The completed and the quarantined primary input arguments are reported.
+        :parameter progress_callback: The procedure that receives the number of completed and total primary input
+                                      arguments. It is required for the 'callback' progress sink.
+        :parameter initializer: The procedure that should be run once per worker process before any tasks. It is
+                                ignored if an existing multiprocessing pool session is reused.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter pool_session: The multiprocessing pool session that should be reused. If None, a session utilizing
+                                 the number of CPU cores is opened for the duration of the run.
+        :parameter instrumentation_report_file_path: The path to the JSON Lines file to which the instrumentation
+                                                     report of the run should be appended. If None, the tasks are not
+                                                     instrumented. For the processes backend, the output of every 16th
+                                                     task of each worker process is pickled once more to measure the
+                                                     duration and size of its serialization, which adds that overhead
+                                                     to the sampled tasks.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The output of the processing procedure for each primary input argument, or None for each quarantined
+                  primary input argument.
+        """
+
+        try:
+            primary_input_arguments, run_start_time = list(primary_input_arguments), monotonic()
+
+            task_records = list() if instrumentation_report_file_path is not None else None
+
+            processing_procedure_outputs = [None] * len(primary_input_arguments)
+            numbers_of_failed_attempts = [0] * len(primary_input_arguments)
+            task_memory_footprints = [
+                task_memory_procedure(primary_input_argument) for primary_input_argument in primary_input_arguments
+            ] if memory_budget is not None and task_memory_procedure is not None else [0] * len(primary_input_arguments)
+            unsubmitted_task_indices = deque(MultiprocessingUtilities._get_largest_first_task_indices(
+                primary_input_arguments=primary_input_arguments,
+                task_size_procedure=task_size_procedure
+            ))
+
+            def get_task_argument(task_index: int) -> Any:
+                if task_records is None:
+                    return primary_input_arguments[task_index]
+
+                return monotonic(), primary_input_arguments[task_index]
+
+            def handle_completed_task(task_index: int, task_output: Any) -> None:
+                if task_records is not None:
+                    task_output, task_record = task_output
+
+                    task_record["receipt_time"] = monotonic()
+
+                    task_records.append(task_record)
+
+                processing_procedure_outputs[task_index] = task_output
+
+                progress_reporter.update()
+
+            def handle_failed_task(task_index: int, exception_handle: BaseException) -> None:
+                numbers_of_failed_attempts[task_index] += 1
+
+                if numbers_of_failed_attempts[task_index] <= maximum_number_of_retries:
+                    unsubmitted_task_indices.append(task_index)
+
+                elif raise_failed_tasks:
+                    raise exception_handle
+
+                else:
+                    if enable_logger:
+                        getLogger(__name__).warning(
+                            "Quarantined the primary input argument {0} after {1} failed attempts: {2!r}".format(
+                                task_index,
+                                numbers_of_failed_attempts[task_index],
+                                exception_handle
+                            )
+                        )
+
+                    MultiprocessingUtilities._quarantine_primary_input_argument(
+                        primary_input_argument=primary_input_arguments[task_index],
+                        number_of_attempts=numbers_of_failed_attempts[task_index],
+                        exception_handle=exception_handle,
+                        quarantine_file_path=quarantine_file_path
+                    )
+
+                    progress_reporter.update()
+
+            with MultiprocessingUtilities.open_pool_session(
+                number_of_cpu_cores=number_of_cpu_cores,
+                backend=backend,
+                initializer=initializer,
+                initializer_arguments=initializer_arguments,
+                pool_session=pool_session,
+                enable_logger=enable_logger
+            ) as pool_session, ProgressReporter(
+                total=len(primary_input_arguments),
+                description="{0} (CPU Cores: {1})".format(
+                    description_message if description_message is not None else "Running",
+                    pool_session.number_of_cpu_cores
+                ),
+                sink=progress_sink,
+                callback=progress_callback
+            ) as progress_reporter:
+                task_procedure = partial(
+                    MultiprocessingInstrumentationUtilities.run_instrumented_task,
+                    processing_procedure,
+                    pool_session.backend == "processes" and pool_session.number_of_cpu_cores > 1
+                ) if task_records is not None else processing_procedure
+
+                if pool_session.worker_pool is None:
+                    while len(unsubmitted_task_indices) > 0:
+                        task_index = unsubmitted_task_indices.popleft()
+
+                        try:
+                            task_output = task_procedure(get_task_argument(task_index))
+
+                        except Exception as exception_handle:
+                            handle_failed_task(task_index, exception_handle)
+
+                        else:
+                            handle_completed_task(task_index, task_output)
+
+                pending_tasks, started_tasks, task_submission_identifiers = dict(), dict(), count()
+                task_completion_queue = Queue()
+
+                def notify_task_completion(submission_identifier: int, _: Any) -> None:
+                    task_completion_queue.put((submission_identifier, None, None))
+
+                while len(unsubmitted_task_indices) > 0 or len(pending_tasks) > 0:
+                    while len(unsubmitted_task_indices) > 0 and len(pending_tasks) < pool_session.number_of_cpu_cores:
+                        if memory_budget is not None and len(pending_tasks) > 0 and max(
+                            sum(task_memory_footprints[task_index] for task_index in pending_tasks.keys()),
+                            MultiprocessingUtilities._get_worker_resident_set_size(
+                                pool_session=pool_session
+                            )
+                        ) + task_memory_footprints[unsubmitted_task_indices[0]] > memory_budget:
+                            break
+
+                        task_index = unsubmitted_task_indices.popleft()
+                        submission_identifier = next(task_submission_identifiers)
+
+                        pending_tasks[task_index] = (submission_identifier, pool_session.worker_pool.apply_async(
+                            MultiprocessingUtilities._run_monitored_task,
+                            (task_procedure, submission_identifier, get_task_argument(task_index)),
+                            callback=partial(notify_task_completion, submission_identifier),
+                            error_callback=partial(notify_task_completion, submission_identifier)
+                        ))
+
+                    submitted_task_indices = {
+                        submission_identifier: task_index
+                        for task_index, (submission_identifier, _) in pending_tasks.items()
+                    }
+
+                    task_start_events, task_completion_events = list(), list()
+
+                    try:
+                        task_completion_events.append(task_completion_queue.get(
+                            timeout=MultiprocessingUtilities.TASK_MONITORING_INTERVAL
+                        ))
+
+                        while True:
+                            task_completion_events.append(task_completion_queue.get_nowait())
+
+                    except Empty:
+                        pass
+
+                    while pool_session.task_notification_queue is not None and \
+                            not pool_session.task_notification_queue.empty():
+                        task_start_events.append(pool_session.task_notification_queue.get())
+
+                    for submission_identifier, worker_process_id, task_start_time in chain(
+                        task_start_events,
+                        task_completion_events
+                    ):
+                        if submission_identifier not in submitted_task_indices.keys():
+                            continue
+
+                        task_index = submitted_task_indices[submission_identifier]
+
+                        if worker_process_id is not None:
+                            started_tasks[task_index] = (worker_process_id, task_start_time)
+
+                            continue
+
+                        _, pending_task = pending_tasks.pop(task_index)
+                        del submitted_task_indices[submission_identifier]
+                        started_tasks.pop(task_index, None)
+
+                        pending_task.wait()
+
+                        try:
+                            task_output = pending_task.get()
+
+                        except Exception as exception_handle:
+                            handle_failed_task(task_index, exception_handle)
+
+                        else:
+                            handle_completed_task(task_index, task_output)
+
+                    alive_worker_process_ids = {worker_process.pid for worker_process in active_children()}
+                    failed_tasks = dict()
+
+                    for task_index, (worker_process_id, task_start_time) in started_tasks.items():
+                        if worker_process_id not in alive_worker_process_ids:
+                            failed_tasks[task_index] = RuntimeError(
+                                "The worker process {0} died while running the task.".format(worker_process_id)
+                            )
+
+                        elif task_timeout is not None and monotonic() - task_start_time > task_timeout:
+                            failed_tasks[task_index] = TimeoutError(
+                                "The task exceeded the timeout of {0} seconds.".format(task_timeout)
+                            )
+
+                    if len(failed_tasks) > 0:
+                        if enable_logger:
+                            getLogger(__name__).warning(
+                                "Restarting the worker processes after {0} timed out or crashed task(s).".format(
+                                    len(failed_tasks)
+                                )
+                            )
+
+                        pool_session.restart()
+
+                        unsubmitted_task_indices.extendleft(
+                            task_index for task_index in pending_tasks.keys() if task_index not in failed_tasks.keys()
+                        )
+
+                        pending_tasks.clear()
+                        started_tasks.clear()
+
+                        for task_index, exception_handle in failed_tasks.items():
+                            handle_failed_task(task_index, exception_handle)
+
+                if task_records is not None:
+                    MultiprocessingInstrumentationUtilities.write_report(
+                        report=MultiprocessingInstrumentationUtilities.build_report(
+                            processing_procedure=processing_procedure,
+                            task_records=task_records,
+                            run_start_time=run_start_time,
+                            run_end_time=monotonic(),
+                            backend=pool_session.backend,
+                            number_of_cpu_cores=pool_session.number_of_cpu_cores
+                        ),
+                        report_file_path=instrumentation_report_file_path,
+                        enable_logger=enable_logger
+                    )
+
+            return processing_procedure_outputs
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingUtilities.run_with_fault_tolerance".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    @staticmethod
+    def read_quarantine_file(
+            quarantine_file_path: str,
+            enable_logger: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the primary input arguments stored in a quarantine file.
+
+        :parameter quarantine_file_path: The path to the quarantine file.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+
+        :returns: The quarantined primary input arguments, the numbers of failed attempts and the last exceptions.
+        """
+
+        try:
+            quarantine_file_records = list()
+
+            with open(quarantine_file_path, "rb") as quarantine_file_handle:
+                while True:
+                    try:
+                        quarantine_file_records.append(
+                            load(quarantine_file_handle)
+                        )
+
+                    except EOFError:
+                        return quarantine_file_records
+
+        except Exception as exception_handle:
+            if enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingUtilities.read_quarantine_file".format(__name__)
+                ).exception(exception_handle)
+
+            raise
@@ -0,0 +1,545 @@
+""" The 'chemical_reaction_data.utilities.multiprocessing' package 'pool_session' module. """
+
+from importlib import import_module
+from logging import getLogger
+from math import ceil
+from multiprocessing import cpu_count, get_all_start_methods, get_context, SimpleQueue
+from multiprocessing.pool import Pool as PoolType, ThreadPool
+from threading import local
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from .distributed import DistributedWorkerPool
+
+
+class MultiprocessingPoolSession:
+    """ The multiprocessing pool session class. """
+
+    SUPPORTED_BACKENDS = ("processes", "threads", "serial", "distributed")
+
+    SUPPORTED_START_METHODS = ("fork", "spawn", "forkserver")
+
+    CGROUP_V2_CPU_QUOTA_FILE_PATH = "/sys/fs/cgroup/cpu.max"
+
+    CGROUP_V1_CPU_QUOTA_FILE_PATHS = (
+        ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+        ("/sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us"),
+    )
+
+    _worker_storage = local()
+
+    def __init__(
+            self,
+            number_of_cpu_cores: Union[int, str] = 1,
+            backend: str = "processes",
+            initializer: Callable[..., Any] = None,
+            initializer_arguments: Tuple[Any, ...] = (),
+            start_method: str = None,
+            preloaded_module_names: Tuple[str, ...] = (),
+            distributed_address: Tuple[str, int] = ("127.0.0.1", 0),
+            distributed_authentication_key: bytes = None,
+            number_of_local_distributed_workers: int = None,
+            enable_logger: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized, or 'auto' for the number of CPU
+                                        cores available to the current process. For the 'processes' backend, it is
+                                        limited to the number of available CPU cores. For the 'threads' backend, it is
+                                        the number of worker threads, which is allowed to exceed the number of CPU
+                                        cores for I/O-bound workloads. For the 'distributed' backend, it is the
+                                        expected total number of worker processes across all hosts.
+        :parameter backend: The indicator of the backend that should run the tasks: 'processes' for a process pool,
+                            'threads' for a thread pool, 'serial' for the current thread, or 'distributed' for worker
+                            processes on any host that connect to the session over TCP.
+        :parameter initializer: The procedure that should be run once per worker before any tasks. It receives the
+                                per-worker state dictionary followed by the initializer arguments.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter start_method: The method that should be utilized to start the worker processes: 'fork', 'spawn' or
+                                 'forkserver'. If None, the default method of the platform is utilized.
+        :parameter preloaded_module_names: The names of the modules that should be imported before any tasks. For the
+                                           'forkserver' start method, they are imported once by the server process, so
+                                           the worker processes start with them already imported. Otherwise, they are
+                                           imported by each worker. Modules that cannot be imported are skipped.
+        :parameter distributed_address: The host name and the port on which the 'distributed' backend should listen
+                                        for worker processes. If the port is 0, a free port is chosen.
+        :parameter distributed_authentication_key: The key that the worker processes of the 'distributed' backend have
+                                                   to present. If None, a random key is generated, which is only
+                                                   allowed if the 'distributed' backend listens on a loopback address.
+                                                   The key is available as the 'distributed_authentication_key'
+                                                   property.
+        :parameter number_of_local_distributed_workers: The number of worker processes of the 'distributed' backend
+                                                        that should be started on the current host. If None, the number
+                                                        of CPU cores is utilized.
+        :parameter enable_logger: The indicator whether the logger should be enabled.
+        """
+
+        if backend not in MultiprocessingPoolSession.SUPPORTED_BACKENDS:
+            raise ValueError(
+                "The backend '{0}' is not supported. Supported backends are: {1}.".format(
+                    backend,
+                    ", ".join("'{0}'".format(supported_backend)
+                              for supported_backend in MultiprocessingPoolSession.SUPPORTED_BACKENDS)
+                )
+            )
+
+        if start_method is not None and start_method not in MultiprocessingPoolSession.SUPPORTED_START_METHODS:
+            raise ValueError(
+                "The start method '{0}' is not supported. Supported start methods are: {1}.".format(
+                    start_method,
+                    ", ".join("'{0}'".format(supported_start_method)
+                              for supported_start_method in MultiprocessingPoolSession.SUPPORTED_START_METHODS)
+                )
+            )
+
+        if start_method is not None and start_method not in get_all_start_methods():
+            raise ValueError(
+                "The start method '{0}' is not available on this platform.".format(start_method)
+            )
+
+        if number_of_cpu_cores == "auto":
+            number_of_cpu_cores = MultiprocessingPoolSession.get_number_of_available_cpu_cores()
+
+            if enable_logger:
+                getLogger(__name__).info(
+                    "Detected {0} available CPU core(s) for the '{1}' backend.".format(number_of_cpu_cores, backend)
+                )
+
+        elif not isinstance(number_of_cpu_cores, int):
+            raise ValueError(
+                "The number of CPU cores '{0}' is neither an integer nor 'auto'.".format(number_of_cpu_cores)
+            )
+
+        if backend == "serial":
+            self.__number_of_cpu_cores = 1
+
+        elif backend in ("threads", "distributed"):
+            self.__number_of_cpu_cores = max(number_of_cpu_cores, 1)
+
+        else:
+            self.__number_of_cpu_cores = min(
+                max(number_of_cpu_cores, 1),
+                MultiprocessingPoolSession.get_number_of_available_cpu_cores()
+            )
+
+            if enable_logger and self.__number_of_cpu_cores != number_of_cpu_cores:
+                getLogger(__name__).warning(
+                    "The number of CPU cores {0} was limited to the {1} available CPU core(s).".format(
+                        number_of_cpu_cores,
+                        self.__number_of_cpu_cores
+                    )
+                )
+
+        self.__backend = backend
+        self.__initializer = initializer
+        self.__initializer_arguments = tuple(initializer_arguments)
+        self.__start_method = start_method
+        self.__preloaded_module_names = tuple(preloaded_module_names)
+        self.__distributed_address = tuple(distributed_address)
+        if backend == "distributed" and distributed_authentication_key is None:
+            if not DistributedWorkerPool._is_loopback_host(distributed_address[0]):
+                raise ValueError(
+                    "An explicit authentication key is required for the 'distributed' backend to listen on the "
+                    "non-loopback address '{0}'.".format(distributed_address[0])
+                )
+
+            distributed_authentication_key = DistributedWorkerPool.generate_authentication_key()
+
+        self.__distributed_authentication_key = distributed_authentication_key
+        self.__number_of_local_distributed_workers = number_of_local_distributed_workers \
+            if number_of_local_distributed_workers is not None else self.__number_of_cpu_cores
+        self.__enable_logger = enable_logger
+
+        self.__worker_pool = None
+        self.__task_notification_queue = None
+        self.__is_open = False
+
+    @staticmethod
+    def _read_cgroup_cpu_limit() -> Optional[float]:
+        """
+        Read the CPU bandwidth limit of the control group (cgroup) of the current process.
+
+        :returns: The CPU bandwidth limit in CPU cores, or None if the control group does not limit it.
+        """
+
+        try:
+            with open(MultiprocessingPoolSession.CGROUP_V2_CPU_QUOTA_FILE_PATH, "r") as file_handle:
+                cpu_quota, cpu_period = file_handle.read().split()[:2]
+
+            if cpu_quota != "max" and int(cpu_period) > 0:
+                return int(cpu_quota) / int(cpu_period)
+
+            return None
+
+        except (OSError, ValueError):
+            pass
+
+        for cpu_quota_file_path, cpu_period_file_path in MultiprocessingPoolSession.CGROUP_V1_CPU_QUOTA_FILE_PATHS:
+            try:
+                with open(cpu_quota_file_path, "r") as file_handle:
+                    cpu_quota = int(file_handle.read().strip())
+
+                with open(cpu_period_file_path, "r") as file_handle:
+                    cpu_period = int(file_handle.read().strip())
+
+                if cpu_quota > 0 and cpu_period > 0:
+                    return cpu_quota / cpu_period
+
+                return None
+
+            except (OSError, ValueError):
+                continue
+
+        return None
+
+    @staticmethod
+    def get_number_of_available_cpu_cores() -> int:
+        """
+        Get the number of CPU cores available to the current process, respecting both the CPU affinity mask and the
+        CPU bandwidth limit of the control group (cgroup) of the current process.
+
+        :returns: The number of CPU cores available to the current process.
+        """
+
+        try:
+            from os import sched_getaffinity
+
+            number_of_available_cpu_cores = len(sched_getaffinity(0))
+
+        except (ImportError, OSError):
+            number_of_available_cpu_cores = cpu_count()
+
+        cgroup_cpu_limit = MultiprocessingPoolSession._read_cgroup_cpu_limit()
+
+        if cgroup_cpu_limit is not None:
+            number_of_available_cpu_cores = min(number_of_available_cpu_cores, ceil(cgroup_cpu_limit))
+
+        return max(number_of_available_cpu_cores, 1)
+
+    @staticmethod
+    def _import_modules(
+            module_names: Tuple[str, ...]
+    ) -> None:
+        """
+        Import modules, and skip the ones that cannot be imported.
+
+        :parameter module_names: The names of the modules.
+        """
+
+        for module_name in module_names:
+            try:
+                import_module(module_name)
+
+            except ImportError:
+                continue
+
+    @staticmethod
+    def _initialize_worker(
+            initializer: Optional[Callable[..., Any]],
+            initializer_arguments: Tuple[Any, ...],
+            task_notification_queue: Optional[SimpleQueue] = None,
+            preloaded_module_names: Tuple[str, ...] = ()
+    ) -> None:
+        """
+        Import the preloaded modules, reset the per-worker state, and run the initializer.
+
+        :parameter initializer: The procedure that should be run once per worker.
+        :parameter initializer_arguments: The arguments of the initializer.
+        :parameter task_notification_queue: The queue through which the worker process notifies the session about the
+                                            tasks it starts.
+        :parameter preloaded_module_names: The names of the modules that should be imported before any tasks.
+        """
+
+        MultiprocessingPoolSession._import_modules(preloaded_module_names)
+
+        MultiprocessingPoolSession._worker_storage.worker_state = dict()
+        MultiprocessingPoolSession._worker_storage.task_notification_queue = task_notification_queue
+
+        if initializer is not None:
+            initializer(MultiprocessingPoolSession._worker_storage.worker_state, *initializer_arguments)
+
+    @staticmethod
+    def get_worker_state() -> Dict[str, Any]:
+        """
+        Get the state of the current worker process or thread. If the tasks are run serially, the state of the current
+        thread is returned.
+
+        :returns: The state of the current worker process or thread.
+        """
+
+        if not hasattr(MultiprocessingPoolSession._worker_storage, "worker_state"):
+            MultiprocessingPoolSession._worker_storage.worker_state = dict()
+
+        return MultiprocessingPoolSession._worker_storage.worker_state
+
+    @staticmethod
+    def get_task_notification_queue() -> Optional[SimpleQueue]:
+        """
+        Get the task notification queue of the current worker process.
+
+        :returns: The task notification queue of the current worker process, or None if it does not exist.
+        """
+
+        return getattr(MultiprocessingPoolSession._worker_storage, "task_notification_queue", None)
+
+    @property
+    def number_of_cpu_cores(
+            self
+    ) -> int:
+        """
+        Get the number of CPU cores utilized by the session.
+
+        :returns: The number of CPU cores utilized by the session.
+        """
+
+        return self.__number_of_cpu_cores
+
+    @property
+    def backend(
+            self
+    ) -> str:
+        """
+        Get the backend of the session.
+
+        :returns: The backend of the session.
+        """
+
+        return self.__backend
+
+    @property
+    def start_method(
+            self
+    ) -> Optional[str]:
+        """
+        Get the method utilized to start the worker processes of the session.
+
+        :returns: The method utilized to start the worker processes, or None for the default method of the platform.
+        """
+
+        return self.__start_method
+
+    @property
+    def distributed_address(
+            self
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Get the host name and the port on which the 'distributed' backend listens for worker processes.
+
+        :returns: The host name and the port on which the 'distributed' backend listens, or None if the session does
+                  not utilize an open 'distributed' backend.
+        """
+
+        return self.__worker_pool.address if isinstance(self.__worker_pool, DistributedWorkerPool) else None
+
+    @property
+    def distributed_authentication_key(
+            self
+    ) -> Optional[bytes]:
+        """
+        Get the key that the worker processes of the 'distributed' backend have to present.
+
+        :returns: The key that the worker processes of the 'distributed' backend have to present, or None if the
+                  session does not utilize the 'distributed' backend.
+        """
+
+        return self.__distributed_authentication_key
+
+    @property
+    def task_notification_queue(
+            self
+    ) -> Optional[SimpleQueue]:
+        """
+        Get the queue through which the worker processes notify the session about the tasks they start.
+
+        :returns: The task notification queue of the session, or None if the 'processes' backend is not utilized.
+        """
+
+        return self.__task_notification_queue
+
+    @property
+    def is_open(
+            self
+    ) -> bool:
+        """
+        Get the indicator whether the session is open.
+
+        :returns: The indicator whether the session is open.
+        """
+
+        return self.__is_open
+
+    @property
+    def worker_pool(
+            self
+    ) -> Optional[PoolType]:
+        """
+        Get the process or thread pool of the session, and open the session if it is not open yet.
+
+        :returns: The process or thread pool of the session, or None if the tasks are run serially.
+        """
+
+        if not self.__is_open:
+            self.open()
+
+        return self.__worker_pool
+
+    def open(
+            self
+    ) -> "MultiprocessingPoolSession":
+        """
+        Open the session by starting the worker processes or threads.
+
+        :returns: The opened session.
+        """
+
+        try:
+            if not self.__is_open:
+                if self.__backend == "processes" and self.__number_of_cpu_cores > 1:
+                    multiprocessing_context = get_context(self.__start_method)
+
+                    if multiprocessing_context.get_start_method() == "forkserver":
+                        multiprocessing_context.set_forkserver_preload(list(self.__preloaded_module_names))
+
+                    self.__task_notification_queue = multiprocessing_context.SimpleQueue()
+
+                    self.__worker_pool = multiprocessing_context.Pool(
+                        processes=self.__number_of_cpu_cores,
+                        initializer=MultiprocessingPoolSession._initialize_worker,
+                        initargs=(
+                            self.__initializer,
+                            self.__initializer_arguments,
+                            self.__task_notification_queue,
+                            self.__preloaded_module_names
+                        )
+                    )
+
+                elif self.__backend == "threads" and self.__number_of_cpu_cores > 1:
+                    self.__worker_pool = ThreadPool(
+                        processes=self.__number_of_cpu_cores,
+                        initializer=MultiprocessingPoolSession._initialize_worker,
+                        initargs=(self.__initializer, self.__initializer_arguments, None, self.__preloaded_module_names)
+                    )
+
+                elif self.__backend == "distributed":
+                    self.__worker_pool = DistributedWorkerPool(
+                        address=self.__distributed_address,
+                        authentication_key=self.__distributed_authentication_key,
+                        number_of_local_workers=self.__number_of_local_distributed_workers,
+                        initializer=MultiprocessingPoolSession._initialize_worker,
+                        initializer_arguments=(
+                            self.__initializer,
+                            self.__initializer_arguments,
+                            None,
+                            self.__preloaded_module_names
+                        ),
+                        start_method=self.__start_method,
+                        enable_logger=self.__enable_logger
+                    )
+
+                else:
+                    MultiprocessingPoolSession._initialize_worker(
+                        initializer=self.__initializer,
+                        initializer_arguments=self.__initializer_arguments,
+                        preloaded_module_names=self.__preloaded_module_names
+                    )
+
+                self.__is_open = True
+
+            return self
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingPoolSession.open".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def close(
+            self
+    ) -> None:
+        """ Close the session by waiting for the pending tasks and stopping the worker processes or threads. """
+
+        try:
+            if self.__worker_pool is not None:
+                self.__worker_pool.close()
+                self.__worker_pool.join()
+
+            self.__worker_pool = None
+            self.__task_notification_queue = None
+            self.__is_open = False
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingPoolSession.close".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def terminate(
+            self
+    ) -> None:
+        """ Terminate the session by stopping the worker processes or threads without waiting for the pending tasks. """
+
+        try:
+            if self.__worker_pool is not None:
+                self.__worker_pool.terminate()
+                self.__worker_pool.join()
+
+            self.__worker_pool = None
+            self.__task_notification_queue = None
+            self.__is_open = False
+
+        except Exception as exception_handle:
+            if self.__enable_logger:
+                getLogger(
+                    "{0}.MultiprocessingPoolSession.terminate".format(__name__)
+                ).exception(exception_handle)
+
+            raise
+
+    def restart(
+            self
+    ) -> "MultiprocessingPoolSession":
+        """
+        Restart the session by terminating the worker processes or threads and starting new ones.
+
+        :returns: The restarted session.
+        """
+
+        self.terminate()
+
+        return self.open()
+
+    def __enter__(
+            self
+    ) -> "MultiprocessingPoolSession":
+        """
+        Enter the runtime context of the session.
+
+        :returns: The opened session.
+        """
+
+        return self.open()
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception_value: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """
+        Exit the runtime context of the session.
+
+        :parameter exception_type: The type of the exception raised within the runtime context.
+        :parameter exception_value: The exception raised within the runtime context.
+        :parameter exception_traceback: The traceback of the exception raised within the runtime context.
+        """
+
+        if exception_type is None:
+            self.close()
+
+        else:
+            self.terminate()
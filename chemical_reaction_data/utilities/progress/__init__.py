@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_data.utilities.progress' package initialization module. """
+
+from .progress_reporter import ProgressReporter
@@ -0,0 +1,232 @@
+""" The 'chemical_reaction_data.utilities.progress' package 'progress_reporter' module. """
+
+from logging import getLogger, INFO
+from sys import stderr
+from time import monotonic
+from tqdm import tqdm
+from types import TracebackType
+from typing import Any, Callable, Iterable, Iterator, Optional, Type
+
+
+class ProgressReporter:
+    """
+    The progress reporter class. The completed items are counted locally and reported to the sink in batches, at most
+    once per minimum interval, so the overhead per item is constant regardless of the number of items. The elapsed
+    time is checked about ten times per minimum interval, based on the rate of the items since the last report.
+    """
+
+    SUPPORTED_SINKS = ("auto", "tqdm", "log", "callback", "none")
+
+    DEFAULT_BATCH_SIZE = 64
+
+    NUMBER_OF_CHECKS_PER_INTERVAL = 10
+
+    def __init__(
+            self,
+            total: int = None,
+            description: str = None,
+            sink: str = "auto",
+            callback: Callable[[int, Optional[int]], Any] = None,
+            minimum_interval: float = 1.0,
+            batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter total: The total number of items, or None if it is unknown.
+        :parameter description: The description of the progress.
+        :parameter sink: The indicator of the sink of the progress reports: 'tqdm' for a progress bar, 'log' for
+                         structured log lines, 'callback' for the callback, 'none' for no reports, or 'auto' for
+                         structured log lines if the standard error stream is not a terminal and the log lines would
+                         be emitted by a handler, and a progress bar otherwise.
+        :parameter callback: The procedure that receives the number of completed items and the total number of items.
+                             It is required for the 'callback' sink.
+        :parameter minimum_interval: The minimum number of seconds between two consecutive progress reports.
+        :parameter batch_size: The maximum number of items after which the elapsed time since the last progress
+                               report is checked.
+        """
+
+        if sink not in ProgressReporter.SUPPORTED_SINKS:
+            raise ValueError(
+                "The progress sink '{0}' is not supported. Supported sinks are: {1}.".format(
+                    sink,
+                    ", ".join("'{0}'".format(supported_sink) for supported_sink in ProgressReporter.SUPPORTED_SINKS)
+                )
+            )
+
+        if sink == "callback" and callback is None:
+            raise ValueError(
+                "The 'callback' progress sink requires a callback."
+            )
+
+        if sink == "auto":
+            sink = "log" if not stderr.isatty() and getLogger(__name__).isEnabledFor(INFO) and \
+                getLogger(__name__).hasHandlers() else "tqdm"
+
+        self.__total = total
+        self.__description = description if description is not None else "Running"
+        self.__sink = sink
+        self.__callback = callback
+        self.__minimum_interval = minimum_interval
+        self.__batch_size = max(batch_size, 1)
+        self.__check_size = 1
+        self.__number_of_unchecked_items = 0
+
+        self.__number_of_completed_items = 0
+        self.__number_of_reported_items = 0
+        self.__number_of_pending_items = 0
+        self.__start_time = monotonic()
+        self.__last_report_time = self.__start_time
+
+        self.__progress_bar = tqdm(
+            total=total,
+            ascii=True,
+            ncols=150,
+            desc=self.__description,
+            mininterval=minimum_interval
+        ) if sink == "tqdm" else None
+
+    @property
+    def number_of_completed_items(
+            self
+    ) -> int:
+        """
+        Get the number of completed items.
+
+        :returns: The number of completed items.
+        """
+
+        return self.__number_of_completed_items + self.__number_of_pending_items
+
+    def __report(
+            self
+    ) -> None:
+        """ Report the completed items to the sink. """
+
+        report_time = monotonic()
+
+        if report_time > self.__last_report_time:
+            self.__check_size = min(max(int(
+                self.__number_of_pending_items * self.__minimum_interval /
+                (report_time - self.__last_report_time) / ProgressReporter.NUMBER_OF_CHECKS_PER_INTERVAL
+            ), 1), self.__batch_size)
+
+        self.__number_of_completed_items += self.__number_of_pending_items
+        self.__number_of_pending_items = 0
+        self.__last_report_time = report_time
+
+        if self.__number_of_completed_items == self.__number_of_reported_items:
+            return
+
+        if self.__sink == "tqdm":
+            self.__progress_bar.update(self.__number_of_completed_items - self.__number_of_reported_items)
+
+        elif self.__sink == "log":
+            elapsed_time = self.__last_report_time - self.__start_time
+
+            getLogger(__name__).info(
+                "{0}: {1}/{2} item(s) completed ({3}) in {4:.1f} seconds at {5:.1f} item(s) per second.".format(
+                    self.__description,
+                    self.__number_of_completed_items,
+                    self.__total if self.__total is not None else "?",
+                    "{0:.1f}%".format(100.0 * self.__number_of_completed_items / self.__total)
+                    if self.__total else "unknown percentage",
+                    elapsed_time,
+                    self.__number_of_completed_items / elapsed_time if elapsed_time > 0.0 else 0.0
+                )
+            )
+
+        elif self.__sink == "callback":
+            self.__callback(self.__number_of_completed_items, self.__total)
+
+        self.__number_of_reported_items = self.__number_of_completed_items
+
+    def __count(
+            self,
+            number_of_items: int
+    ) -> None:
+        """
+        Count completed items, and check the elapsed time once enough items are counted since the last check. The
+        number of items between two checks is doubled after each check that does not report, up to the batch size.
+
+        :parameter number_of_items: The number of completed items.
+        """
+
+        self.__number_of_pending_items += number_of_items
+        self.__number_of_unchecked_items += number_of_items
+
+        if self.__number_of_unchecked_items >= self.__check_size:
+            self.__number_of_unchecked_items = 0
+
+            if monotonic() - self.__last_report_time >= self.__minimum_interval:
+                self.__report()
+
+            else:
+                self.__check_size = min(self.__check_size * 2, self.__batch_size)
+
+    def update(
+            self,
+            number_of_items: int = 1
+    ) -> None:
+        """
+        Count completed items, and report them to the sink if the minimum interval has elapsed.
+
+        :parameter number_of_items: The number of completed items.
+        """
+
+        self.__count(number_of_items)
+
+    def track(
+            self,
+            iterable: Iterable[Any]
+    ) -> Iterator[Any]:
+        """
+        Lazily yield the items of an iterable, and count each yielded item as completed.
+
+        :parameter iterable: The iterable.
+
+        :returns: The items of the iterable.
+        """
+
+        for item in iterable:
+            yield item
+
+            self.__count(1)
+
+    def close(
+            self
+    ) -> None:
+        """ Report the remaining completed items to the sink, and close the sink. """
+
+        self.__report()
+
+        if self.__progress_bar is not None:
+            self.__progress_bar.close()
+            self.__progress_bar = None
+
+    def __enter__(
+            self
+    ) -> "ProgressReporter":
+        """
+        Enter the runtime context of the progress reporter.
+
+        :returns: The progress reporter.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception_value: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """
+        Exit the runtime context of the progress reporter.
+
+        :parameter exception_type: The type of the exception raised within the runtime context.
+        :parameter exception_value: The exception raised within the runtime context.
+        :parameter exception_traceback: The traceback of the exception raised within the runtime context.
+        """
+
+        self.close()
@@ -34,9 +34,38 @@ def parse_script_arguments() -> Namespace:
     argument_parser.add_argument(
         "-c",
         "--number_of_cpu_cores",
-        type=int,
+        type=lambda number_of_cpu_cores: number_of_cpu_cores if number_of_cpu_cores == "auto" else int(
+            number_of_cpu_cores
+        ),
         default=1,
-        help="The number of CPU cores that should be utilized."
+        help="The number of CPU cores that should be utilized, or 'auto' for the number of CPU cores available to the "
+             "current process."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--backend",
+        type=str,
+        choices=[
+            "processes",
+            "threads",
+            "serial"
+        ],
+        default="processes",
+        help="The indicator of the backend that should run the parsing tasks."
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--start_method",
+        type=str,
+        choices=[
+            "fork",
+            "spawn",
+            "forkserver"
+        ],
+        default=None,
+        help="The method that should be utilized to start the worker processes."
     )
 
     argument_parser.add_argument(
@@ -68,5 +97,7 @@ if __name__ == "__main__":
             extracted_data_directory_path=join(script_arguments.output_directory_path, "ord-data-main", "data"),
             output_directory_path=script_arguments.output_directory_path,
             number_of_cpu_cores=script_arguments.number_of_cpu_cores,
+            backend=script_arguments.backend,
+            start_method=script_arguments.start_method,
             enable_logger=script_arguments.enable_logger
         )
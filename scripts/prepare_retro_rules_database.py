@@ -36,6 +36,13 @@ def parse_script_arguments() -> Namespace:
         help="The path to the directory where the prepared data should be stored."
     )
 
+    argument_parser.add_argument(
+        "-x",
+        "--stream_extraction",
+        action=BooleanOptionalAction,
+        help="The indicator whether the archive file should be extracted while it is downloaded, without storing it."
+    )
+
     argument_parser.add_argument(
         "-l",
         "--enable_logger",
@@ -50,16 +57,23 @@ if __name__ == "__main__":
     script_arguments = parse_script_arguments()
 
     if script_arguments.version == "v_rr01_rp2_hs_2018_duigou_et_al":
-        RetroRulesDatabaseDownloadUtilities.download_rr01_rp2_hs_2018_duigou_et_al(
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
-
-        RetroRulesDatabaseExtractionUtilities.extract_rr01_rp2_hs_2018_duigou_et_al(
-            downloaded_data_directory_path=script_arguments.output_directory_path,
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
+        if script_arguments.stream_extraction:
+            RetroRulesDatabaseDownloadUtilities.download_and_extract_rr01_rp2_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+        else:
+            RetroRulesDatabaseDownloadUtilities.download_rr01_rp2_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+            RetroRulesDatabaseExtractionUtilities.extract_rr01_rp2_hs_2018_duigou_et_al(
+                downloaded_data_directory_path=script_arguments.output_directory_path,
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
 
         RetroRulesDatabasePreparationUtilities.prepare_rr01_rp2_hs_2018_duigou_et_al(
             extracted_data_directory_path=join(script_arguments.output_directory_path, "retrorules_rr01_rp2"),
@@ -68,16 +82,23 @@ if __name__ == "__main__":
         )
 
     elif script_arguments.version == "v_rr02_rp2_hs_2018_duigou_et_al":
-        RetroRulesDatabaseDownloadUtilities.download_rr02_rp2_hs_2018_duigou_et_al(
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
-
-        RetroRulesDatabaseExtractionUtilities.extract_rr02_rp2_hs_2018_duigou_et_al(
-            downloaded_data_directory_path=script_arguments.output_directory_path,
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
+        if script_arguments.stream_extraction:
+            RetroRulesDatabaseDownloadUtilities.download_and_extract_rr02_rp2_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+        else:
+            RetroRulesDatabaseDownloadUtilities.download_rr02_rp2_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+            RetroRulesDatabaseExtractionUtilities.extract_rr02_rp2_hs_2018_duigou_et_al(
+                downloaded_data_directory_path=script_arguments.output_directory_path,
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
 
         RetroRulesDatabasePreparationUtilities.prepare_rr02_rp2_hs_2018_duigou_et_al(
             extracted_data_directory_path=join(script_arguments.output_directory_path, "retrorules_rr02_rp2_hs"),
@@ -86,16 +107,23 @@ if __name__ == "__main__":
         )
 
     elif script_arguments.version == "v_rr02_rp3_hs_2018_duigou_et_al":
-        RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_hs_2018_duigou_et_al(
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
-
-        RetroRulesDatabaseExtractionUtilities.extract_rr02_rp3_hs_2018_duigou_et_al(
-            downloaded_data_directory_path=script_arguments.output_directory_path,
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
+        if script_arguments.stream_extraction:
+            RetroRulesDatabaseDownloadUtilities.download_and_extract_rr02_rp3_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+        else:
+            RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_hs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+            RetroRulesDatabaseExtractionUtilities.extract_rr02_rp3_hs_2018_duigou_et_al(
+                downloaded_data_directory_path=script_arguments.output_directory_path,
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
 
         RetroRulesDatabasePreparationUtilities.prepare_rr02_rp3_hs_2018_duigou_et_al(
             extracted_data_directory_path=join(script_arguments.output_directory_path, "retrorules_rr02_rp3_hs"),
@@ -104,16 +132,23 @@ if __name__ == "__main__":
         )
 
     elif script_arguments.version == "v_rr02_rp3_nohs_2018_duigou_et_al":
-        RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_nohs_2018_duigou_et_al(
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
-
-        RetroRulesDatabaseExtractionUtilities.extract_rr02_rp3_nohs_2018_duigou_et_al(
-            downloaded_data_directory_path=script_arguments.output_directory_path,
-            output_directory_path=script_arguments.output_directory_path,
-            enable_logger=script_arguments.enable_logger
-        )
+        if script_arguments.stream_extraction:
+            RetroRulesDatabaseDownloadUtilities.download_and_extract_rr02_rp3_nohs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+        else:
+            RetroRulesDatabaseDownloadUtilities.download_rr02_rp3_nohs_2018_duigou_et_al(
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
+
+            RetroRulesDatabaseExtractionUtilities.extract_rr02_rp3_nohs_2018_duigou_et_al(
+                downloaded_data_directory_path=script_arguments.output_directory_path,
+                output_directory_path=script_arguments.output_directory_path,
+                enable_logger=script_arguments.enable_logger
+            )
 
         RetroRulesDatabasePreparationUtilities.prepare_rr02_rp3_nohs_2018_duigou_et_al(
             extracted_data_directory_path=join(script_arguments.output_directory_path, "retrorules_rr02_rp3_nohs"),
@@ -40,9 +40,38 @@ def parse_script_arguments() -> Namespace:
     argument_parser.add_argument(
         "-c",
         "--number_of_cpu_cores",
-        type=int,
+        type=lambda number_of_cpu_cores: number_of_cpu_cores if number_of_cpu_cores == "auto" else int(
+            number_of_cpu_cores
+        ),
         default=1,
-        help="The number of CPU cores that should be utilized."
+        help="The number of CPU cores that should be utilized, or 'auto' for the number of CPU cores available to the "
+             "current process."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--backend",
+        type=str,
+        choices=[
+            "processes",
+            "threads",
+            "serial"
+        ],
+        default="processes",
+        help="The indicator of the backend that should run the parsing tasks."
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--start_method",
+        type=str,
+        choices=[
+            "fork",
+            "spawn",
+            "forkserver"
+        ],
+        default=None,
+        help="The method that should be utilized to start the worker processes."
     )
 
     argument_parser.add_argument(
@@ -127,6 +156,9 @@ if __name__ == "__main__":
         UsptoDatasetPreparationUtils.prepare_1976_2016_2017_lowe(
             extracted_data_directory_path=script_arguments.output_directory_path,
             output_directory_path=script_arguments.output_directory_path,
+            number_of_cpu_cores=script_arguments.number_of_cpu_cores,
+            backend=script_arguments.backend,
+            start_method=script_arguments.start_method,
             enable_logger=script_arguments.enable_logger
         )
 
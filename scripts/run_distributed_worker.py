@@ -0,0 +1,66 @@
+""" The 'scripts' directory 'run_distributed_worker' script. """
+
+from argparse import ArgumentParser, Namespace
+from multiprocessing import Process
+
+from chemical_reaction_data.utilities.multiprocessing import DistributedWorkerPool
+
+
+def parse_script_arguments() -> Namespace:
+    """ Parse the 'run_distributed_worker' script arguments. """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-a",
+        "--host_name",
+        type=str,
+        required=True,
+        help="The host name on which the coordinator listens."
+    )
+
+    argument_parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        required=True,
+        help="The port on which the coordinator listens."
+    )
+
+    argument_parser.add_argument(
+        "-k",
+        "--authentication_key",
+        type=str,
+        required=True,
+        help="The key that should be presented to the coordinator."
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--number_of_worker_processes",
+        type=int,
+        default=1,
+        help="The number of worker processes that should be started on the current host."
+    )
+
+    return argument_parser.parse_args()
+
+
+if __name__ == "__main__":
+    script_arguments = parse_script_arguments()
+
+    worker_processes = [
+        Process(
+            target=DistributedWorkerPool.run_worker,
+            args=(
+                (script_arguments.host_name, script_arguments.port),
+                script_arguments.authentication_key.encode("utf-8")
+            )
+        ) for _ in range(max(script_arguments.number_of_worker_processes, 1))
+    ]
+
+    for worker_process in worker_processes:
+        worker_process.start()
+
+    for worker_process in worker_processes:
+        worker_process.join()
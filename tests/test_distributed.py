@@ -0,0 +1,176 @@
+""" The 'tests' package 'test_distributed' module. """
+
+from functools import partial
+from os import _exit, getpid
+from time import sleep
+from typing import Iterator
+
+from os.path import exists
+
+from pytest import fixture, raises
+
+from chemical_reaction_data.utilities.multiprocessing import DistributedWorkerPool, MultiprocessingPoolSession
+
+
+def square(
+        primary_input_argument: int
+) -> int:
+    """
+    Square a number after a short delay, so the chunks are spread over the worker processes.
+
+    :parameter primary_input_argument: The number.
+
+    :returns: The square of the number.
+    """
+
+    sleep(0.005)
+
+    return primary_input_argument ** 2
+
+
+def square_or_exit_once(
+        marker_file_path: str,
+        primary_input_argument: int
+) -> int:
+    """
+    Square a number, but kill the current worker process in the middle of its chunk the first time the number 7 is
+    processed.
+
+    :parameter marker_file_path: The path to the file that marks that a worker process was already killed.
+    :parameter primary_input_argument: The number.
+
+    :returns: The square of the number.
+    """
+
+    if primary_input_argument == 7 and not exists(marker_file_path):
+        with open(marker_file_path, "w") as file_handle:
+            file_handle.write(str(getpid()))
+
+        _exit(1)
+
+    return square(primary_input_argument)
+
+
+@fixture
+def distributed_worker_pool() -> Iterator[DistributedWorkerPool]:
+    """
+    Get a distributed worker pool with three local worker processes and short heartbeats.
+
+    :returns: The distributed worker pool.
+    """
+
+    worker_pool = DistributedWorkerPool(
+        number_of_local_workers=3,
+        heartbeat_interval=0.2,
+        heartbeat_timeout=1.0,
+        maximum_number_of_pending_chunks=4,
+        result_timeout=30.0
+    )
+
+    yield worker_pool
+
+    worker_pool.terminate()
+
+
+def test_map_and_imap_preserve_order(
+        distributed_worker_pool: DistributedWorkerPool
+) -> None:
+    """ Test that the 'map' and 'imap' methods return the outputs in the order of the arguments. """
+
+    expected_outputs = [primary_input_argument ** 2 for primary_input_argument in range(50)]
+
+    assert distributed_worker_pool.map(square, range(50), chunksize=3) == expected_outputs
+    assert list(distributed_worker_pool.imap(square, range(50), chunksize=4)) == expected_outputs
+    assert list(distributed_worker_pool.imap(square, iter(range(50)))) == expected_outputs
+
+
+def test_imap_unordered_returns_every_output(
+        distributed_worker_pool: DistributedWorkerPool
+) -> None:
+    """ Test that the 'imap_unordered' method returns every output exactly once. """
+
+    assert sorted(distributed_worker_pool.imap_unordered(square, range(50), chunksize=3)) == [
+        primary_input_argument ** 2 for primary_input_argument in range(50)
+    ]
+
+
+def test_apply_async_and_join(
+        distributed_worker_pool: DistributedWorkerPool
+) -> None:
+    """ Test that the 'apply_async' method runs the callbacks and that the 'join' method waits for the tasks. """
+
+    callback_outputs = list()
+
+    async_result = distributed_worker_pool.apply_async(square, (9, ), callback=callback_outputs.append)
+
+    assert async_result.get(timeout=30.0) == 81
+    assert async_result.successful()
+    assert callback_outputs == [81]
+
+    distributed_worker_pool.close()
+    distributed_worker_pool.join()
+
+
+def test_chunk_of_killed_worker_is_requeued(
+        distributed_worker_pool: DistributedWorkerPool,
+        tmp_path
+) -> None:
+    """ Test that the chunk of a worker process that is killed in the middle of the chunk is run by another one. """
+
+    marker_file_path = str(tmp_path / "killed_worker_process_id")
+
+    assert distributed_worker_pool.map(
+        partial(square_or_exit_once, marker_file_path),
+        range(30),
+        chunksize=4
+    ) == [primary_input_argument ** 2 for primary_input_argument in range(30)]
+
+    assert exists(marker_file_path)
+
+
+def test_result_timeout_without_worker_processes() -> None:
+    """ Test that waiting for the outputs raises a 'TimeoutError' if there are no worker processes. """
+
+    worker_pool = DistributedWorkerPool(
+        number_of_local_workers=0,
+        heartbeat_interval=0.2,
+        result_timeout=1.0
+    )
+
+    try:
+        with raises(TimeoutError):
+            worker_pool.map(square, range(4))
+
+        with raises(TimeoutError):
+            list(worker_pool.imap_unordered(square, range(4)))
+
+    finally:
+        worker_pool.terminate()
+
+
+def test_authentication_key() -> None:
+    """ Test that a key is generated only for loopback addresses, and that the generated key is exposed. """
+
+    with raises(ValueError):
+        DistributedWorkerPool(
+            address=("0.0.0.0", 0)
+        )
+
+    with raises(ValueError):
+        MultiprocessingPoolSession(
+            backend="distributed",
+            distributed_address=("0.0.0.0", 0)
+        )
+
+    pool_session = MultiprocessingPoolSession(
+        number_of_cpu_cores=2,
+        backend="distributed",
+        number_of_local_distributed_workers=2
+    )
+
+    with pool_session:
+        assert isinstance(pool_session.distributed_authentication_key, bytes)
+        assert pool_session.worker_pool.authentication_key == pool_session.distributed_authentication_key
+        assert pool_session.worker_pool.map(square, range(10)) == [
+            primary_input_argument ** 2 for primary_input_argument in range(10)
+        ]
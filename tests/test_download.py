@@ -0,0 +1,618 @@
+""" The 'tests' package 'test_download' module. """
+
+from functools import partial
+from hashlib import sha256
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from os import listdir, stat, urandom, utime
+from re import match
+from stat import S_IMODE
+from threading import Thread
+from time import sleep, time
+from typing import Any, Callable, Iterator, List, Tuple
+
+from os.path import dirname, getsize, join
+
+from pytest import fixture, raises
+
+from chemical_reaction_data.utilities.download import (
+    DownloadCache,
+    DownloadMirror,
+    DownloadSession,
+    DownloadUtilities,
+)
+
+
+class RecordingRequestHandler(SimpleHTTPRequestHandler):
+    """
+    The recording request handler class, which serves the files of a directory, ignores the 'Range' header like the
+    'http.server' module does, and records the method, the 'Range' header and the status code of every request.
+    """
+
+    recorded_requests = None
+
+    def send_response(
+            self,
+            code: int,
+            message: str = None
+    ) -> None:
+        """
+        Record the request, and send the response status line.
+
+        :parameter code: The status code of the response.
+        :parameter message: The reason phrase of the response.
+        """
+
+        self.recorded_requests.append((self.command, self.headers.get("Range"), code))
+
+        super().send_response(code, message)
+
+    def log_message(
+            self,
+            *arguments: Any
+    ) -> None:
+        """ Suppress the access log. """
+
+
+class RangeRequestHandler(RecordingRequestHandler):
+    """ The range request handler class, which honours a single 'bytes=<first>-<last>' range with a 206 response. """
+
+    def do_GET(
+            self
+    ) -> None:
+        """ Serve a file, or the requested byte range of it. """
+
+        range_match = match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range") or "")
+        file_path = self.translate_path(self.path)
+
+        if range_match is None:
+            return super().do_GET()
+
+        with open(file_path, "rb") as file_handle:
+            contents = file_handle.read()
+
+        range_start = int(range_match.group(1))
+        range_end = min(int(range_match.group(2)) if range_match.group(2) else len(contents) - 1, len(contents) - 1)
+
+        if range_start >= len(contents):
+            self.send_response(416)
+            self.send_header("Content-Range", "bytes */{0}".format(len(contents)))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+            return
+
+        self.send_response(206)
+        self.send_header("Content-Range", "bytes {0}-{1}/{2}".format(range_start, range_end, len(contents)))
+        self.send_header("Content-Length", str(range_end - range_start + 1))
+        self.end_headers()
+
+        self.wfile.write(contents[range_start:range_end + 1])
+
+
+class TruncatingRangeRequestHandler(RangeRequestHandler):
+    """
+    The truncating range request handler class, which closes the connection after a third of the body of the first
+    response whose byte range does not start at the first byte, or of the first response without a byte range.
+    """
+
+    truncated_responses = None
+
+    def end_headers(
+            self
+    ) -> None:
+        """ Send the end of the headers, and truncate the body of the first eligible response. """
+
+        super().end_headers()
+
+        if len(self.truncated_responses) == 0 and (self.headers.get("Range") is None or not match(
+            r"bytes=0-", self.headers.get("Range")
+        )):
+            self.truncated_responses.append(self.path)
+
+            write = self.wfile.write
+
+            def write_truncated(data: bytes) -> None:
+                write(data[:len(data) // 3])
+
+                self.close_connection = True
+
+                raise ConnectionResetError()
+
+            self.wfile.write = write_truncated
+
+    def handle_one_request(
+            self
+    ) -> None:
+        """ Handle a request, and close the connection if its response was truncated. """
+
+        try:
+            super().handle_one_request()
+
+        except ConnectionResetError:
+            self.close_connection = True
+
+
+class StallingRequestHandler(RecordingRequestHandler):
+    """ The stalling request handler class, which waits for a second before it responds to a request. """
+
+    def do_GET(
+            self
+    ) -> None:
+        """ Serve a file after a second. """
+
+        sleep(1.0)
+
+        super().do_GET()
+
+
+def serve_directory(
+        directory_path: str,
+        request_handler_class: type
+) -> Tuple[ThreadingHTTPServer, List[Tuple[str, str, int]]]:
+    """
+    Serve a directory over HTTP on a free local port from a background thread.
+
+    :parameter directory_path: The path to the directory.
+    :parameter request_handler_class: The class of the request handler.
+
+    :returns: The server and the list of its recorded requests.
+    """
+
+    recorded_requests = list()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        partial(
+            type("Handler", (request_handler_class, ), {
+                "recorded_requests": recorded_requests,
+                "truncated_responses": list(),
+            }),
+            directory=directory_path
+        )
+    )
+
+    Thread(
+        target=server.serve_forever,
+        daemon=True
+    ).start()
+
+    return server, recorded_requests
+
+
+@fixture
+def served_directory(
+        tmp_path
+) -> Iterator[Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]]]:
+    """
+    Get the procedure that serves a new directory with a request handler class.
+
+    :returns: The procedure that returns the path to the served directory, its base URL string and the list of its
+              recorded requests.
+    """
+
+    servers = list()
+
+    def serve(request_handler_class: type) -> Tuple[str, str, List[Tuple[str, str, int]]]:
+        directory_path = tmp_path / "served_{0}".format(len(servers))
+        directory_path.mkdir()
+
+        server, recorded_requests = serve_directory(str(directory_path), request_handler_class)
+        servers.append(server)
+
+        return str(directory_path), "http://127.0.0.1:{0}".format(server.server_address[1]), recorded_requests
+
+    yield serve
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def write_random_file(
+        file_path: str,
+        size: int
+) -> bytes:
+    """
+    Write random contents to a file.
+
+    :parameter file_path: The path to the file.
+    :parameter size: The size of the contents in bytes.
+
+    :returns: The contents.
+    """
+
+    contents = urandom(size)
+
+    with open(file_path, "wb") as file_handle:
+        file_handle.write(contents)
+
+    return contents
+
+
+def download(
+        url: str,
+        output_file_path: str,
+        **keyword_arguments: Any
+) -> bytes:
+    """
+    Download the contents from a URL string with small byte ranges and no retry delay.
+
+    :parameter url: The URL string.
+    :parameter output_file_path: The path to the output file.
+
+    :returns: The contents of the output file.
+    """
+
+    DownloadUtilities._download_file(
+        url=url,
+        output_file_path=output_file_path,
+        number_of_segments=keyword_arguments.pop("number_of_segments", 4),
+        minimum_segment_size=keyword_arguments.pop("minimum_segment_size", 16 * 1024),
+        retry_backoff_factor=0.0,
+        **keyword_arguments
+    )
+
+    with open(output_file_path, "rb") as file_handle:
+        return file_handle.read()
+
+
+def test_segmented_download_with_range_support(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that the byte ranges are downloaded in parallel if the server answers them with 206 responses. """
+
+    directory_path, base_url, recorded_requests = served_directory(RangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 100 * 1024 + 17)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        expected_size=len(contents)
+    ) == contents
+
+    assert len(recorded_requests) == 4
+    assert all(range_header is not None and status == 206 for _, range_header, status in recorded_requests)
+    assert sorted(listdir(str(tmp_path))) == ["file.bin", "served_0"]
+
+
+def test_download_without_range_support(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that the contents are downloaded as a single stream if the server ignores the byte range request. """
+
+    directory_path, base_url, recorded_requests = served_directory(RecordingRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 100 * 1024 + 17)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        expected_size=len(contents)
+    ) == contents
+
+    assert recorded_requests == [("GET", "bytes=0-16383", 200)]
+
+
+def test_download_smaller_than_one_segment(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that contents smaller than one byte range are downloaded from the response of the first byte range. """
+
+    directory_path, base_url, recorded_requests = served_directory(RangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 1000)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin")
+    ) == contents
+
+    assert recorded_requests == [("GET", "bytes=0-16383", 206)]
+    assert getsize(str(tmp_path / "file.bin")) == 1000
+
+
+def test_download_with_expected_hash_is_single_stream(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that contents with an expected hash are hashed as a single stream, and rejected if the hash differs. """
+
+    directory_path, base_url, recorded_requests = served_directory(RangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 100 * 1024)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        expected_hash="sha256:" + sha256(contents).hexdigest()
+    ) == contents
+
+    assert recorded_requests == [("GET", None, 200)]
+
+    with raises(ValueError):
+        download(
+            url=base_url + "/file.bin",
+            output_file_path=str(tmp_path / "other_file.bin"),
+            expected_hash="sha256:" + sha256(b"").hexdigest()
+        )
+
+    assert sorted(listdir(str(tmp_path))) == ["file.bin", "served_0"]
+
+
+def test_download_resumes_partial_file(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that the download continues from the bytes stored in the partial file. """
+
+    directory_path, base_url, recorded_requests = served_directory(RangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 50 * 1024)
+
+    with open(str(tmp_path / "file.bin.part"), "wb") as file_handle:
+        file_handle.write(contents[:12345])
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        expected_hash="sha256:" + sha256(contents).hexdigest()
+    ) == contents
+
+    assert recorded_requests == [("GET", "bytes=12345-", 206)]
+
+
+def test_download_restarts_after_range_not_satisfiable(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that a partial file that is not shorter than the contents is discarded after a 416 response. """
+
+    directory_path, base_url, recorded_requests = served_directory(RangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 1000)
+
+    with open(str(tmp_path / "file.bin.part"), "wb") as file_handle:
+        file_handle.write(urandom(1000))
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        expected_size=1000
+    ) == contents
+
+    assert recorded_requests == [("GET", "bytes=1000-", 416), ("GET", None, 200)]
+
+
+def test_download_retries_truncated_stream(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that a truncated single stream is retried from the bytes already stored in the partial file. """
+
+    directory_path, base_url, recorded_requests = served_directory(TruncatingRangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 90 * 1024)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        number_of_segments=1,
+        expected_hash="sha256:" + sha256(contents).hexdigest()
+    ) == contents
+
+    assert len(recorded_requests) == 2
+    assert recorded_requests[0] == ("GET", None, 200)
+    assert recorded_requests[1][2] == 206 and match(r"bytes=[1-9]\d*-$", recorded_requests[1][1])
+
+
+def test_segmented_download_retries_truncated_byte_range(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that only the remaining bytes of a truncated byte range are requested again from the segment state. """
+
+    directory_path, base_url, recorded_requests = served_directory(TruncatingRangeRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 100 * 1024)
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin")
+    ) == contents
+
+    byte_ranges = [
+        tuple(int(byte) for byte in match(r"bytes=(\d+)-(\d+)$", range_header).groups())
+        for _, range_header, _ in recorded_requests
+    ]
+
+    assert len(byte_ranges) == 5
+    assert any(
+        byte_range[0] < byte_ranges[-1][0] and byte_range[1] == byte_ranges[-1][1]
+        for byte_range in byte_ranges[:-1]
+    )
+    assert sorted(listdir(str(tmp_path))) == ["file.bin", "served_0"]
+
+
+class EntityTagRequestHandler(RecordingRequestHandler):
+    """
+    The entity tag request handler class, which sends the SHA-256 hash of a file as its 'ETag' header, answers a
+    matching 'If-None-Match' header with a 304 response, and sends no 'Last-Modified' header.
+    """
+
+    def do_GET(
+            self
+    ) -> None:
+        """ Serve a file, or confirm that the cached contents are still valid. """
+
+        with open(self.translate_path(self.path), "rb") as file_handle:
+            contents = file_handle.read()
+
+        etag = "\"{0}\"".format(sha256(contents).hexdigest())
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(contents)))
+        self.end_headers()
+
+        self.wfile.write(contents)
+
+
+def test_download_cache_revalidation_with_last_modified(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """
+    Test that the cached contents are restored after a 304 response to the conditional 'If-Modified-Since' request, and
+    that modified contents are downloaded with a single request.
+    """
+
+    directory_path, base_url, recorded_requests = served_directory(RecordingRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 10 * 1024)
+    download_cache = DownloadCache(str(tmp_path / "cache"))
+
+    for output_directory_name in ("first", "second"):
+        (tmp_path / output_directory_name).mkdir()
+
+        assert download(
+            url=base_url + "/file.bin",
+            output_file_path=str(tmp_path / output_directory_name / "file.bin"),
+            download_cache=download_cache
+        ) == contents
+
+    assert [status for _, _, status in recorded_requests] == [200, 304]
+
+    modified_contents = write_random_file(join(directory_path, "file.bin"), 10 * 1024)
+    utime(join(directory_path, "file.bin"), (time() + 10, time() + 10))
+
+    assert download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "second" / "file.bin"),
+        download_cache=download_cache
+    ) == modified_contents
+
+    assert [(method, status) for method, _, status in recorded_requests] == [("GET", 200), ("GET", 304), ("GET", 200)]
+
+
+def test_download_cache_revalidation_with_etag(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that the cached contents are restored after a 304 response to the conditional 'If-None-Match' request. """
+
+    directory_path, base_url, recorded_requests = served_directory(EntityTagRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 10 * 1024)
+    download_cache = DownloadCache(str(tmp_path / "cache"))
+
+    for output_file_name in ("first.bin", "second.bin"):
+        assert download(
+            url=base_url + "/file.bin",
+            output_file_path=str(tmp_path / output_file_name),
+            download_cache=download_cache
+        ) == contents
+
+    assert recorded_requests == [("GET", "bytes=0-16383", 200), ("GET", "bytes=0-16383", 304)]
+    assert download_cache.get_entry(base_url + "/file.bin")["etag"] == "\"{0}\"".format(sha256(contents).hexdigest())
+
+
+def test_download_cache_without_server(
+        tmp_path
+) -> None:
+    """ Test that the cached contents are restored if the server cannot be reached. """
+
+    (tmp_path / "served").mkdir()
+
+    server, _ = serve_directory(str(tmp_path / "served"), RecordingRequestHandler)
+    url = "http://127.0.0.1:{0}/file.bin".format(server.server_address[1])
+    contents = write_random_file(str(tmp_path / "served" / "file.bin"), 1000)
+    download_cache = DownloadCache(str(tmp_path / "cache"))
+
+    download(
+        url=url,
+        output_file_path=str(tmp_path / "first.bin"),
+        download_cache=download_cache
+    )
+
+    server.shutdown()
+    server.server_close()
+
+    assert download(
+        url=url,
+        output_file_path=str(tmp_path / "second.bin"),
+        download_cache=download_cache,
+        maximum_number_of_retries=0
+    ) == contents
+
+    with raises(ConnectionError):
+        download(
+            url=url,
+            output_file_path=str(tmp_path / "third.bin"),
+            maximum_number_of_retries=0
+        )
+
+
+def test_download_cache_objects_are_read_only(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]],
+        tmp_path
+) -> None:
+    """ Test that the cached contents are read-only, and that the directories of the cache are shared. """
+
+    directory_path, base_url, _ = served_directory(RecordingRequestHandler)
+    contents = write_random_file(join(directory_path, "file.bin"), 1000)
+    download_cache = DownloadCache(str(tmp_path / "cache"))
+
+    download(
+        url=base_url + "/file.bin",
+        output_file_path=str(tmp_path / "file.bin"),
+        download_cache=download_cache
+    )
+
+    object_file_path = download_cache.get_object_file_path(sha256(contents).hexdigest())
+
+    assert S_IMODE(stat(object_file_path).st_mode) == DownloadCache.OBJECT_FILE_MODE
+    assert S_IMODE(stat(str(tmp_path / "cache" / "objects")).st_mode) == DownloadCache.DEFAULT_DIRECTORY_MODE
+    assert S_IMODE(stat(str(tmp_path / "cache" / "entries")).st_mode) == DownloadCache.DEFAULT_DIRECTORY_MODE
+    assert S_IMODE(stat(dirname(object_file_path)).st_mode) == DownloadCache.DEFAULT_DIRECTORY_MODE
+
+
+def test_download_session_read_timeout(
+        served_directory: Callable[[type], Tuple[str, str, List[Tuple[str, str, int]]]]
+) -> None:
+    """ Test that the download session times out by default, and that a server that stalls fails the request. """
+
+    directory_path, base_url, _ = served_directory(StallingRequestHandler)
+    write_random_file(join(directory_path, "file.bin"), 1000)
+
+    assert DownloadSession.DEFAULT_CONNECT_TIMEOUT is not None
+    assert DownloadSession.DEFAULT_READ_TIMEOUT is not None
+
+    with DownloadSession(read_timeout=0.2) as download_session:
+        with raises(TimeoutError):
+            download_session.request(base_url + "/file.bin")
+
+    with DownloadSession(read_timeout=5.0) as download_session:
+        with download_session.request(base_url + "/file.bin") as response:
+            assert len(response.read()) == 1000
+
+
+def test_download_mirror_files_are_not_hard_linked_by_default(
+        tmp_path
+) -> None:
+    """ Test that the mirrored files are cloned or copied, and only hard-linked if it is allowed. """
+
+    contents = write_random_file(str(tmp_path / "mirrored.bin"), 1000)
+
+    assert DownloadMirror.transfer_file(str(tmp_path / "mirrored.bin"), str(tmp_path / "copied.bin")) != "link"
+    assert stat(str(tmp_path / "mirrored.bin")).st_nlink == 1
+    assert stat(str(tmp_path / "mirrored.bin")).st_ino != stat(str(tmp_path / "copied.bin")).st_ino
+
+    with open(str(tmp_path / "copied.bin"), "rb") as file_handle:
+        assert file_handle.read() == contents
+
+    assert DownloadMirror.transfer_file(
+        str(tmp_path / "mirrored.bin"),
+        str(tmp_path / "linked.bin"),
+        allow_link=True
+    ) in ("clone", "link")